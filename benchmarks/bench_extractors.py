@@ -0,0 +1,145 @@
+"""
+Benchmark: per-extractor resolution (scraping/player.py), offline.
+
+Replays the fixtures of benchmarks/fixtures/extractors through a local HTTP
+stand-in (see replay.py) and reports, for every extractor, the number of
+HTTP requests, the wall-clock latency and the CPU time of a resolution
+(whole process: caller and extraction engine threads), and whether the
+expected stream URL was found.
+
+Usage:
+    python benchmarks/bench_extractors.py [--rounds N] [--only NAME ...]
+    python benchmarks/bench_extractors.py --record NAME URL [--referer URL]
+
+The second form resolves URL against the live host and saves the exchanges
+as benchmarks/fixtures/extractors/NAME.json.
+"""
+
+import argparse
+import importlib
+import json
+import statistics
+import sys
+import time
+
+from autoflix_cli.network import DNS_OPTIONS
+from autoflix_cli.scraping import player
+
+from replay import (
+    FIXTURES_DIR,
+    RecordingSession,
+    ReplayServer,
+    ReplaySession,
+    load_fixtures,
+)
+
+
+def apply_fixture(fixture: dict):
+    """Make the fixture's player known and set the module globals it needs."""
+    name = fixture["name"]
+    if fixture.get("config") and name not in player.players:
+        player.players[name] = fixture["config"]
+    for target, value in (fixture.get("patch") or {}).items():
+        module_name, attribute = target.split(":")
+        setattr(importlib.import_module(module_name), attribute, value)
+
+
+def run_fixture(fixture: dict, session: ReplaySession, rounds: int) -> dict:
+    apply_fixture(fixture)
+    latencies, cpu_times = [], []
+    result, error = None, None
+    for _ in range(rounds):
+        # Measure full resolutions, not the hop shortcuts of previous rounds
+        player.hop_memo.clear()
+        session.request_count = 0
+        start, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            result, _ = player.get_hls_link(
+                fixture["url"], fixture.get("headers") or {}, return_subs=True
+            )
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        latencies.append(time.perf_counter() - start)
+        cpu_times.append(time.process_time() - start_cpu)
+
+    return {
+        "name": fixture["name"],
+        "type": player.find_player(fixture["url"])[1].get("type", "?"),
+        "requests": session.request_count,
+        "latency": statistics.median(latencies),
+        "cpu": statistics.median(cpu_times),
+        "ok": result == fixture["expected"],
+        "error": error or (None if result == fixture["expected"] else f"got {result!r}"),
+    }
+
+
+def bench(rounds: int, only: list[str]) -> bool:
+    fixtures = load_fixtures()
+    if only:
+        fixtures = [f for f in fixtures if f["name"] in only]
+    if not fixtures:
+        print(f"No fixtures found in {FIXTURES_DIR}")
+        return False
+
+    with ReplayServer(fixtures) as server:
+        session = ReplaySession(server.base_url)
+        use_session_factory(lambda: session)
+        # Warm up the engine loop and the session outside the measurements
+        run_fixture(fixtures[0], session, 1)
+        rows = [run_fixture(f, session, rounds) for f in fixtures]
+
+    print(f"{'fixture':<14} {'type':<13} {'reqs':>4} {'latency':>10} {'cpu':>10}")
+    for row in rows:
+        status = "ok" if row["ok"] else f"FAIL ({row['error']})"
+        print(
+            f"{row['name']:<14} {row['type']:<13} {row['requests']:>4} "
+            f"{row['latency'] * 1000:8.2f}ms {row['cpu'] * 1000:8.2f}ms  {status}"
+        )
+    total_cpu = sum(r["cpu"] for r in rows)
+    print(f"{len(rows)} fixtures, {total_cpu * 1000:.1f} ms CPU per pass")
+    return all(r["ok"] for r in rows)
+
+
+def use_session_factory(factory):
+    player.engine.session_factory = factory
+    player.engine.reset()
+
+
+def record(name: str, url: str, referer: str = None):
+    session = RecordingSession(curl_options=DNS_OPTIONS)
+    use_session_factory(lambda: session)
+    headers = {"Referer": referer} if referer else {}
+    stream_url, _ = player.get_hls_link(url, headers, return_subs=True)
+
+    fixture = {
+        "name": player.find_player(url)[0] or name,
+        "url": url,
+        "headers": headers,
+        "expected": stream_url,
+        "responses": session.exchanges,
+    }
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    path = FIXTURES_DIR / f"{name}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, indent=4, ensure_ascii=False)
+    print(f"Recorded {len(session.exchanges)} exchange(s) -> {path}")
+    print(f"Stream: {stream_url}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--only", nargs="*", default=[])
+    parser.add_argument("--record", nargs=2, metavar=("NAME", "URL"))
+    parser.add_argument("--referer")
+    args = parser.parse_args()
+
+    if args.record:
+        record(*args.record, referer=args.referer)
+        return
+    if not bench(args.rounds, args.only):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
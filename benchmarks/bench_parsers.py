@@ -0,0 +1,284 @@
+"""
+Benchmark: HTML parser backends for the scrapers, offline.
+
+The scrapers parse provider pages with html5lib. This runs every fixture of
+benchmarks/fixtures/scrapers (one scraper call and the pages it downloads)
+with each available BeautifulSoup tree builder instead, and reports the CPU
+time of the call per parser. The objects extracted with each parser are
+compared field by field: the run fails if a parser yields anything
+different from the reference one (html5lib), since switching parsers must
+not change what the user sees.
+
+Usage:
+    python benchmarks/bench_parsers.py [--rounds N] [--parsers P ...] [--only NAME ...]
+    python benchmarks/bench_parsers.py --record NAME module:function ARG...
+
+The second form runs the call against the live site and saves the pages it
+downloaded as benchmarks/fixtures/scrapers/NAME.json.
+"""
+
+import argparse
+import importlib
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from autoflix_cli.scraping import utils
+
+from replay import exchange_key, load_fixtures
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "scrapers"
+REFERENCE_PARSER = "html5lib"
+CANDIDATE_PARSERS = ["html5lib", "lxml"]
+
+
+def available_parsers() -> list[str]:
+    """Candidate parsers BeautifulSoup can use in this environment."""
+    available = []
+    for name in CANDIDATE_PARSERS:
+        try:
+            BeautifulSoup("", name)
+        except FeatureNotFound:
+            continue
+        available.append(name)
+    return available
+
+
+def use_parser(module, parser: str):
+    """Make a scraper module (and the helpers it calls) build trees with parser."""
+
+    def make_soup(markup, features=None, *args, **kwargs):
+        return BeautifulSoup(markup, parser, *args, **kwargs)
+
+    module.BeautifulSoup = make_soup
+    utils.BeautifulSoup = make_soup
+
+
+class OfflineResponse:
+    def __init__(self, exchange: dict):
+        self.url = exchange["url"]
+        self.status_code = exchange.get("status", 200)
+        self.headers = exchange.get("headers") or {}
+        self.text = exchange.get("body", "")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code} for {self.url}")
+
+
+class OfflineSession:
+    """Stand-in for a scraper's curl_cffi Session, serving a fixture's pages."""
+
+    def __init__(self, exchanges: list[dict]):
+        self.exchanges = {exchange_key(e["method"], e["url"]): e for e in exchanges}
+
+    def request(self, method, url, **kwargs):
+        exchange = self.exchanges.get(exchange_key(method, url))
+        if exchange is None:
+            raise RuntimeError(f"No recorded response for {method} {url}")
+        return OfflineResponse(exchange)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+
+class RecordingSession:
+    """Wrapper of a live scraper Session keeping every page it downloads."""
+
+    def __init__(self, session):
+        self.session = session
+        self.exchanges = []
+
+    def _record(self, method, url, **kwargs):
+        response = getattr(self.session, method.lower())(url, **kwargs)
+        content_type = response.headers.get("Content-Type")
+        self.exchanges.append(
+            {
+                "method": method,
+                "url": url,
+                "status": response.status_code,
+                "headers": {"Content-Type": content_type} if content_type else {},
+                "body": response.text,
+            }
+        )
+        return response
+
+    def get(self, url, **kwargs):
+        return self._record("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._record("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self._record("HEAD", url, **kwargs)
+
+
+def resolve_call(reference: str):
+    module_name, function_name = reference.split(":")
+    module = importlib.import_module(module_name)
+    return module, getattr(module, function_name)
+
+
+def snapshot(value):
+    """Plain data (dicts, lists, strings) of an extracted object, for comparison."""
+    if isinstance(value, (list, tuple)):
+        return [snapshot(v) for v in value]
+    if isinstance(value, dict):
+        return {k: snapshot(v) for k, v in value.items()}
+    if hasattr(value, "__dict__"):
+        return {
+            "__type__": type(value).__name__,
+            **{k: snapshot(v) for k, v in vars(value).items()},
+        }
+    return value
+
+
+def run_fixture(fixture: dict, parser: str, rounds: int) -> dict:
+    module, function = resolve_call(fixture["call"])
+    for target, value in (fixture.get("patch") or {}).items():
+        module_name, attribute = target.split(":")
+        setattr(importlib.import_module(module_name), attribute, value)
+    module.scraper = OfflineSession(fixture["responses"])
+    use_parser(module, parser)
+
+    cpu_times = []
+    result, error = None, None
+    for _ in range(rounds):
+        start_cpu = time.process_time()
+        try:
+            result = snapshot(function(*fixture["args"]))
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        cpu_times.append(time.process_time() - start_cpu)
+
+    return {"cpu": statistics.median(cpu_times), "result": result, "error": error}
+
+
+def first_difference(a, b, path="") -> str | None:
+    """Location of the first difference between two snapshots."""
+    if type(a) is not type(b):
+        return f"{path or '.'}: {a!r} != {b!r}"
+    if isinstance(a, dict):
+        for key in sorted(set(a) | set(b)):
+            if key not in a or key not in b:
+                return f"{path}.{key}: missing on one side"
+            diff = first_difference(a[key], b[key], f"{path}.{key}")
+            if diff:
+                return diff
+        return None
+    if isinstance(a, list):
+        if len(a) != len(b):
+            return f"{path or '.'}: {len(a)} items != {len(b)} items"
+        for i, (x, y) in enumerate(zip(a, b)):
+            diff = first_difference(x, y, f"{path}[{i}]")
+            if diff:
+                return diff
+        return None
+    return None if a == b else f"{path or '.'}: {a!r} != {b!r}"
+
+
+def bench(rounds: int, parsers: list[str], only: list[str]) -> bool:
+    fixtures = load_fixtures(FIXTURES_DIR)
+    if only:
+        fixtures = [f for f in fixtures if f["name"] in only]
+    if not fixtures:
+        print("No fixtures, run benchmarks/make_scraper_fixtures.py first.")
+        return False
+
+    reference = REFERENCE_PARSER if REFERENCE_PARSER in parsers else parsers[0]
+    header = f"{'fixture':<24}" + "".join(f"{p + ' (ms)':>18}" for p in parsers)
+    print(header)
+    print("-" * len(header))
+
+    ok = True
+    totals = {p: 0.0 for p in parsers}
+    problems = []
+    for fixture in fixtures:
+        runs = {p: run_fixture(fixture, p, rounds) for p in parsers}
+        row = f"{fixture['name']:<24}"
+        for p in parsers:
+            totals[p] += runs[p]["cpu"]
+            row += f"{runs[p]['cpu'] * 1000:>18.2f}"
+        print(row)
+
+        for p in parsers:
+            if runs[p]["error"]:
+                problems.append(f"{fixture['name']} [{p}]: {runs[p]['error']}")
+            elif p != reference:
+                diff = first_difference(runs[reference]["result"], runs[p]["result"])
+                if diff:
+                    problems.append(f"{fixture['name']} [{p}] differs: {diff}")
+
+    print("-" * len(header))
+    print(f"{'total':<24}" + "".join(f"{totals[p] * 1000:>18.2f}" for p in parsers))
+    for p in parsers:
+        if p != reference and totals[p]:
+            print(f"{p}: {totals[reference] / totals[p]:.1f}x the speed of {reference}")
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+        ok = False
+    return ok
+
+
+def record(name: str, call: str, args: list[str]):
+    module, function = resolve_call(call)
+    if hasattr(module, "get_website_url"):
+        module.get_website_url()
+    session = RecordingSession(module.scraper)
+    module.scraper = session
+    function(*args)
+
+    data = {
+        "name": name,
+        "call": call,
+        "args": args,
+        "patch": {f"{module.__name__}:website_origin": module.website_origin},
+        "responses": session.exchanges,
+    }
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    path = FIXTURES_DIR / f"{name}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"Recorded {len(session.exchanges)} page(s) to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--parsers",
+        nargs="+",
+        help="Tree builders to compare (default: every available one)",
+    )
+    parser.add_argument("--only", nargs="+", default=[])
+    parser.add_argument("--record", nargs="+", metavar=("NAME", "CALL"))
+    args = parser.parse_args()
+
+    if args.record:
+        if len(args.record) < 2:
+            parser.error("--record needs NAME module:function [ARG...]")
+        record(args.record[0], args.record[1], args.record[2:])
+        return
+
+    parsers = args.parsers or available_parsers()
+    print(f"parsers: {', '.join(parsers)} (scrapers use {REFERENCE_PARSER})\n")
+    if not bench(args.rounds, parsers, args.only):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: player host dispatch (scraping/player.py).
+
+Compares the historical linear ``player_name in url.lower()`` scan with the
+compiled PlayerIndex over thousands of embed URLs, and checks that both
+return the same player for every URL.
+
+Usage:
+    python benchmarks/bench_player_dispatch.py [number_of_urls]
+"""
+
+import random
+import string
+import sys
+import time
+
+from autoflix_cli.defaults import DEFAULT_PLAYERS, DEFAULT_KAKAFLIX_PLAYERS
+from autoflix_cli.scraping.player_index import PlayerIndex
+
+
+def linear_find(players: dict, url: str):
+    for player_name in players:
+        if player_name in url.lower():
+            return player_name
+    return None
+
+
+def random_token(n):
+    return "".join(random.choices(string.ascii_lowercase + string.digits, k=n))
+
+
+def make_urls(players: dict, count: int) -> list[str]:
+    names = list(players)
+    urls = []
+    for i in range(count):
+        if i % 4 == 0:
+            # Unknown host (worst case for the linear scan)
+            host = f"{random_token(8)}.{random.choice(['com', 'net', 'to'])}"
+        else:
+            host = f"{random.choice(['', 'www.', 'cdn.'])}{random.choice(names)}.{random.choice(['com', 'to', 'sx'])}"
+        urls.append(f"https://{host}/e/{random_token(12)}?ref={random_token(6)}")
+    return urls
+
+
+def bench(name, fn, urls, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for url in urls:
+            fn(url)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<14} {best * 1000:8.2f} ms  ({best / len(urls) * 1e6:6.2f} us/url)")
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    random.seed(42)
+
+    # Simulate a bigger remote config on top of the defaults
+    players = dict(DEFAULT_PLAYERS)
+    for _ in range(200):
+        players[random_token(7)] = {"type": "default"}
+    players.update(DEFAULT_KAKAFLIX_PLAYERS)
+
+    urls = make_urls(players, count)
+
+    start = time.perf_counter()
+    index = PlayerIndex(players)
+    build = time.perf_counter() - start
+    print(f"{len(players)} players, {len(urls)} URLs, index built in {build * 1000:.2f} ms")
+
+    mismatches = [u for u in urls if linear_find(players, u) != index.find(u)]
+    if mismatches:
+        print(f"MISMATCH on {len(mismatches)} URL(s), e.g. {mismatches[0]}")
+        sys.exit(1)
+
+    linear = bench("linear scan", lambda u: linear_find(players, u), urls)
+    indexed = bench("PlayerIndex", index.find, urls)
+    print(f"speedup: x{linear / indexed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
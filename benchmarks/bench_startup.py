@@ -0,0 +1,163 @@
+"""
+Benchmark: cold start of the CLI up to the first menu render.
+
+Starts `autoflix` in fresh interpreters and stops each one when it first
+calls select_from_list, in two situations:
+
+- first launch: an empty data directory, the language prompt is shown
+- resume: a history with a Resume entry, the home menu is shown while the
+  entry is prefetched in the background
+
+Reports the time to get there, and fails if a median exceeds the budget. On
+a first launch it also fails if a heavy dependency was imported on the way:
+those must only be loaded when a provider or a video needs them (with a
+Resume entry the prefetch thread loads them, but must not delay the menu).
+
+The update check's network request is stubbed out: only local startup work
+is measured.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--budget SECONDS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Modules the home menu must not need
+HEAVY_MODULES = [
+    "flask",
+    "werkzeug",
+    "bs4",
+    "html5lib",
+    "lxml",
+    "jsbeautifier",
+    "Crypto",
+    "m3u8",
+    "curl_cffi",
+]
+
+# History entry of the resume scenario (its provider has a prefetch hook)
+RESUME_ENTRY = {
+    "provider": "Anime-Sama",
+    "series_title": "Frieren",
+    "season_title": "Saison 1",
+    "episode_title": "Episode 3",
+    "series_url": "/catalogue/frieren/",
+    "season_url": "/catalogue/frieren/saison1/vostfr/",
+    "episode_url": "",
+    "last_watched": datetime(2025, 1, 1).isoformat(),
+    "logo_url": None,
+}
+
+CHILD = r"""
+import time
+start = time.perf_counter()
+import json, os, sys
+from autoflix_cli import cli_utils, update_checker
+
+def first_render(*args, **kwargs):
+    heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+    report = {{"seconds": time.perf_counter() - start, "heavy": heavy}}
+    sys.stdout.write("\nSTARTUP " + json.dumps(report) + "\n")
+    sys.stdout.flush()
+    os._exit(0)
+
+cli_utils.select_from_list = first_render
+update_checker.get_latest_version = lambda package_name: None
+sys.argv = ["autoflix"]
+from autoflix_cli.main import main
+main()
+"""
+
+
+def run_once(data_home: str) -> dict:
+    env = dict(os.environ, XDG_DATA_HOME=data_home, TERM="dumb")
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    wall = time.perf_counter() - start
+    for line in result.stdout.splitlines():
+        if line.startswith("STARTUP "):
+            report = json.loads(line[len("STARTUP ") :])
+            report["wall"] = wall
+            return report
+    raise RuntimeError(f"No menu rendered:\n{result.stderr[-2000:]}")
+
+
+def write_history(data_home: str):
+    """Progress file of a user who has set a language and watched something."""
+    data_dir = Path(data_home) / "AutoFlixCLI"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    progress = {
+        "language": "fr",
+        "history": {"Anime-Sama|Frieren": RESUME_ENTRY},
+        "last_watched_global": RESUME_ENTRY,
+    }
+    with open(data_dir / "progress.json", "w", encoding="utf-8") as f:
+        json.dump(progress, f)
+
+
+def bench(name: str, runs: int, with_history: bool) -> tuple[float, list[str]]:
+    reports = []
+    with tempfile.TemporaryDirectory() as data_home:
+        if with_history:
+            write_history(data_home)
+        for _ in range(runs):
+            reports.append(run_once(data_home))
+
+    in_process = statistics.median(r["seconds"] for r in reports)
+    wall = statistics.median(r["wall"] for r in reports)
+    heavy = sorted({m for r in reports for m in r["heavy"]})
+
+    print(f"[{name}]")
+    print(f"first render (imports + setup): {in_process * 1000:7.1f} ms median")
+    print(f"process start to first render:  {wall * 1000:7.1f} ms median")
+    print(f"heavy modules loaded:           {', '.join(heavy) or 'none'}")
+    return in_process, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.5,
+        help="Maximum median time to the first render, in seconds",
+    )
+    args = parser.parse_args()
+
+    ok = True
+    first_launch, heavy = bench("first launch", args.runs, with_history=False)
+    if first_launch > args.budget:
+        print(f"FAIL: over the {args.budget:g}s budget")
+        ok = False
+    if heavy:
+        print("FAIL: heavy modules must be imported lazily")
+        ok = False
+
+    print()
+    resume, _ = bench("resume", args.runs, with_history=True)
+    if resume > args.budget:
+        print(f"FAIL: over the {args.budget:g}s budget")
+        ok = False
+    if not ok:
+        sys.exit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark: default player extraction (scraping/deobfuscate.py).
+
+Compares the historical full path (packer.unpack + jsbeautifier.beautify of
+the whole page) with the fast path (in-place unpacking of the packer blocks,
+no beautify) on player pages, and checks that extract_hls_url finds the
+same link with both.
+
+Pages are the HTML bodies recorded in benchmarks/fixtures/extractors (see
+replay.py), plus synthetic pages built with a p.a.c.k.e.r encoder so the
+benchmark runs without network access.
+
+Usage:
+    python benchmarks/bench_unpacker.py [number_of_synthetic_pages]
+"""
+
+import random
+import re
+import string
+import sys
+import time
+
+from autoflix_cli.scraping.deobfuscate import deobfuscate, deobfuscate_fast
+from autoflix_cli.scraping.player import extract_hls_url
+
+from replay import load_fixtures
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def base62(n: int) -> str:
+    out = ""
+    while True:
+        n, r = divmod(n, 62)
+        out = ALPHABET[r] + out
+        if not n:
+            return out
+
+
+def pack(source: str) -> str:
+    """Minimal Dean Edwards packer (base 62), as used by player hosts."""
+    words = re.findall(r"\b\w+\b", source, re.ASCII)
+    ranking = sorted(set(words), key=lambda w: -words.count(w))
+    symtab = {word: base62(i) for i, word in enumerate(ranking)}
+    payload = re.sub(r"\b\w+\b", lambda m: symtab[m.group(0)], source, flags=re.ASCII)
+    payload = payload.replace("\\", "\\\\").replace("'", "\\'")
+    keywords = "|".join("" if symtab[w] == w else w for w in ranking)
+    return (
+        "eval(function(p,a,c,k,e,d){e=function(c){return(c<a?'':e(parseInt(c/a)))"
+        "+((c=c%a)>35?String.fromCharCode(c+29):c.toString(36))};while(c--)"
+        "if(k[c])p=p.replace(new RegExp('\\\\b'+e(c)+'\\\\b','g'),k[c]);return p}"
+        f"('{payload}',62,{len(ranking)},'{keywords}'.split('|'),0,{{}}))"
+    )
+
+
+def token(n: int) -> str:
+    return "".join(random.choices(string.ascii_letters + string.digits, k=n))
+
+
+def make_page() -> str:
+    video = token(12)
+    setup = (
+        'jwplayer("vplayer").setup({sources:[{file:"https://'
+        f"{token(6)}.cdn-{token(4)}.com/hls2/01/{video}/master.m3u8?t={token(40)}"
+        f'&s={random.randint(10**9, 10**10)}"'
+        '}],image:"https://img.example/' + video + '.jpg",width:"100%",'
+        'height:"100%",stretching:"uniform",duration:"1432",preload:"none",'
+        'tracks:[{file:"/dl?op=get_slides&length=1432&url=' + video + '",kind:"thumbnails"}],'
+        'captions:{userFontScale:1},playbackRateControls:true});'
+    )
+    # Filler scripts and markup, like the ads/analytics code of real pages
+    filler = []
+    for i in range(random.randint(150, 300)):
+        name = token(8)
+        filler.append(
+            f"function {name}(a,b){{var c=a+b*{i};if(c>{i}){{return "
+            f"document.getElementById('{token(6)}')}}return null}}"
+        )
+    markup = "".join(
+        f'<div class="row-{token(5)}"><a href="/v/{token(10)}">{token(20)}</a></div>\n'
+        for _ in range(random.randint(300, 600))
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Watch</title>"
+        f"<script>{';'.join(filler)}</script></head><body>{markup}"
+        f"<script type='text/javascript'>{pack(setup)}</script>"
+        "</body></html>"
+    )
+
+
+def bench(name, fn, pages, rounds=3):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for page in pages:
+            extract_hls_url(fn(page))
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<10} {best * 1000:9.1f} ms  ({best / len(pages) * 1000:7.2f} ms/page)")
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    random.seed(42)
+
+    pages = [
+        response["body"]
+        for fixture in load_fixtures()
+        for response in fixture["responses"]
+        if response["body"].lstrip().startswith("<")
+    ]
+    recorded = len(pages)
+    pages += [make_page() for _ in range(count)]
+    size = sum(len(p) for p in pages) / len(pages) / 1024
+    print(f"{recorded} recorded + {count} synthetic pages, {size:.0f} KiB on average")
+
+    mismatches = 0
+    for page in pages:
+        full = extract_hls_url(deobfuscate(page))
+        fast = extract_hls_url(deobfuscate_fast(page))
+        if fast != full and fast is not None:
+            mismatches += 1
+    if mismatches:
+        print(f"MISMATCH on {mismatches} page(s)")
+        sys.exit(1)
+
+    full = bench("full", deobfuscate, pages)
+    fast = bench("fast", deobfuscate_fast, pages)
+    print(f"speedup: x{full / fast:.1f}")
+
+
+if __name__ == "__main__":
+    main()
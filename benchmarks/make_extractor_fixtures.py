@@ -0,0 +1,305 @@
+"""
+Generate the synthetic fixture corpus of benchmarks/fixtures/extractors.
+
+Each fixture reproduces the page/API structure an extractor parses (packed
+jwplayer setup, og:video meta, AES payloads...) with fake hosts and IDs.
+Fixtures recorded from live hosts (bench_extractors.py --record) can be
+added next to them; this script only overwrites its own files.
+
+Usage:
+    python benchmarks/make_extractor_fixtures.py
+"""
+
+import base64
+import binascii
+import json
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+from bench_unpacker import pack
+from replay import FIXTURES_DIR
+
+
+def page(body: str, filler: int = 200) -> str:
+    """Wrap a player snippet into a page of realistic size."""
+    rows = "".join(
+        f'<div class="ad-{i}"><a href="/v/{i:06d}">Related video {i}</a></div>\n'
+        for i in range(filler)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Player</title>"
+        "<script src='/js/jquery.min.js'></script></head>"
+        f"<body>{rows}{body}</body></html>"
+    )
+
+
+def response(url, body, method="GET", content_type="text/html; charset=utf-8"):
+    return {
+        "method": method,
+        "url": url,
+        "status": 200,
+        "headers": {"Content-Type": content_type},
+        "body": body,
+    }
+
+
+def fixture_default():
+    stream = "https://v4.cdn-lulu.example/hls2/01/00042/lv1code_n/master.m3u8?t=Xa9k&s=1760000000"
+    setup = (
+        f'jwplayer("vplayer").setup({{sources:[{{file:"{stream}"}}],'
+        'image:"https://img.example/lv1code.jpg",width:"100%",height:"100%",'
+        'stretching:"uniform",duration:"1432",preload:"none"});'
+    )
+    url = "https://luluvdo.com/e/lv1code"
+    return {
+        "name": "luluvdo",
+        "url": url,
+        "headers": {},
+        "expected": stream,
+        "responses": [
+            response(url, page(f"<script type='text/javascript'>{pack(setup)}</script>"))
+        ],
+    }
+
+
+def fixture_vidmoly():
+    stream = "https://box-1.vidmoly.example/hls/,vm1code,.urlset/master.m3u8"
+    url = "https://vidmoly.biz/embed-vm1code.html"
+    body = page(f'<script>player.setup({{sources: [{{file:"{stream}"}}]}});</script>')
+    return {
+        "name": "vidmoly",
+        "url": url,
+        "headers": {},
+        "expected": stream,
+        "responses": [response(url, body)],
+    }
+
+
+def fixture_uqload():
+    stream = "https://m180.uqload.example/3rfkvhpd/v.mp4"
+    return {
+        "name": "uqload",
+        "url": "https://uqload.net/embed-uq1code.html",
+        "headers": {},
+        "expected": stream,
+        "responses": [
+            response(
+                "https://uqload.net/uq1code.html",
+                page(f'<script>new Clappr.Player({{sources: ["{stream}"]}});</script>'),
+            )
+        ],
+    }
+
+
+def fixture_sendvid():
+    stream = "https://videos2.sendvid.example/a1/b2/sv1code.mp4?validfrom=1&validto=2"
+    url = "https://sendvid.com/embed/sv1code"
+    body = page("").replace(
+        "</head>", f'<meta property="og:video" content="{stream}"></head>'
+    )
+    return {
+        "name": "sendvid",
+        "url": url,
+        "headers": {},
+        "expected": stream,
+        "responses": [response(url, body)],
+    }
+
+
+def sibnet_response(video_id: int):
+    return response(
+        f"https://video.sibnet.ru/shell.php?videoid={video_id}",
+        page(
+            f'<script>player.src([{{src: "/v/5f1e/{video_id}.mp4", type: "video/mp4"}}]);</script>'
+        ),
+    )
+
+
+def fixture_sibnet():
+    return {
+        "name": "sibnet",
+        "url": "https://video.sibnet.ru/shell.php?videoid=4000001",
+        "headers": {},
+        "expected": "https://video.sibnet.ru/v/5f1e/4000001.mp4",
+        "responses": [sibnet_response(4000001)],
+    }
+
+
+def fixture_vidoza():
+    stream = "https://str38.vidoza.example/x3k/v.mp4"
+    url = "https://videzz.net/embed-vz1code.html"
+    body = page(f'<video id="player"><source src="{stream}" type="video/mp4"></video>')
+    return {
+        "name": "videzz",
+        "url": url,
+        "headers": {},
+        "expected": stream,
+        "responses": [response(url, body)],
+    }
+
+
+def fixture_filemoon():
+    stream = "https://be6721.filemoon.example/hls2/fm1code/master.m3u8?t=abc"
+    key_parts = [bytes(range(16)), bytes(range(16, 32))]
+    iv = bytes(range(12))
+    cipher = AES.new(key_parts[0] + key_parts[1], AES.MODE_GCM, nonce=iv)
+    ciphertext, tag = cipher.encrypt_and_digest(
+        json.dumps({"sources": [{"url": stream}]}).encode()
+    )
+
+    def b64(data):
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    playback = {
+        "playback": {
+            "key_parts": [b64(p) for p in key_parts],
+            "iv": b64(iv),
+            "payload": b64(ciphertext + tag),
+        }
+    }
+    return {
+        "name": "filemoon",
+        "url": "https://filemoon.sx/e/fm1code",
+        "headers": {"Referer": "https://ico3c.com/"},
+        "expected": stream,
+        "responses": [
+            response(
+                "https://9n8o.com/api/videos/fm1code/embed/playback",
+                json.dumps(playback),
+                content_type="application/json",
+            )
+        ],
+    }
+
+
+def fixture_kakaflix():
+    url = "https://kakaflix.lol/moon2/kk1code"
+    body = page('<iframe src="https://video.sibnet.ru/shell.php?videoid=4000002"></iframe>')
+    return {
+        "name": "kakaflix",
+        "url": url,
+        "headers": {},
+        "expected": "https://video.sibnet.ru/v/5f1e/4000002.mp4",
+        "responses": [response(url, body), sibnet_response(4000002)],
+    }
+
+
+def fixture_myvidplay():
+    stream = "https://cdn.myvidplay.example/hls/mv1code/master.m3u8"
+    url = "https://myvidplay.com/e/mv1code"
+    return {
+        "name": "myvidplay",
+        "config": {"type": "myvidplay", "referrer": "https://myvidplay.com/"},
+        "url": url,
+        "headers": {},
+        "expected": stream,
+        "responses": [response(url, page(f"<script>var t = {{vtt: '{stream}'}};</script>"))],
+    }
+
+
+def fixture_embed4me():
+    stream = "https://cdn.embed4me.example/e4m1code/master.m3u8"
+    cipher = AES.new(b"kiemtienmua911ca", AES.MODE_CBC, b"1234567890oiuytr")
+    payload = cipher.encrypt(pad(json.dumps({"source": stream}).encode(), AES.block_size))
+    root = "https://coflix.upn.one"
+    return {
+        "name": "coflix.upn",
+        "url": f"{root}/#e4m1code",
+        "headers": {},
+        "expected": stream,
+        "responses": [
+            response(
+                f"{root}/api/v1/video?id=e4m1code&w=1920&h=1080&r={root}",
+                binascii.hexlify(payload).decode(),
+                content_type="text/plain",
+            )
+        ],
+    }
+
+
+def fixture_veev():
+    stream = "https://s-delivery.veev.example/vv1media/v.mp4?token=q1"
+    # "1" + chr(256) decodes (LZW) to ch="111": one rule, "reverse then unhex"
+    encoded_ch = "1" + chr(256)
+    dv = binascii.hexlify(stream.encode()).decode()[::-1]
+    url = "https://veev.to/e/vv1media"
+    return {
+        "name": "veev",
+        "url": url,
+        "headers": {},
+        "expected": stream,
+        "responses": [
+            response(url, page(f"<script>var cfg = {{ fc: '{encoded_ch}' }};</script>")),
+            response(
+                "https://veev.to/dl?op=player_api&cmd=gi&file_code=vv1media&r=https://veev.to&ch=111&ie=1",
+                json.dumps({"file": {"file_status": "OK", "dv": [{"s": dv}]}}),
+                content_type="application/json",
+            ),
+        ],
+    }
+
+
+def fixture_xtremestream():
+    return {
+        "name": "xtremestream",
+        "url": "https://xtremestream.xyz/player/index.php?data=xs1code",
+        "headers": {},
+        "expected": "https://xtremestream.xyz/player/xs1.php?data=xs1code",
+        "responses": [],
+    }
+
+
+def fixture_montmyoboky():
+    origin = "https://arkanim.net"
+    stream = "https://cdn.arkanim.example/hls/555/master.m3u8"
+    return {
+        "name": "montmyoboky",
+        "url": "montmyoboky:555",
+        "headers": {},
+        "patch": {"autoflix_cli.scraping.arkanime:website_origin": origin},
+        "expected": stream,
+        "responses": [
+            response(
+                f"{origin}/api/watch/token",
+                json.dumps({"token": "tok555"}),
+                method="POST",
+                content_type="application/json",
+            ),
+            response(
+                f"{origin}/api/source/resolve?token=tok555",
+                json.dumps({"videoUrl": stream, "subtitleUrl": None}),
+                content_type="application/json",
+            ),
+        ],
+    }
+
+
+GENERATORS = {
+    "default": fixture_default,
+    "vidmoly": fixture_vidmoly,
+    "uqload": fixture_uqload,
+    "sendvid": fixture_sendvid,
+    "sibnet": fixture_sibnet,
+    "vidoza": fixture_vidoza,
+    "filemoon": fixture_filemoon,
+    "kakaflix": fixture_kakaflix,
+    "myvidplay": fixture_myvidplay,
+    "embed4me": fixture_embed4me,
+    "veev": fixture_veev,
+    "xtremestream": fixture_xtremestream,
+    "montmyoboky": fixture_montmyoboky,
+}
+
+
+def main():
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    for name, generate in GENERATORS.items():
+        path = FIXTURES_DIR / f"{name}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(generate(), f, indent=4, ensure_ascii=False)
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""
+Generate the synthetic fixture corpus of benchmarks/fixtures/scrapers.
+
+Each fixture is one scraper call (search, series page, movie page...) with
+the pages it downloads, built like the providers' markup (card grids,
+season tabs, episode lists, player menus) with fake titles and hosts, at
+the size of a real catalogue page. Pages recorded from the live sites
+(bench_parsers.py --record) can be added next to them; this script only
+overwrites its own files.
+
+Usage:
+    python benchmarks/make_scraper_fixtures.py
+"""
+
+import base64
+import json
+
+from bench_parsers import FIXTURES_DIR
+
+GENRES = ["Action", "Aventure", "Comédie", "Drame", "Fantastique", "Romance"]
+
+
+def page(body: str, title: str = "Catalogue", head: str = "") -> str:
+    """Wrap provider markup into a page with the usual site chrome."""
+    menu = "".join(
+        f'<li class="nav-item"><a href="/genre/{g.lower()}/">{g}</a></li>'
+        for g in GENRES * 4
+    )
+    footer = "".join(
+        f'<p class="footer-link"><a href="/page/{i}/">Page {i}</a> &middot; '
+        f"<span>Mentions l&eacute;gales</span></p>"
+        for i in range(60)
+    )
+    return (
+        "<!DOCTYPE html><html lang='fr'><head><meta charset='utf-8'>"
+        f"<title>{title}</title>{head}"
+        "<link rel='stylesheet' href='/css/main.css'>"
+        "<script src='/js/app.min.js'></script></head><body>"
+        f"<header><nav><ul class='menu'>{menu}</ul></nav></header>"
+        f"<main>{body}</main><footer>{footer}</footer></body></html>"
+    )
+
+
+def response(url, body, method="GET", content_type="text/html; charset=utf-8"):
+    return {
+        "method": method,
+        "url": url,
+        "status": 200,
+        "headers": {"Content-Type": content_type},
+        "body": body,
+    }
+
+
+def fixture(name, call, args, responses, patch=None):
+    return {
+        "name": name,
+        "call": call,
+        "args": args,
+        "patch": patch or {},
+        "responses": responses,
+    }
+
+
+# --- Anime-Sama ---
+
+SAMA = "https://anime-sama.example"
+SAMA_PATCH = {"autoflix_cli.scraping.anime_sama:website_origin": SAMA}
+
+
+def fixture_anime_sama_search():
+    cards = "".join(
+        f'<div class="shrink-0 catalog-card">'
+        f'<a href="{SAMA}/catalogue/serie-{i}/">'
+        f'<img class="card-image" src="https://cdn.example/{i}.jpg" alt=""></a>'
+        f'<div class="card-content"><h2 class="card-title">Série {i}</h2>'
+        f'<p class="info-value">{GENRES[i % 6]}, {GENRES[(i + 2) % 6]}</p>'
+        f'<p class="info-value">{"Scans" if i % 7 == 0 else "Anime, Scans"}</p>'
+        f'<p class="info-value">VOSTFR, VF</p></div></div>'
+        for i in range(240)
+    )
+    body = f'<div id="list_catalog" class="grid">{cards}</div>'
+    url = f"{SAMA}/catalogue/?search=serie"
+    return fixture(
+        "anime_sama-search",
+        "autoflix_cli.scraping.anime_sama:search",
+        ["serie"],
+        [response(url, page(body))],
+        SAMA_PATCH,
+    )
+
+
+def fixture_anime_sama_series():
+    panels = "".join(
+        f'panneauAnime("Saison {i}", "saison{i}/vostfr");\n' for i in range(1, 9)
+    )
+    script = (
+        "<script>\n"
+        '/* panneauAnime("nom", "url"); */\n'
+        f"{panels}"
+        'panneauAnime("Film", "film/vostfr");\n'
+        "</script>"
+    )
+    genres = "".join(f"<span>{g} </span>" for g in GENRES)
+    synopsis = "".join(f"<p class='synopsis'>Paragraphe {i}.</p>" for i in range(30))
+    body = (
+        '<img id="coverOeuvre" src="https://cdn.example/cover.jpg">'
+        '<h1 id="titreOeuvre">Série Longue</h1>'
+        f'<div class="genres-wrap">{genres}</div>{synopsis}'
+        '<div class="flex flex-wrap overflow-y-hidden justify-start">'
+        f"{script}</div>"
+    )
+    url = f"{SAMA}/catalogue/serie-longue"
+    return fixture(
+        "anime_sama-series",
+        "autoflix_cli.scraping.anime_sama:get_series",
+        [url],
+        [response(url, page(body, "Série Longue"))],
+        SAMA_PATCH,
+    )
+
+
+# --- Coflix ---
+
+COFLIX = "https://coflix.example"
+COFLIX_PATCH = {"autoflix_cli.scraping.coflix:website_origin": COFLIX}
+
+
+def fixture_coflix_search():
+    cards = "".join(
+        f'<div class="md-manga-card"><a href="{COFLIX}/serie/titre-{i}/">'
+        f'<img src="//cdn.example/poster-{i}.webp"></a>'
+        f'<p class="md-manga-card-name">Titre {i}</p>'
+        f'<span class="md-manga-card-year">{2000 + i % 25}</span></div>'
+        for i in range(200)
+    )
+    url = f"{COFLIX}/?s=titre"
+    return fixture(
+        "coflix-search",
+        "autoflix_cli.scraping.coflix:search",
+        ["titre"],
+        [response(url, page(f'<div class="md-grid">{cards}</div>'))],
+        COFLIX_PATCH,
+    )
+
+
+def fixture_coflix_series():
+    tabs = "".join(
+        f'<button class="cf-server-tab" data-season="{s}">Saison {s + 1}'
+        f'<span class="cf-server-tab-lang">VF</span></button>'
+        for s in range(6)
+    )
+    panels = "".join(
+        f'<div class="cf-episodes-panel" data-panel="{s}">'
+        + "".join(
+            f'<div class="cf-episode-item" '
+            f"onclick=\"window.location.href='{COFLIX}/episode/serie-{s + 1}x{e}/'\">"
+            f'<img src="//cdn.example/still-{s}-{e}.jpg">'
+            f'<span class="cf-episode-title">Épisode {e}</span>'
+            f'<span class="cf-episode-date">2024-01-{e % 28 + 1:02d}</span></div>'
+            for e in range(1, 25)
+        )
+        + "</div>"
+        for s in range(6)
+    )
+    tags = "".join(f'<a href="/genre/{g.lower()}/">{g}</a>' for g in GENRES)
+    body = (
+        '<h1 class="cf-movie-title"> Série Coflix </h1>'
+        '<img class="cf-movie-cover-img" src="https://cdn.example/cover.jpg">'
+        f'<div class="cf-movie-tags-row">{tags}</div>'
+        f'<div id="cfSeasonTabs">{tabs}</div>{panels}'
+    )
+    url = f"{COFLIX}/serie/serie-coflix/"
+    return fixture(
+        "coflix-series",
+        "autoflix_cli.scraping.coflix:get_series",
+        [url],
+        [response(url, page(body, "Série Coflix"))],
+        COFLIX_PATCH,
+    )
+
+
+def fixture_coflix_movie():
+    players_url = "https://lecteurvideo.com/embed.php?id=424242"
+    items = "".join(
+        f"<li onclick=\"showVideo('"
+        f"{base64.b64encode(f'https://host{i}.example/e/{i:04d}'.encode()).decode()}"
+        f"')\"><span>Lecteur {i} / HD</span></li>"
+        for i in range(12)
+    )
+    tags = "".join(f'<a href="/genre/{g.lower()}/">{g}</a>' for g in GENRES[:3])
+    body = (
+        "<h1>Film Coflix</h1>"
+        '<img class="cf-movie-cover-img" src="https://cdn.example/film.jpg">'
+        f'<div class="cf-movie-tags-row">{tags}</div>'
+        f'<iframe id="cfPlayerFrame" src="{players_url}"></iframe>'
+    )
+    url = f"{COFLIX}/film/film-coflix/"
+    return fixture(
+        "coflix-movie",
+        "autoflix_cli.scraping.coflix:get_content",
+        [url],
+        [
+            response(url, page(body, "Film Coflix")),
+            response(players_url, page(f"<ul class='players'>{items}</ul>")),
+        ],
+        COFLIX_PATCH,
+    )
+
+
+def fixture_coflix_episode():
+    servers = [
+        {"nombre": f"Serveur {i}", "embed_url": f"https://host{i}.example/e/ep{i}"}
+        for i in range(8)
+    ]
+    body = (
+        "<h1>Série Coflix 1x3</h1>"
+        '<iframe src="https://coflix.example/player/ep3"></iframe>'
+        f"<script>var cfServers = {json.dumps(servers)};</script>"
+    )
+    url = f"{COFLIX}/episode/serie-coflix-1x3/"
+    return fixture(
+        "coflix-episode",
+        "autoflix_cli.scraping.coflix:get_episode",
+        [url],
+        [response(url, page(body, "Épisode"))],
+        COFLIX_PATCH,
+    )
+
+
+# --- French-Stream ---
+
+FSTREAM = "https://french-stream.example"
+FSTREAM_PATCH = {"autoflix_cli.scraping.french_stream:website_origin": FSTREAM}
+
+
+def fixture_french_stream_search():
+    items = "".join(
+        f"<div class=\"search-item\" onclick=\"location.href='/films/{1000 + i}-film-{i}.html'\">"
+        f'<img src="/img/{i}.jpg"><div class="search-title">Film {i}</div>'
+        f'<div class="search-year">{1990 + i % 35}</div></div>'
+        for i in range(60)
+    )
+    return fixture(
+        "french_stream-search",
+        "autoflix_cli.scraping.french_stream:search",
+        ["film"],
+        [
+            response(
+                f"{FSTREAM}/engine/ajax/search.php",
+                f'<div class="search-results">{items}</div>',
+                method="POST",
+            )
+        ],
+        FSTREAM_PATCH,
+    )
+
+
+def fixture_french_stream_movie():
+    genres = "".join(f'<a href="/genre/{g.lower()}/">{g}</a>' for g in GENRES[:4])
+    body = (
+        '<img class="dvd-thumbnail" src="/img/4242.jpg">'
+        '<ul id="s-list"><li><span>Année:</span> 2021</li>'
+        f"<li><span>Genre:</span> {genres}</li>"
+        "<li><span>Réalisateur:</span> Jane Doe</li></ul>"
+    )
+    head = '<meta property="og:title" content="Film French-Stream">'
+    url = f"{FSTREAM}/films/4242-film-french-stream.html"
+    players = {
+        f"Lecteur{i}": {"VF": f"https://host{i}.example/vf", "VOSTFR": f"https://host{i}.example/vo"}
+        for i in range(4)
+    }
+    return fixture(
+        "french_stream-movie",
+        "autoflix_cli.scraping.french_stream:get_content",
+        [url],
+        [
+            response(url, page(body, "Film", head)),
+            response(
+                f"{FSTREAM}/engine/ajax/film_api.php?id=4242",
+                json.dumps({"players": players}),
+                content_type="application/json",
+            ),
+        ],
+        FSTREAM_PATCH,
+    )
+
+
+# --- Wiflix ---
+
+WIFLIX = "https://wiflix.example"
+WIFLIX_PATCH = {"autoflix_cli.scraping.wiflix:website_origin": WIFLIX}
+
+
+def wiflix_infos():
+    rows = [
+        ("Date de sortie:", "2019"),
+        ("ORIGINE:", "France"),
+        ("ACTEURS:", "Jane Doe, John Doe"),
+        ("Durée:", "1h 52min"),
+    ]
+    items = "".join(
+        f'<li><div class="mov-label">{label}</div><div class="mov-desc">{value}</div></li>'
+        for label, value in rows
+    )
+    return f'<ul class="mov-list">{items}</ul>'
+
+
+def wiflix_messy_infos():
+    """
+    Info list the way the live pages are written: unclosed <li>, entities
+    and nested markup in labels, so get_value_by_key's li:has() selector
+    runs on a tree each parser had to repair.
+    """
+    return (
+        '<ul class="mov-list">'
+        '<li class="mov-item"><div class="mov-label"> <b>Date de sortie:</b> </div>'
+        '<div class="mov-desc"><span itemprop="dateCreated">2021</span></div>'
+        '<li><div class="mov-label">ORIGINE:</div><div class="mov-desc">'
+        "Royaume-Uni<br>&Eacute;tats-Unis</div>"
+        '<li><div class="mov-label">ACTEURS:</div><div class="mov-desc">'
+        '<a href="/acteurs/jane/">Jane Doe</a>, <a href="/acteurs/john/">John Doe</a>'
+        "</div>"
+        '<li><div class="mov-label">Dur&eacute;e:</div>'
+        '<div class="mov-desc">2h 05min</div>'
+        "</ul>"
+    )
+
+
+def wiflix_description():
+    links = "".join(f'<a href="/{g.lower()}/">{g}</a>, ' for g in GENRES[:3])
+    return f'<p itemprop="description">{links}<a href="/acteurs/jane/">Jane</a></p>'
+
+
+def fixture_wiflix_search():
+    results = "".join(
+        f'<div class="mov clearfix"><img src="/uploads/{i}.jpg">'
+        f'<a class="mov-t nowrap" href="{WIFLIX}/film-en-streaming/{i}-film.html">Film {i}</a>'
+        f'<div class="nbloc3"><a href="/action/">Action</a><a href="/drame/">Drame</a></div></div>'
+        for i in range(100)
+    )
+    return fixture(
+        "wiflix-search",
+        "autoflix_cli.scraping.wiflix:search",
+        ["film"],
+        [
+            response(WIFLIX, page("")),
+            response(
+                f"{WIFLIX}/index.php?do=search", page(results), method="POST"
+            ),
+        ],
+        WIFLIX_PATCH,
+    )
+
+
+def fixture_wiflix_movie():
+    players = "".join(
+        f"<a onclick=\"loadVideo('https://host{p}.example/e/film42')\">Lecteur {p}</a>"
+        for p in range(6)
+    )
+    head = '<meta property="og:title" content="Film Wiflix">'
+    body = (
+        '<img id="posterimg" src="/uploads/film.jpg">'
+        f"{wiflix_description()}{wiflix_messy_infos()}"
+        f'<div class="tabs-sel linkstab"><div class="tabs-sel linkstab">{players}</div></div>'
+    )
+    url = f"{WIFLIX}/film-en-streaming/42-film.html"
+    return fixture(
+        "wiflix-movie",
+        "autoflix_cli.scraping.wiflix:get_content",
+        [url],
+        [response(url, page(body, "Film", head))],
+        WIFLIX_PATCH,
+    )
+
+
+def fixture_wiflix_series():
+    blocks = "".join(
+        f'<div class="ep{e}{lang}">'
+        + "".join(
+            f"<a onclick=\"loadVideo('https://host{p}.example/e/{lang}{e}')\"> Lecteur {p} </a>"
+            for p in range(5)
+        )
+        + "</div>"
+        for lang in ("vf", "vs")
+        for e in range(1, 25)
+    )
+    head = '<meta property="og:title" content="Série Wiflix - Saison 2">'
+    body = (
+        "<h1>Série Wiflix - Saison 2</h1>"
+        '<img id="posterimg" src="/uploads/serie.jpg">'
+        f"{wiflix_description()}{wiflix_infos()}"
+        f'<div class="hostsblock">{blocks}</div>'
+    )
+    url = f"{WIFLIX}/serie-en-streaming/42-serie-saison-2.html"
+    return fixture(
+        "wiflix-series",
+        "autoflix_cli.scraping.wiflix:get_content",
+        [url],
+        [response(url, page(body, "Série", head))],
+        WIFLIX_PATCH,
+    )
+
+
+def main():
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    builders = [
+        fixture_anime_sama_search,
+        fixture_anime_sama_series,
+        fixture_coflix_search,
+        fixture_coflix_series,
+        fixture_coflix_movie,
+        fixture_coflix_episode,
+        fixture_french_stream_search,
+        fixture_french_stream_movie,
+        fixture_wiflix_search,
+        fixture_wiflix_movie,
+        fixture_wiflix_series,
+    ]
+    for build in builders:
+        data = build()
+        path = FIXTURES_DIR / f"{data['name']}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"wrote {path.relative_to(FIXTURES_DIR.parent.parent)}")
+
+
+if __name__ == "__main__":
+    main()
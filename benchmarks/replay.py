@@ -0,0 +1,153 @@
+"""
+Offline stand-in for player hosts.
+
+A fixture is a JSON file describing one extraction and the HTTP exchanges it
+needs:
+
+    {
+        "name": "sibnet",                # players_info key used for dispatch
+        "config": {"type": "sibnet"},    # optional, added if the key is unknown
+        "url": "https://video.sibnet.ru/shell.php?videoid=1",
+        "headers": {},
+        "expected": "https://video.sibnet.ru/v/....mp4",
+        "responses": [
+            {"method": "GET", "url": "https://...", "status": 200,
+             "headers": {"Content-Type": "text/html"}, "body": "..."}
+        ]
+    }
+
+ReplayServer serves the responses of every fixture on 127.0.0.1, from a
+child process so it does not count in the benchmark's CPU time, and
+ReplaySession (a drop-in for the extraction engine's AsyncSession) rewrites
+https://host/path to that server. RecordingSession does the opposite: it
+talks to the live hosts and keeps every exchange so a fixture can be saved.
+"""
+
+import json
+import multiprocessing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, unquote
+
+from curl_cffi.requests import AsyncSession
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "extractors"
+
+
+def exchange_key(method: str, url: str) -> str:
+    """Scheme-less, unquoted key of a request: "GET host/path?query"."""
+    parts = urlsplit(url)
+    target = parts.netloc + parts.path + (f"?{parts.query}" if parts.query else "")
+    return f"{method.upper()} {unquote(target)}"
+
+
+def load_fixtures(directory: Path = FIXTURES_DIR) -> list[dict]:
+    fixtures = []
+    for path in sorted(directory.glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            fixtures.append(json.load(f))
+    return fixtures
+
+
+def _make_server(fixtures: list[dict]) -> ThreadingHTTPServer:
+    responses = {}
+    for fixture in fixtures:
+        for response in fixture["responses"]:
+            responses[exchange_key(response["method"], response["url"])] = response
+
+    class Handler(BaseHTTPRequestHandler):
+        def _replay(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            # Path is "/<host>/<path>?<query>"
+            key = f"{self.command} {unquote(self.path[1:])}"
+            response = responses.get(key)
+            if response is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = response.get("body", "").encode("utf-8")
+            self.send_response(response.get("status", 200))
+            for name, value in (response.get("headers") or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _replay
+        do_POST = _replay
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+
+def _serve(fixtures: list[dict], port_queue):
+    httpd = _make_server(fixtures)
+    port_queue.put(httpd.server_address[1])
+    httpd.serve_forever()
+
+
+class ReplayServer:
+    """Serve recorded responses on a local port, in a child process."""
+
+    def __init__(self, fixtures: list[dict]):
+        self.fixtures = fixtures
+        self.base_url = None
+        self._process = None
+
+    def __enter__(self):
+        context = multiprocessing.get_context("spawn")
+        port_queue = context.Queue()
+        self._process = context.Process(
+            target=_serve, args=(self.fixtures, port_queue), daemon=True
+        )
+        self._process.start()
+        self.base_url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+        return self
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.join()
+
+
+class ReplaySession(AsyncSession):
+    """curl_cffi async session sending every request to a ReplayServer."""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+        self.request_count = 0
+
+    async def request(self, method, url, *args, **kwargs):
+        self.request_count += 1
+        parts = urlsplit(url)
+        local = f"{self.base_url}/{parts.netloc}{parts.path}"
+        if parts.query:
+            local += f"?{parts.query}"
+        return await super().request(method, local, *args, **kwargs)
+
+
+class RecordingSession(AsyncSession):
+    """curl_cffi async session keeping every exchange with the live hosts."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.exchanges = []
+
+    async def request(self, method, url, *args, **kwargs):
+        response = await super().request(method, url, *args, **kwargs)
+        content_type = response.headers.get("Content-Type")
+        self.exchanges.append(
+            {
+                "method": method.upper(),
+                "url": url,
+                "status": response.status_code,
+                "headers": {"Content-Type": content_type} if content_type else {},
+                "body": response.text,
+            }
+        )
+        return response
@@ -36,7 +36,13 @@ def pause():
     console.input("\n[dim]Press Enter to continue...[/dim]")
 
 
-def select_from_list(options: list[str], prompt: str, default_index: int = 0) -> int:
+def select_from_list(
+    options: list[str],
+    prompt: str,
+    default_index: int = 0,
+    live_options: callable = None,
+    live_default: callable = None,
+) -> int:
     """
     Display an interactive menu where users can navigate with arrow keys.
 
@@ -44,15 +50,27 @@ def select_from_list(options: list[str], prompt: str, default_index: int = 0) ->
         options: List of options to display
         prompt: Header text for the menu
         default_index: Index to select by default
+        live_options: Optional callable returning the current labels (same
+            length as options), polled while the menu is displayed
+        live_default: Optional callable returning the index to pre-select
+            (or None), followed until the user moves the cursor
 
     Returns:
         Index of the selected option (0-based)
     """
     selected_index = max(0, min(default_index, len(options) - 1))
     start_index = 0
+    follow_default = live_default is not None
 
     def generate_renderable():
-        nonlocal start_index
+        nonlocal start_index, selected_index, options
+
+        if live_options:
+            options = live_options()
+        if follow_default:
+            index = live_default()
+            if index is not None:
+                selected_index = index
 
         # Calculate dynamic window size based on terminal height
         term_height = console.size.height
@@ -90,17 +108,23 @@ def select_from_list(options: list[str], prompt: str, default_index: int = 0) ->
 
         return Group(*lines)
 
-    with Live(generate_renderable(), refresh_per_second=10, transient=True) as live:
+    # The renderable is rebuilt on every refresh so live labels stay current
+    with Live(
+        get_renderable=generate_renderable, refresh_per_second=10, transient=True
+    ) as live:
         while True:
             key = readchar.readkey()
 
             if key == readchar.key.UP:
+                follow_default = False
                 selected_index = (selected_index - 1) % len(options)
-                live.update(generate_renderable())
+                live.refresh()
             elif key == readchar.key.DOWN:
+                follow_default = False
                 selected_index = (selected_index + 1) % len(options)
-                live.update(generate_renderable())
+                live.refresh()
             elif key == readchar.key.ENTER:
+                follow_default = False  # Freeze the choice for the last refresh
                 break
             elif key == readchar.key.CTRL_C:
                 raise KeyboardInterrupt("Menu cancelled by user")
@@ -1,6 +1,17 @@
+import hashlib
 import json
 import re
+import threading
+import time
+from pathlib import Path
 from curl_cffi import requests
+from platformdirs import user_data_dir
+
+# Last known copy of each remote config, served at startup while a
+# conditional request refreshes it in the background
+REMOTE_CACHE_DIR = (
+    Path(user_data_dir("AutoFlixCLI", "PaulExplorer")) / "remote_configs"
+)
 
 
 def strip_json_comments(json_str: str) -> str:
@@ -21,22 +32,107 @@ def strip_trailing_commas(json_str: str) -> str:
     return re.sub(r",\s*([\]}])", r"\1", json_str)
 
 
-def load_remote_jsonc(url: str, default: dict) -> dict:
-    """
-    Fetch a remote JSONC file, strip comments, and parse it.
-    Returns the default dictionary if fetching or parsing fails.
-    """
+def parse_jsonc(text: str) -> dict:
+    """Strip comments and trailing commas from a JSONC document and parse it."""
+    clean_json = strip_json_comments(text)
+    clean_json = strip_trailing_commas(clean_json)
+    return json.loads(clean_json)
+
+
+def _cache_path(url: str) -> Path:
+    return REMOTE_CACHE_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_cached(url: str) -> dict | None:
     try:
-        response = requests.get(url, impersonate="chrome", timeout=5)
+        with open(_cache_path(url), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _write_cached(url: str, entry: dict):
+    try:
+        REMOTE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_path(url), "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=4, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def _merge(data: dict, overrides: dict | None) -> dict:
+    """New config: data in its own key order, overrides applied on top."""
+    config = dict(data)
+    if overrides:
+        config.update(overrides)
+    return config
+
+
+def _refresh(url: str, cached: dict, overrides, on_update):
+    """Revalidate a cached remote config and apply the new version, if any."""
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = requests.get(url, headers=headers, impersonate="chrome", timeout=5)
+        if response.status_code == 304:
+            cached["fetched_at"] = time.time()
+            _write_cached(url, cached)
+            return
         response.raise_for_status()
+        data = parse_jsonc(response.text)
+    except Exception:
+        return  # Offline or broken upstream: keep serving the known copy
 
-        clean_json = strip_json_comments(response.text)
-        clean_json = strip_trailing_commas(clean_json)
+    _write_cached(
+        url,
+        {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "data": data,
+        },
+    )
+    if on_update:
+        on_update(_merge(data, overrides))
 
-        return json.loads(clean_json)
-    except Exception as e:
-        print(f"Warning: Failed to load remote config from {url}: {e}")
-        return default
+
+def load_remote_jsonc(
+    url: str, default: dict, overrides: dict = None, on_update=None
+) -> dict:
+    """
+    Return a remote JSONC config without waiting for the network.
+
+    The last copy fetched (or default on first run) is returned right away
+    and revalidated in a background thread with If-None-Match /
+    If-Modified-Since. A newer version is written to disk and handed, as a
+    new dict, to on_update, which swaps it in for the caller. The returned
+    dict is never modified, so lookups iterating it are never disturbed.
+
+    Args:
+        url: URL of the JSONC file
+        default: Config used until a copy has been downloaded once
+        overrides: Entries applied on top of every version (local config)
+        on_update: Optional callback(new_config), called from the refresh
+            thread; without it a newer version is used from the next run
+
+    Returns:
+        The config dict
+    """
+    cached = _read_cached(url)
+    config = _merge(cached["data"] if cached else default, overrides)
+
+    threading.Thread(
+        target=_refresh,
+        args=(url, cached, overrides, on_update),
+        name="autoflix-config-refresh",
+        daemon=True,
+    ).start()
+    return config
 
 
 def load_local_jsonc(file_path: str, default: dict = None) -> dict:
@@ -53,10 +149,7 @@ def load_local_jsonc(file_path: str, default: dict = None) -> dict:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        clean_json = strip_json_comments(content)
-        clean_json = strip_trailing_commas(clean_json)
-
-        return json.loads(clean_json)
+        return parse_jsonc(content)
     except Exception as e:
         print(f"Warning: Failed to load local config from {file_path}: {e}")
         return default or {}
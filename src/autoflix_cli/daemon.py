@@ -0,0 +1,304 @@
+"""
+Optional resident process keeping AutoFlix warm between launches.
+
+`autoflix --daemon` starts it: it owns the streaming proxy (failover groups
+included), the extraction engine (its HTTP session and connections to the
+player hosts) and what stream resolution keeps in memory (hop memo, player
+configs). Every `autoflix` launched while it runs sends stream resolutions
+to it and plays through its proxy, over a local socket (a Unix socket, or a
+named pipe on Windows) protected by a key only the user can read.
+
+Browsing is not delegated: catalogue sessions, provider origins and the
+HTTP cache still start in each `autoflix` (the last two from disk).
+
+A daemon that does not answer within DAEMON_TIMEOUT is no longer used: the
+CLI then does everything itself, as it does without a daemon.
+"""
+
+import getpass
+import os
+import secrets
+import sys
+import threading
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from platformdirs import user_data_dir
+
+DATA_DIR = Path(user_data_dir("AutoFlixCLI", "PaulExplorer"))
+KEY_FILE = DATA_DIR / "daemon.key"
+
+if sys.platform == "win32":
+    ADDRESS = rf"\\.\pipe\autoflix-daemon-{getpass.getuser()}"
+else:
+    ADDRESS = str(DATA_DIR / "daemon.sock")
+
+# Seconds to connect, or to get an answer on top of the resolution time
+DAEMON_TIMEOUT = 2
+
+
+def _read_key() -> bytes | None:
+    try:
+        return bytes.fromhex(KEY_FILE.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _create_key() -> bytes:
+    key = secrets.token_bytes(32)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(key.hex())
+    return key
+
+
+def _connect(authkey: bytes):
+    """
+    Client(ADDRESS), which has no timeout of its own: a frozen daemon still
+    accepts the connection but never completes the handshake.
+
+    Raises:
+        TimeoutError: If the daemon did not answer within DAEMON_TIMEOUT
+    """
+    result = {}
+
+    def connect():
+        try:
+            result["conn"] = Client(ADDRESS, authkey=authkey)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=connect, name="autoflix-daemon-connect", daemon=True)
+    thread.start()
+    thread.join(DAEMON_TIMEOUT)
+    if thread.is_alive():
+        raise TimeoutError(f"AutoFlix daemon did not answer within {DAEMON_TIMEOUT}s")
+    if "error" in result:
+        raise result["error"]
+    return result["conn"]
+
+
+class DaemonClient:
+    """Connection to a running daemon (one socket per calling thread)."""
+
+    def __init__(self, authkey: bytes):
+        self.authkey = authkey
+        self.alive = True  # False once the daemon failed to answer
+        self._local = threading.local()
+        info = self.call("ping")
+        self.pid = info["pid"]
+        self.proxy_url = info["proxy_url"]
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                conn = _connect(self.authkey)
+            except (OSError, EOFError):
+                self.alive = False
+                raise
+            self._local.conn = conn
+        return conn
+
+    def call(self, op: str, reply_timeout: float = DAEMON_TIMEOUT, **params) -> dict:
+        """
+        Send a request and wait for the daemon's answer.
+
+        Args:
+            op: Request name
+            reply_timeout: Seconds to wait for the answer
+            **params: Request fields
+
+        Raises:
+            DeadlineExceeded: If a resolution ran out of time in the daemon
+            RuntimeError: For any other error raised in the daemon
+            OSError, EOFError (DeadlineExceeded aside): If the daemon is gone or does not answer
+                (TimeoutError); the client is then no longer used
+        """
+        conn = self._connection()
+        try:
+            conn.send({"op": op, **params})
+            if not conn.poll(reply_timeout):
+                raise TimeoutError(
+                    f"AutoFlix daemon did not answer within {reply_timeout:.0f}s"
+                )
+            response = conn.recv()
+        except BaseException as e:
+            # Interrupted mid-exchange (Ctrl-C, daemon gone): this socket
+            # may hold a stale answer, use a new one next time
+            self._local.conn = None
+            conn.close()
+            if isinstance(e, (OSError, EOFError)):
+                self.alive = False
+            raise
+
+        if "error" in response:
+            if response.get("type") == "DeadlineExceeded":
+                from .scraping.extractors import DeadlineExceeded
+
+                raise DeadlineExceeded(response["error"])
+            raise RuntimeError(response["error"])
+        return response
+
+    def resolve(self, url: str, headers: dict, timeout: float, deadline=None) -> tuple:
+        """
+        Resolve a player URL in the daemon; returns (stream_url, subtitle_url).
+
+        Cancelling deadline (a local Deadline) aborts the resolution in the
+        daemon too.
+        """
+        request_id = secrets.token_hex(8)
+
+        def cancel():
+            try:
+                self.call("cancel", id=request_id)
+            except Exception:
+                pass  # Daemon gone: nothing left to cancel
+
+        if deadline is not None:
+            deadline.add_cancel_callback(cancel)
+        try:
+            response = self.call(
+                "resolve",
+                reply_timeout=timeout + DAEMON_TIMEOUT,
+                id=request_id,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+            )
+        finally:
+            if deadline is not None:
+                deadline.remove_cancel_callback(cancel)
+        return response["stream_url"], response["subtitle_url"]
+
+    def register_failover_group(self, sources: list) -> str:
+        """Register a failover group on the daemon's proxy; returns its URL."""
+        return self.call("failover", sources=sources)["url"]
+
+    def stop(self):
+        self.call("stop")
+
+
+_client = None
+_probed = False
+_lock = threading.Lock()
+
+
+def get_client() -> DaemonClient | None:
+    """
+    Connect to the daemon if one is running (probed once per process).
+    None once it stopped answering.
+    """
+    global _client, _probed
+    with _lock:
+        if not _probed:
+            _probed = True
+            authkey = _read_key()
+            if authkey and (sys.platform == "win32" or os.path.exists(ADDRESS)):
+                try:
+                    _client = DaemonClient(authkey)
+                except Exception:
+                    _client = None
+        if _client is not None and not _client.alive:
+            return None
+        return _client
+
+
+# Deadlines of the resolutions in progress, by request id (for "cancel")
+_running = {}
+_running_lock = threading.Lock()
+
+
+def _handle_request(request: dict) -> dict:
+    from . import proxy
+    from .scraping import player
+    from .scraping.extractors import Deadline
+
+    op = request.get("op")
+    if op == "ping":
+        return {"pid": os.getpid(), "proxy_url": proxy.PROXY_URL}
+    if op == "resolve":
+        request_id = request.get("id")
+        deadline = Deadline(request.get("timeout") or player.RESOLUTION_TIMEOUT)
+        with _running_lock:
+            _running[request_id] = deadline
+        try:
+            stream_url, subtitle_url = player.get_hls_link(
+                request["url"],
+                request.get("headers") or {},
+                return_subs=True,
+                deadline=deadline,
+            )
+        finally:
+            with _running_lock:
+                _running.pop(request_id, None)
+        return {"stream_url": stream_url, "subtitle_url": subtitle_url}
+    if op == "cancel":
+        with _running_lock:
+            deadline = _running.get(request.get("id"))
+        if deadline is not None:
+            deadline.cancel()
+        return {}
+    if op == "failover":
+        return {"url": proxy.register_failover_group(request["sources"])}
+    if op == "stop":
+        return {}
+    return {"error": f"Unknown request: {op}"}
+
+
+def _serve_connection(conn):
+    with conn:
+        while True:
+            try:
+                request = conn.recv()
+            except (EOFError, OSError):
+                return
+            try:
+                response = _handle_request(request)
+            except Exception as e:
+                response = {"error": str(e), "type": type(e).__name__}
+            try:
+                conn.send(response)
+            except OSError:
+                return  # Client went away (e.g. Ctrl-C)
+            if request.get("op") == "stop":
+                from . import proxy
+
+                proxy.stop_proxy_server()
+                if sys.platform != "win32":
+                    os.unlink(ADDRESS)
+                os._exit(0)
+
+
+def serve():
+    """Run the daemon in the foreground until stopped."""
+    from . import proxy
+    from .scraping import player  # Warm imports, configs and the engine
+
+    if get_client() is not None:
+        print(f"[*] AutoFlix daemon already running (pid {_client.pid})")
+        return
+
+    if sys.platform != "win32" and os.path.exists(ADDRESS):
+        os.unlink(ADDRESS)  # Left over by a daemon that died
+    authkey = _create_key()
+
+    proxy.start_proxy_server()
+    with Listener(ADDRESS, authkey=authkey) as listener:
+        if sys.platform != "win32":
+            os.chmod(ADDRESS, 0o600)
+        print(f"[*] AutoFlix daemon listening on {ADDRESS} (pid {os.getpid()})")
+        while True:
+            try:
+                conn = listener.accept()
+            except KeyboardInterrupt:
+                break
+            except Exception:
+                continue  # Bad authkey, aborted handshake...
+            threading.Thread(
+                target=_serve_connection,
+                args=(conn,),
+                name="autoflix-daemon-client",
+                daemon=True,
+            ).start()
+    proxy.stop_proxy_server()
@@ -9,6 +9,7 @@ from ..cli_utils import (
     print_success,
     get_user_input,
     clean_title,
+    pause,
 )
 from . import anime_sama as anime_sama_handler
 from ..scraping import anime_sama as anime_sama_scraper
@@ -152,7 +153,12 @@ def handle_anilist_continue():
         season = _auto_select_season(series.seasons, media_title, romaji_title)
         tracker.set_anilist_mapping("ArkAnime", series.title, media_id, season.title)
 
-        episodes = season.episodes
+        try:
+            episodes = season.episodes
+        except Exception as e:
+            print_error(f"Error loading episodes: {e}")
+            pause()
+            return
         if not episodes:
             print_warning("No episodes found.")
             return
@@ -13,6 +13,7 @@ from ..cli_utils import (
 from ..player_manager import play_video
 from ..tracker import tracker
 from ..anilist import anilist_client
+from ..prefetch import prefetcher
 from .playback import play_episode_flow
 import re
 
@@ -214,22 +215,49 @@ def handle_anime_sama():
             return  # Back
 
 
+def _resume_season_url(data) -> str:
+    anime_sama.get_website_url()
+    season_url = data["season_url"]
+    if season_url.startswith("/") or not season_url.startswith("http"):
+        season_url = anime_sama.website_origin.rstrip("/") + season_url
+    return season_url
+
+
+def prefetch_anime_sama(data):
+    """Load the season of a history entry and warm up its next episode."""
+    season_url = _resume_season_url(data)
+    season = prefetcher.load(
+        ("Anime-Sama", season_url), lambda: anime_sama.get_season(season_url)
+    )
+    langs = list(season.episodes.keys())
+    if not langs:
+        return
+
+    # The language menu defaults to the first one
+    episodes = season.episodes[langs[0]]
+    titles = [ep.title for ep in episodes]
+    if data["episode_title"] not in titles:
+        return
+    next_idx = titles.index(data["episode_title"]) + 1
+    if next_idx < len(episodes):
+        prefetcher.warm_players(
+            episodes[next_idx].players, {"Referer": anime_sama.website_origin}
+        )
+
+
 def resume_anime_sama(data):
     """Resume Anime-Sama playback."""
     print_info(f"Resuming [cyan]{data['series_title']}[/cyan]...")
 
     # We need to reload just the season to find the episode link/player
     # We have season_url saved.
-    anime_sama.get_website_url()
-
-    # Re-fetch season
-    season_url = data["season_url"]
-    if season_url.startswith("/") or not season_url.startswith("http"):
-        season_url = anime_sama.website_origin.rstrip("/") + season_url
+    season_url = _resume_season_url(data)
 
     print_info(f"Loading Season: {season_url}")
     try:
-        season = anime_sama.get_season(season_url)
+        season = prefetcher.take(
+            ("Anime-Sama", season_url), lambda: anime_sama.get_season(season_url)
+        )
     except Exception as e:
         print_error(f"Could not load season: {e}")
         return
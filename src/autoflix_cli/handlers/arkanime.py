@@ -15,6 +15,7 @@ from ..player_manager import play_video
 from ..tracker import tracker
 from .playback import play_episode_flow
 from ..anilist import anilist_client
+from ..prefetch import prefetcher
 import re
 
 
@@ -223,7 +224,14 @@ def handle_arkanime():
         )
         season = series.seasons[season_idx]
 
-        if not season.episodes:
+        try:
+            episodes = season.episodes
+        except Exception as e:
+            print_error(f"Error loading episodes: {e}")
+            pause()
+            continue
+
+        if not episodes:
             print_warning("No episodes found.")
             pause()
             continue
@@ -264,6 +272,31 @@ def handle_arkanime():
                 break
 
 
+def prefetch_arkanime(data):
+    """Load the series of a history entry and warm up its next episode."""
+    arkanime.get_website_url()
+    content = prefetcher.load(
+        ("ArkAnime", data["series_url"]),
+        lambda: arkanime.get_content(data["series_url"]),
+    )
+    if isinstance(content, ArkMovie):
+        return
+
+    for season in content.seasons:
+        if str(season.id) == data.get("season_url") or season.title == data.get(
+            "season_title"
+        ):
+            titles = [ep.title for ep in season.episodes]
+            if data["episode_title"] in titles:
+                next_idx = titles.index(data["episode_title"]) + 1
+                if next_idx < len(season.episodes):
+                    prefetcher.warm_players(
+                        season.episodes[next_idx].players,
+                        {"Referer": arkanime.website_origin},
+                    )
+            return
+
+
 def resume_arkanime(data):
     """Resume ArkAnime playback."""
     arkanime.get_website_url()
@@ -271,7 +304,10 @@ def resume_arkanime(data):
     print_info(f"Resuming [cyan]{data['series_title']}[/cyan]...")
 
     try:
-        content = arkanime.get_content(data["series_url"])
+        content = prefetcher.take(
+            ("ArkAnime", data["series_url"]),
+            lambda: arkanime.get_content(data["series_url"]),
+        )
     except Exception as e:
         print_error(f"Could not load content: {e}")
         pause()
@@ -315,7 +351,14 @@ def resume_arkanime(data):
         pause()
         return
 
-    if not season.episodes:
+    try:
+        episodes = season.episodes
+    except Exception as e:
+        print_error(f"Could not load episodes: {e}")
+        pause()
+        return
+
+    if not episodes:
         print_warning("No episodes found in season.")
         pause()
         return
@@ -12,6 +12,7 @@ from ..cli_utils import (
 )
 from ..player_manager import play_video
 from ..tracker import tracker
+from ..prefetch import prefetcher
 from .playback import play_episode_flow
 
 
@@ -160,21 +161,50 @@ def handle_coflix():
                     break
 
 
+def _resolve_url(u):
+    if not u:
+        return ""
+    if u.startswith("http"):
+        return u
+    return coflix.website_origin.rstrip("/") + "/" + u.lstrip("/")
+
+
+def prefetch_coflix(data):
+    """Load the content of a history entry and warm up its next episode."""
+    coflix.get_website_url()
+    series_url = _resolve_url(data["series_url"])
+    headers = {"Referer": "https://lecteurvideo.com/"}
+    content = prefetcher.load(
+        ("Coflix", series_url), lambda: coflix.get_content(series_url)
+    )
+    if isinstance(content, CoflixMovie):
+        prefetcher.warm_players(content.players, headers)
+        return
+
+    for season in content.seasons:
+        if season.title != data.get("season_title", ""):
+            continue
+        numbers = [ep.title.split(" ")[-1] for ep in season.episodes]
+        saved_number = data["episode_title"].split(" ")[-1]
+        if saved_number in numbers:
+            next_idx = numbers.index(saved_number) + 1
+            if next_idx < len(season.episodes):
+                url = season.episodes[next_idx].url
+                episode = prefetcher.load(
+                    ("Coflix", url), lambda: coflix.get_episode(url)
+                )
+                prefetcher.warm_players(episode.players, headers)
+        return
+
+
 def resume_coflix(data):
     """Resume Coflix playback."""
     # Ensure origin is set so we can resolve relative URLs
     coflix.get_website_url()
 
-    def resolve_url(u):
-        if not u:
-            return ""
-        if u.startswith("http"):
-            return u
-        return coflix.website_origin.rstrip("/") + "/" + u.lstrip("/")
-
     # Resolve URLs in data
-    data["series_url"] = resolve_url(data["series_url"])
-    data["season_url"] = resolve_url(data["season_url"])
+    data["series_url"] = _resolve_url(data["series_url"])
+    data["season_url"] = _resolve_url(data["season_url"])
 
     print_info(f"Resuming [cyan]{data['series_title']}[/cyan]...")
 
@@ -182,7 +212,10 @@ def resume_coflix(data):
     if data["season_title"] == "Movie":
         print_info(f"Loading Movie: {data['series_url']}")
         try:
-            content = coflix.get_content(data["series_url"])
+            content = prefetcher.take(
+                ("Coflix", data["series_url"]),
+                lambda: coflix.get_content(data["series_url"]),
+            )
         except Exception as e:
             print_error(f"Could not load movie: {e}")
             pause()
@@ -216,7 +249,10 @@ def resume_coflix(data):
     # Handle Series
     print_info(f"Loading Series: {data['series_url']}")
     try:
-        content = coflix.get_content(data["series_url"])
+        content = prefetcher.take(
+            ("Coflix", data["series_url"]),
+            lambda: coflix.get_content(data["series_url"]),
+        )
     except Exception as e:
         print_error(f"Could not load series: {e}")
         pause()
@@ -274,7 +310,10 @@ def resume_coflix(data):
         headers = {"Referer": "https://lecteurvideo.com/"}
 
         try:
-            ep_details = coflix.get_episode(selected_episode.url)
+            ep_details = prefetcher.take(
+                ("Coflix", selected_episode.url),
+                lambda: coflix.get_episode(selected_episode.url),
+            )
         except Exception as e:
             print_error(f"Error loading episode: {e}")
             pause()
@@ -1,4 +1,4 @@
-from ..scraping.goldenanime import goldenanime
+from ..scraping.goldenanime import goldenanime, scraper
 from ..scraping.subtitles import subtitle_extractor
 from ..cli_utils import (
     select_from_list,
@@ -11,25 +11,35 @@ from ..cli_utils import (
     console,
 )
 from ..player_manager import play_video
+from ..stream_probe import rank_streams
 from ..tracker import tracker
 from ..languages import get_language_label
 from ..anilist import anilist_client
 from ..scraping import player as player_scraper
 
-from curl_cffi import requests
 import re
 
 
+def _is_direct(r) -> bool:
+    type_ = r["type"].lower()
+    return type_ == "m3u8" or "m3u8" in r["url"] or type_ == "mp4"
+
+
+def _stream_headers(r) -> dict:
+    """Headers the CDN of a GoldenAnime result expects."""
+    return r.get("headers") or {"Referer": goldenanime.referer + "/"}
+
+
 def search_imdb_id(title: str):
     import urllib.parse
 
     try:
         url_series = f"https://v3-cinemeta.strem.io/catalog/series/top/search={urllib.parse.quote(title)}.json"
-        r_series = requests.get(url_series, timeout=5, impersonate="chrome").json()
+        r_series = scraper.get(url_series, timeout=5).json()
         metas = r_series.get("metas", [])
 
         url_movie = f"https://v3-cinemeta.strem.io/catalog/movie/top/search={urllib.parse.quote(title)}.json"
-        r_movie = requests.get(url_movie, timeout=5, impersonate="chrome").json()
+        r_movie = scraper.get(url_movie, timeout=5).json()
         metas.extend(r_movie.get("metas", []))
 
         if metas:
@@ -169,20 +179,33 @@ def _flow_goldenanime_stream(
         skipped = len(results) - len(valid_results)
         print_info(f"[dim]Skipped {skipped} unsupported stream(s).[/dim]")
 
-    while True:
-        choice_idx = select_from_list(
+    # Probe direct streams (concurrently): dead links sink to the bottom,
+    # fastest first
+    with console.status("Checking stream health..."):
+        ranking = rank_streams(
             [
-                f"{r['source']} - {r['quality']} ({r['type']})"
+                (r["url"], _stream_headers(r)) if _is_direct(r) else None
                 for r in valid_results
             ]
-            + ["← Back"],
-            "📺 Select Stream:",
         )
+    valid_results = [valid_results[i] for i, _ in ranking]
+    probes = [probe for _, probe in ranking]
+
+    while True:
+        options = []
+        for r, probe in zip(valid_results, probes):
+            label = f"{r['source']} - {r['quality']} ({r['type']})"
+            if probe:
+                label += f"  {'✓' if probe.ok else '✗'} {probe.summary()}"
+            options.append(label)
+
+        choice_idx = select_from_list(options + ["← Back"], "📺 Select Stream:")
 
         if choice_idx == len(valid_results):  # Back
             return
 
         selection = valid_results[choice_idx]
+        probe = probes[choice_idx]
 
         # Subtitles logic
         subtitle_tracks = None
@@ -283,17 +306,13 @@ def _flow_goldenanime_stream(
 
         print_info(f"Loading stream from [cyan]{selection['source']}[/cyan]...")
 
-        headers = selection.get("headers") or {"Referer": goldenanime.referer + "/"}
+        headers = _stream_headers(selection)
 
         display_title = title if title else f"AniList ID {anilist_id}"
 
         final_url = selection["url"]
 
-        is_direct = (
-            selection["type"].lower() == "m3u8"
-            or "m3u8" in final_url
-            or selection["type"].lower() == "mp4"
-        )
+        is_direct = _is_direct(selection)
 
         success = play_video(
             final_url,
@@ -303,6 +322,7 @@ def _flow_goldenanime_stream(
             subtitles=subtitle_tracks,
             is_direct=is_direct,
             is_mp4=selection["type"].lower() == "mp4",
+            probe=probe is None,  # Embeds are not probed by rank_streams
         )
 
         if success:
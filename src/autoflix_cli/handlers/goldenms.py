@@ -1,8 +1,8 @@
 import urllib.parse
-from curl_cffi import requests
-from ..scraping.goldenms import goldenms_extractor
+from ..scraping.goldenms import goldenms_extractor, scraper
 from ..scraping.subtitles import subtitle_extractor
 from ..cli_utils import (
+    console,
     select_from_list,
     print_header,
     print_info,
@@ -12,6 +12,7 @@ from ..cli_utils import (
     pause,
 )
 from ..player_manager import play_video
+from ..stream_probe import rank_streams
 from ..tracker import tracker
 from ..languages import get_language_label
 from ..scraping import player as player_scraper
@@ -24,7 +25,7 @@ def search_cinemeta(title: str, is_movie: bool):
     url = f"https://v3-cinemeta.strem.io/catalog/{media_type}/top/search={urllib.parse.quote(title)}.json"
 
     try:
-        r = requests.get(url, timeout=10, impersonate="chrome").json()
+        r = scraper.get(url, timeout=10).json()
         metas = r.get("metas", [])
         return metas
     except Exception as e:
@@ -37,7 +38,7 @@ def get_cinemeta_details(imdb_id: str, is_movie: bool):
     media_type = "movie" if is_movie else "series"
     url = f"https://v3-cinemeta.strem.io/meta/{media_type}/{imdb_id}.json"
     try:
-        r = requests.get(url, timeout=10, impersonate="chrome").json()
+        r = scraper.get(url, timeout=10).json()
         return r.get("meta", {})
     except Exception as e:
         print_warning(f"Error fetching Cinemeta details: {e}")
@@ -57,6 +58,33 @@ def _is_valid(r):
     )
 
 
+def _is_direct(r) -> bool:
+    url = r["url"].lower()
+    type_ = r["type"].upper()
+    return ".m3u8" in url or ".mp4" in url or type_ == "MP4" or type_ == "M3U8"
+
+
+def _stream_headers(r) -> dict:
+    """Headers the CDN of a GoldenMS result expects."""
+    headers = dict(r.get("headers") or {})
+    headers.setdefault(
+        "User-Agent",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    )
+
+    # MoviesAPI sources already ship their Referer/Origin via selection headers;
+    # ensure they're present (Vidora CDN rejects requests without them).
+    if "moviesapi" in r["source"].lower():
+        headers.setdefault("Referer", f"{goldenms_extractor.moviesapi_api}/")
+        headers.setdefault("Origin", goldenms_extractor.moviesapi_api)
+
+    # Videasy MP4/HLS CDNs require the Videasy player as referer/origin.
+    if "videasy" in r["source"].lower():
+        headers.setdefault("Referer", "https://player.videasy.to/")
+        headers.setdefault("Origin", "https://player.videasy.to")
+    return headers
+
+
 def handle_goldenms():
     """Main entry point for the GoldenMS provider (Movies & Series)."""
     print_header("GoldenMS (Movies & Series)")
@@ -198,20 +226,33 @@ def _flow_goldenms_stream(
         skipped = len(results) - len(valid_results)
         print_info(f"[dim]Skipped {skipped} unsupported stream(s).[/dim]")
 
-    while True:
-        choice_idx = select_from_list(
+    # Probe direct streams (concurrently): dead links sink to the bottom,
+    # fastest first
+    with console.status("Checking stream health..."):
+        ranking = rank_streams(
             [
-                f"{r['source']} - {r['quality']} ({r['type']})"
+                (r["url"], _stream_headers(r)) if _is_direct(r) else None
                 for r in valid_results
             ]
-            + ["← Back"],
-            "📺 Select Stream:",
         )
+    valid_results = [valid_results[i] for i, _ in ranking]
+    probes = [probe for _, probe in ranking]
+
+    while True:
+        options = []
+        for r, probe in zip(valid_results, probes):
+            label = f"{r['source']} - {r['quality']} ({r['type']})"
+            if probe:
+                label += f"  {'✓' if probe.ok else '✗'} {probe.summary()}"
+            options.append(label)
+
+        choice_idx = select_from_list(options + ["← Back"], "📺 Select Stream:")
 
         if choice_idx == len(valid_results):
             return
 
         selection = valid_results[choice_idx]
+        probe = probes[choice_idx]
 
         # Subtitles logic
         subtitle_tracks = None
@@ -268,14 +309,7 @@ def _flow_goldenms_stream(
                         pause()
 
         final_url = selection["url"]
-        type_ = selection["type"].upper()
-
-        is_direct = (
-            ".m3u8" in final_url.lower()
-            or ".mp4" in final_url.lower()
-            or type_ == "MP4"
-            or type_ == "M3U8"
-        )
+        is_direct = _is_direct(selection)
 
         # Player Support
         if player_scraper.is_supported(final_url) and not is_direct:
@@ -300,22 +334,7 @@ def _flow_goldenms_stream(
 
         print_info(f"Starting playback: [cyan]{display_title}[/cyan]")
 
-        headers = dict(selection.get("headers") or {})
-        headers.setdefault(
-            "User-Agent",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
-
-        # MoviesAPI sources already ship their Referer/Origin via selection headers;
-        # ensure they're present (Vidora CDN rejects requests without them).
-        if "moviesapi" in selection["source"].lower():
-            headers.setdefault("Referer", f"{goldenms_extractor.moviesapi_api}/")
-            headers.setdefault("Origin", goldenms_extractor.moviesapi_api)
-
-        # Videasy MP4/HLS CDNs require the Videasy player as referer/origin.
-        if "videasy" in selection["source"].lower():
-            headers.setdefault("Referer", "https://player.videasy.to/")
-            headers.setdefault("Origin", "https://player.videasy.to")
+        headers = _stream_headers(selection)
 
         success = play_video(
             final_url,
@@ -324,6 +343,7 @@ def _flow_goldenms_stream(
             subtitle_url=None,
             subtitles=subtitle_tracks,
             is_direct=is_direct,
+            probe=probe is None,  # Embeds are not probed by rank_streams
         )
 
         if success:
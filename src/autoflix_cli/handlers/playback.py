@@ -3,10 +3,126 @@ from ..cli_utils import (
     print_info,
     print_warning,
     print_error,
+    console,
 )
-from ..player_manager import play_video
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ..player_manager import (
+    play_video,
+    resolve_stream,
+    apply_url_replacements,
+    get_stream_headers,
+)
+from ..stream_probe import probe_stream, rank_key
 from ..tracker import tracker
+from ..prefetch import prefetcher
 from ..scraping import player
+from ..scraping.extractors import Deadline
+
+# Number of mirrors resolved at the same time
+MAX_PARALLEL_RESOLUTIONS = 6
+
+
+class MirrorResolver:
+    """
+    Resolve and probe every mirror of an episode in the background as soon
+    as it is chosen, so the menu can show which ones work and how fast they
+    are.
+    """
+
+    def __init__(self, players_list: list, headers: dict):
+        self.players = players_list
+        self.urls = [apply_url_replacements(p.url) for p in players_list]
+        self.headers = headers
+        self._lock = threading.Lock()
+        # Per mirror: "pending", "ok" or "failed"
+        self.status = ["pending"] * len(players_list)
+        self.latency = [None] * len(players_list)
+        self.streams = [None] * len(players_list)
+        self.probes = [None] * len(players_list)
+        self.deadlines = [None] * len(players_list)
+        self._closed = False
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_PARALLEL_RESOLUTIONS, len(players_list))),
+            thread_name_prefix="autoflix-resolve",
+        )
+        self.futures = [
+            self._executor.submit(self._resolve, i) for i in range(len(players_list))
+        ]
+
+    def _resolve(self, index: int):
+        start = time.perf_counter()
+        url = self.urls[index]
+        probe = None
+        deadline = Deadline(player.RESOLUTION_TIMEOUT)
+        with self._lock:
+            self.deadlines[index] = deadline
+            if self._closed:
+                deadline.cancel()
+        try:
+            stream_url, subtitle_url = resolve_stream(url, self.headers, deadline)
+            if stream_url:
+                probe = probe_stream(stream_url, get_stream_headers(url, self.headers))
+        except Exception:
+            stream_url, subtitle_url = None, None
+        with self._lock:
+            self.latency[index] = time.perf_counter() - start
+            self.probes[index] = probe
+            if stream_url and probe and probe.ok:
+                self.streams[index] = (stream_url, subtitle_url)
+                self.status[index] = "ok"
+            else:
+                self.status[index] = "failed"
+
+    def mark_failed(self, index: int):
+        """The player could not play this mirror: stop suggesting it."""
+        with self._lock:
+            self.status[index] = "failed"
+
+    def label(self, index: int, base: str) -> str:
+        status = self.status[index]
+        probe = self.probes[index]
+        if status == "ok":
+            speed = probe.throughput / 1e6
+            return f"{base}  ✓ {self.latency[index]:.1f}s · {speed:.1f} MB/s"
+        if status == "failed":
+            if probe and not probe.ok:
+                return f"{base}  ✗ {probe.summary()}"
+            return f"{base}  ✗ unavailable"
+        return f"{base}  … resolving"
+
+    def best(self):
+        """Index of the best working mirror, or None if none is known yet."""
+        with self._lock:
+            working = [i for i, s in enumerate(self.status) if s == "ok"]
+            if not working:
+                return None
+            return min(working, key=lambda i: rank_key(self.probes[i]))
+
+    def wait(self, index: int):
+        """Wait for a mirror's resolution, return (stream_url, subtitle_url) or None."""
+        self.futures[index].result()
+        return self.streams[index] if self.status[index] == "ok" else None
+
+    def fallbacks(self, index: int) -> list:
+        """Other working mirrors as (embed_url, stream_url), best first."""
+        with self._lock:
+            working = [
+                i for i, s in enumerate(self.status) if s == "ok" and i != index
+            ]
+            working.sort(key=lambda i: rank_key(self.probes[i]))
+            return [(self.urls[i], self.streams[i][0]) for i in working]
+
+    def close(self):
+        """Drop resolutions that have not started yet, abort running ones."""
+        with self._lock:
+            self._closed = True
+            deadlines = [d for d in self.deadlines if d is not None]
+        for deadline in deadlines:
+            deadline.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 def play_episode_flow(
@@ -23,10 +139,11 @@ def play_episode_flow(
     """
     Handle the playback flow for a single episode:
     1. Check for players.
-    2. Ask user to select a player.
-    3. Play the video.
-    4. Save progress if successful.
-    5. Call optional AniList callback if successful.
+    2. Resolve every supported player in the background.
+    3. Ask user to select a player (best working one pre-selected).
+    4. Play the video.
+    5. Save progress if successful.
+    6. Call optional AniList callback if successful.
 
     Returns:
         bool: True if playback was successful, False otherwise (back/cancel).
@@ -45,61 +162,91 @@ def play_episode_flow(
     if headers is None:
         headers = {}
 
-    while True:
-        # Player Selection Menu
-        player_options = [
-        ]
-        for p in supported_players:
-            try:
-                player_options.append(f"{p.name} : {p.url.split('/')[2].split('.')[-2]}")
-            except:
-                player_options.append(p.name)
-        player_options.append("← Back")
-
-        player_idx = select_from_list(
-            player_options,
-            "🎮 Select Player:",
-        )
-
-        if player_idx == len(supported_players):  # Back selected
-            return False
+    # The Resume entry may already have started resolving these mirrors
+    resolver = prefetcher.take_resolver(supported_players, headers)
+    if resolver is None:
+        resolver = MirrorResolver(supported_players, headers)
+
+    base_options = []
+    for p in supported_players:
+        try:
+            base_options.append(f"{p.name} : {p.url.split('/')[2].split('.')[-2]}")
+        except:
+            base_options.append(p.name)
+
+    def current_options():
+        labels = [resolver.label(i, base) for i, base in enumerate(base_options)]
+        return labels + ["← Back"]
+
+    try:
+        while True:
+            # Player Selection Menu, updated as mirrors get resolved
+            player_idx = select_from_list(
+                current_options(),
+                "🎮 Select Player:",
+                live_options=current_options,
+                live_default=resolver.best,
+            )
 
-        selected_player = supported_players[player_idx]
+            if player_idx == len(supported_players):  # Back selected
+                return False
 
-        # Construct title for player window
-        window_title = f"{series_title} - {season_title} - {episode.title}"
+            selected_player = supported_players[player_idx]
 
-        success = play_video(
-            selected_player.url,
-            headers=headers,
-            title=window_title,
-        )
+            try:
+                if resolver.status[player_idx] == "pending":
+                    with console.status("Getting stream URL..."):
+                        resolved_stream = resolver.wait(player_idx)
+                else:
+                    resolved_stream = resolver.wait(player_idx)
+            except KeyboardInterrupt:
+                # Back to the episodes, like a Ctrl-C in play_video
+                resolver.close()
+                print_warning("Stream resolution cancelled.")
+                return False
 
-        if success:
-            # Save Local Progress
-
-            tracker.save_progress(
-                provider=provider_name,
-                series_title=series_title,
-                season_title=season_title,
-                episode_title=episode.title,
-                series_url=series_url,
-                season_url=season_url,
-                episode_url=episode.url if hasattr(episode, "url") else "",
-                logo_url=logo_url,
+            # Construct title for player window
+            window_title = f"{series_title} - {season_title} - {episode.title}"
+
+            # Failed background resolutions are retried (and that stream
+            # probed) by play_video itself; working ones were probed already
+            success = play_video(
+                selected_player.url,
+                headers=headers,
+                title=window_title,
+                resolved_stream=resolved_stream,
+                probe=resolved_stream is None,
+                fallback_streams=resolver.fallbacks(player_idx),
             )
 
-            # AniList Hook
-            if anilist_callback:
-                anilist_callback()
-
-            return True
-        else:
-            # Playback failed
-            retry = select_from_list(
-                ["Try another server/player", "← Back to main menu"],
-                "What would you like to do?",
-            )
-            if retry == 1:  # Back
-                return False
-            # Loop continues to select list
+            if success:
+                # Save Local Progress
+
+                tracker.save_progress(
+                    provider=provider_name,
+                    series_title=series_title,
+                    season_title=season_title,
+                    episode_title=episode.title,
+                    series_url=series_url,
+                    season_url=season_url,
+                    episode_url=episode.url if hasattr(episode, "url") else "",
+                    logo_url=logo_url,
+                )
+
+                # AniList Hook
+                if anilist_callback:
+                    anilist_callback()
+
+                return True
+            else:
+                resolver.mark_failed(player_idx)
+                # Playback failed
+                retry = select_from_list(
+                    ["Try another server/player", "← Back to main menu"],
+                    "What would you like to do?",
+                )
+                if retry == 1:  # Back
+                    return False
+                # Loop continues to select list
+    finally:
+        resolver.close()
@@ -1,4 +1,5 @@
 from .tracker import tracker
+from .providers_registry import registry
 from .cli_utils import (
     clear_screen,
     print_header,
@@ -6,28 +7,12 @@ from .cli_utils import (
     select_from_list,
     print_success,
 )
-from .handlers import anime_sama, coflix, french_stream, wiflix, goldenanime, goldenms, arkanime
 
 
 def handle_resume(data):
     """Dispatch resume to provider."""
-    provider = data["provider"]
-    if provider == "Anime-Sama":
-        anime_sama.resume_anime_sama(data)
-    elif provider == "Coflix":
-        coflix.resume_coflix(data)
-    elif provider == "French-Stream":
-        french_stream.resume_french_stream(data)
-    elif provider == "Wiflix":
-        print_warning(
-            "Resume for Wiflix not manually implemented here (usually direct)."
-        )
-    elif provider == "GoldenAnime":
-        goldenanime.resume_goldenanime(data)
-    elif provider == "GoldenMS":
-        goldenms.resume_goldenms(data)
-    elif provider == "ArkAnime":
-        arkanime.resume_arkanime(data)
+    if not registry.resume(data):
+        print_warning(f"Resume is not available for {data['provider']}.")
 
 
 def handle_history():
@@ -10,27 +10,29 @@ from .cli_utils import (
     pause,
     console,
 )
-from .update_checker import check_update
+from .update_checker import check_update, start_update_check
 from .tracker import tracker
 from .providers_registry import registry
+from .prefetch import prefetcher
 from .languages import LANGUAGES, get_language_display, get_all_languages
-from .player_manager import PLAYERS, get_player_display, get_all_players
-from .handlers import (
-    anime_sama,
-    coflix,
-    french_stream,
-    wiflix,
-    anilist,
-    goldenanime,
-    goldenms,
-    arkanime,
-)
 from . import history_ui
-from . import proxy
+import argparse
 import sys
 import os
 import signal
 
+# The player manager and the proxy pull in curl_cffi, Flask,
+# BeautifulSoup, jsbeautifier... Like the provider handlers (see
+# providers_registry), they are imported on first use so the home menu
+# shows up without them.
+
+
+def stop_proxy_server():
+    """Stop the proxy if it was ever imported (and so possibly started)."""
+    proxy = sys.modules.get(f"{__package__}.proxy")
+    if proxy is not None:
+        proxy.stop_proxy_server()
+
 
 def check_language_setup():
     """Verify if a language is set, if not, prompt for first setup."""
@@ -52,51 +54,72 @@ def check_language_setup():
 
 
 def main():
-    # Register Providers
-    registry.register(
-        "🎌 Anime-Sama (Anime and animated movies)",
-        anime_sama.handle_anime_sama,
-        supported_languages=["fr"],
-    )
-    registry.register(
-        "⛩️ ArkAnime (Anime & Animations)",
-        arkanime.handle_arkanime,
-        supported_languages=["fr", "en"], # Assuming multi or depending on ArkAnime source
+    parser = argparse.ArgumentParser(prog="autoflix")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Report the import cost of each module at startup and exit",
     )
-    registry.register(
-        "✨ GoldenAnime (VO and Subtitles)",
-        goldenanime.handle_goldenanime,
-        supported_languages=None,
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run the background daemon (proxy, warm stream resolution) "
+        "used by later launches",
     )
-    registry.register(
-        "🌟 GoldenMS (Movies & Series)",
-        goldenms.handle_goldenms,
-        supported_languages=None,
+    parser.add_argument(
+        "--stop-daemon", action="store_true", help="Stop the background daemon"
     )
-    registry.register(
-        "🎬 Coflix (Series and movies)",
-        coflix.handle_coflix,
-        supported_languages=["fr"],
-    )
-    registry.register(
-        "🇫🇷 French-Stream (Series and movies)",
-        french_stream.handle_french_stream,
-        supported_languages=["fr"],
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Browse searches and series from the HTTP cache only, even if "
+        "outdated; other provider pages fail (streams are still resolved online)",
     )
+    args = parser.parse_args()
 
-    # Check for updates
-    if check_update():
-        pause()
+    if args.daemon:
+        from .daemon import serve
+
+        serve()
+        return
+
+    if args.stop_daemon:
+        from .daemon import get_client
+
+        client = get_client()
+        if client is None:
+            print_info("No AutoFlix daemon is running.")
+        else:
+            client.stop()
+            print_success(f"AutoFlix daemon (pid {client.pid}) stopped.")
+        return
+
+    if args.startup_profile:
+        from .startup_profile import print_startup_profile
+
+        print_startup_profile()
+        return
+
+    if args.offline:
+        from .scraping.http_cache import http_cache
+
+        http_cache.offline = True
+
+    # Register Providers (imported only when chosen or resumed)
+    registry.load_plugins()
+
+    # Check for updates in the background; the notice shows on a menu render
+    start_update_check()
 
     # Check for language setup
     check_language_setup()
 
-    # Start Proxy Server
-    proxy.start_proxy_server()
+    # The proxy server is started by the player manager on first playback
 
     while True:
         clear_screen()
         print_header("AutoFlix CLI - Home")
+        check_update()
 
         # 1. Continue Watching (History)
         last_watch = tracker.get_last_global()
@@ -138,6 +161,9 @@ def main():
             menu_items.append(resume_text)
             resume_idx = 0
 
+            # Load the entry and resolve its next episode while the menu is up
+            registry.prefetch(last_watch)
+
         # 2. Continue from AniList
         if tracker.get_anilist_token():
             menu_items.append("▶ Continue from AniList")
@@ -161,9 +187,15 @@ def main():
 
         if last_watch and choice_idx == resume_idx:
             history_ui.handle_resume(last_watch)
+            prefetcher.cancel()
             continue
 
+        # Something else was chosen: release the mirrors resolved for Resume
+        prefetcher.cancel()
+
         if choice_idx == anilist_resume_idx:
+            from .handlers import anilist
+
             anilist.handle_anilist_continue()
             continue
 
@@ -183,6 +215,8 @@ def main():
             continue
 
         if choice_idx == settings_idx:
+            from .player_manager import get_player_display, get_all_players
+
             # Settings menu
             while True:
                 clear_screen()
@@ -237,7 +271,7 @@ def main():
 
         # Exit
         print_success("Goodbye!")
-        proxy.stop_proxy_server()
+        stop_proxy_server()
         os._exit(0)
 
 
@@ -246,5 +280,5 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\nGoodbye!")
-        proxy.stop_proxy_server()
+        stop_proxy_server()
         os._exit(0)
@@ -0,0 +1,229 @@
+"""
+Minimal ISO-BMFF (MP4) parsing used by the proxy.
+
+Only what is needed to find the ``moov`` box of a remote file and to build a
+keyframe -> byte offset index from its sample tables. No external dependency.
+"""
+
+import struct
+
+
+def iter_boxes(data: bytes, start: int = 0, end: int = None):
+    """
+    Iterate over the boxes found in data[start:end].
+
+    Yields:
+        (box_type, offset, header_size, box_size) tuples. Offsets are
+        relative to ``data``. A size of 0 means "until the end".
+    """
+    end = len(data) if end is None else end
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack(">I4s", data[pos : pos + 8])
+        header = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack(">Q", data[pos + 8 : pos + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield box_type, pos, header, size
+        pos += size
+
+
+def read_box_header(data: bytes):
+    """Parse a single box header at the start of data -> (type, header, size)."""
+    if len(data) < 8:
+        return None
+    for box_type, _, header, size in iter_boxes(data, 0, len(data)):
+        return box_type, header, size
+    # Box larger than the buffer: parse the header by hand
+    size, box_type = struct.unpack(">I4s", data[:8])
+    if size == 1 and len(data) >= 16:
+        return box_type, 16, struct.unpack(">Q", data[8:16])[0]
+    return box_type, 8, size
+
+
+def locate_moov(head: bytes, total_size: int):
+    """
+    Look for the moov box using the first bytes of the file.
+
+    Args:
+        head: The first bytes of the file
+        total_size: Full size of the file
+
+    Returns:
+        ("found", offset, size) if the moov box starts in ``head``,
+        ("next", offset) if the top-level box at ``offset`` lies beyond
+        ``head`` and must be fetched to continue the search, or None.
+    """
+    pos = 0
+    while pos + 8 <= len(head):
+        parsed = read_box_header(head[pos:])
+        if not parsed:
+            return None
+        box_type, _, size = parsed
+        if size == 0:
+            size = total_size - pos
+        if box_type == b"moov":
+            return "found", pos, size
+        pos += size
+    if pos < total_size:
+        return "next", pos
+    return None
+
+
+def _full_box(data: bytes, offset: int, header: int) -> int:
+    """Skip the version/flags field of a FullBox, return the payload offset."""
+    return offset + header + 4
+
+
+def _child(data: bytes, offset: int, header: int, size: int, box_type: bytes):
+    for child_type, child_offset, child_header, child_size in iter_boxes(
+        data, offset + header, offset + size
+    ):
+        if child_type == box_type:
+            return child_offset, child_header, child_size
+    return None
+
+
+def _parse_track(moov: bytes, offset: int, header: int, size: int):
+    """Return the sample tables of a video track, or None for other tracks."""
+    mdia = _child(moov, offset, header, size, b"mdia")
+    if not mdia:
+        return None
+
+    hdlr = _child(moov, *mdia, b"hdlr")
+    if not hdlr:
+        return None
+    handler_pos = _full_box(moov, hdlr[0], hdlr[1]) + 4  # skip pre_defined
+    if moov[handler_pos : handler_pos + 4] != b"vide":
+        return None
+
+    mdhd = _child(moov, *mdia, b"mdhd")
+    if not mdhd:
+        return None
+    version = moov[mdhd[0] + mdhd[1]]
+    pos = _full_box(moov, mdhd[0], mdhd[1])
+    pos += 16 if version == 1 else 8  # creation + modification times
+    timescale = struct.unpack(">I", moov[pos : pos + 4])[0] or 1
+
+    minf = _child(moov, *mdia, b"minf")
+    stbl = _child(moov, *minf, b"stbl") if minf else None
+    if not stbl:
+        return None
+
+    tables = {}
+    for table_type, table_offset, table_header, _ in iter_boxes(
+        moov, stbl[0] + stbl[1], stbl[0] + stbl[2]
+    ):
+        pos = _full_box(moov, table_offset, table_header)
+        if table_type == b"stts":
+            count = struct.unpack(">I", moov[pos : pos + 4])[0]
+            tables["stts"] = struct.unpack(
+                f">{count * 2}I", moov[pos + 4 : pos + 4 + count * 8]
+            )
+        elif table_type == b"stss":
+            count = struct.unpack(">I", moov[pos : pos + 4])[0]
+            tables["stss"] = struct.unpack(
+                f">{count}I", moov[pos + 4 : pos + 4 + count * 4]
+            )
+        elif table_type == b"stsz":
+            sample_size, count = struct.unpack(">II", moov[pos : pos + 8])
+            if sample_size:
+                tables["stsz"] = (sample_size,) * count
+            else:
+                tables["stsz"] = struct.unpack(
+                    f">{count}I", moov[pos + 8 : pos + 8 + count * 4]
+                )
+        elif table_type == b"stsc":
+            count = struct.unpack(">I", moov[pos : pos + 4])[0]
+            tables["stsc"] = struct.unpack(
+                f">{count * 3}I", moov[pos + 4 : pos + 4 + count * 12]
+            )
+        elif table_type == b"stco":
+            count = struct.unpack(">I", moov[pos : pos + 4])[0]
+            tables["stco"] = struct.unpack(
+                f">{count}I", moov[pos + 4 : pos + 4 + count * 4]
+            )
+        elif table_type == b"co64":
+            count = struct.unpack(">I", moov[pos : pos + 4])[0]
+            tables["stco"] = struct.unpack(
+                f">{count}Q", moov[pos + 4 : pos + 4 + count * 8]
+            )
+
+    if not all(k in tables for k in ("stts", "stsz", "stsc", "stco")):
+        return None
+    tables["timescale"] = timescale
+    return tables
+
+
+def build_keyframe_index(moov: bytes) -> list[tuple[float, int]]:
+    """
+    Build a sorted list of (time_in_seconds, byte_offset) for every sync
+    sample (keyframe) of the first video track of a moov box.
+
+    Args:
+        moov: The complete moov box, header included
+
+    Returns:
+        The keyframe index, empty if the file has no usable video track.
+    """
+    parsed = read_box_header(moov)
+    if not parsed or parsed[0] != b"moov":
+        return []
+
+    tables = None
+    for box_type, offset, header, size in iter_boxes(moov, parsed[1], len(moov)):
+        if box_type == b"trak":
+            tables = _parse_track(moov, offset, header, size)
+            if tables:
+                break
+    if not tables:
+        return []
+
+    sizes = tables["stsz"]
+    chunk_offsets = tables["stco"]
+    stsc = tables["stsc"]
+    stts = tables["stts"]
+    sync = set(tables.get("stss") or ())
+
+    # Byte offset of every sample (sample-to-chunk runs over the chunk table)
+    sample_offsets = []
+    sample = 0
+    runs = [stsc[i : i + 3] for i in range(0, len(stsc), 3)]
+    for run_idx, (first_chunk, per_chunk, _) in enumerate(runs):
+        last_chunk = (
+            runs[run_idx + 1][0] - 1 if run_idx + 1 < len(runs) else len(chunk_offsets)
+        )
+        for chunk in range(first_chunk, last_chunk + 1):
+            if chunk - 1 >= len(chunk_offsets):
+                break
+            offset = chunk_offsets[chunk - 1]
+            for _ in range(per_chunk):
+                if sample >= len(sizes):
+                    break
+                sample_offsets.append(offset)
+                offset += sizes[sample]
+                sample += 1
+
+    # Decode time of every sample
+    index = []
+    timescale = tables["timescale"]
+    sample = 0
+    time = 0
+    for i in range(0, len(stts), 2):
+        count, delta = stts[i], stts[i + 1]
+        for _ in range(count):
+            if sample >= len(sample_offsets):
+                break
+            if not sync or (sample + 1) in sync:
+                index.append((time / timescale, sample_offsets[sample]))
+            time += delta
+            sample += 1
+
+    # Decode order: both times and offsets are increasing for regular files
+    return index
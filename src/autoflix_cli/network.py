@@ -0,0 +1,8 @@
+from curl_cffi import CurlOpt
+
+# Requested Cloudflare DNS Options, shared by every curl_cffi session
+DNS_OPTIONS = {
+    CurlOpt.DOH_URL: "https://cloudflare-dns.com/dns-query",
+    CurlOpt.DOH_SSL_VERIFYPEER: 0,
+    CurlOpt.DOH_SSL_VERIFYHOST: 0,
+}
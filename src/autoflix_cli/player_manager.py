@@ -2,7 +2,6 @@ import shutil
 import platform
 import os
 import subprocess
-import json
 import urllib.parse
 import time
 import webbrowser
@@ -16,9 +15,13 @@ from .cli_utils import (
     console,
 )
 from .scraping import player
+from .scraping.extractors import Deadline, DeadlineExceeded
 from . import proxy
 from typing import Dict, Any
 from .tracker import tracker
+from .stream_cache import stream_cache
+from .stream_probe import probe_stream
+from .daemon import get_client as get_daemon_client
 
 
 DEFAULT_USER_AGENT = (
@@ -157,6 +160,154 @@ def _player_exit_hint(code: int) -> str:
     }.get(code, "")
 
 
+def _get_player_config(url: str) -> dict:
+    """Return the players_info configuration matching an embed URL."""
+    return player.find_player(url)[1] or {}
+
+
+def _get_referer(url: str, headers: dict, player_config: dict, is_direct: bool) -> str:
+    """Referer expected by the CDN of a stream resolved from an embed URL."""
+    if is_direct:
+        return headers.get("Referer", "")
+    try:
+        domain = url.split("/")[2].lower()
+        referer = f"https://{domain}"
+        if player_config.get("referrer") == "full":
+            referer = url
+        elif player_config.get("referrer") == "path":
+            referer = f"https://{domain}/"
+        elif isinstance(player_config.get("referrer"), str):
+            referer = player_config.get("referrer")
+
+        return f"{referer}/"
+    except IndexError:
+        return ""
+
+
+def _build_proxy_headers(
+    url: str, headers: dict, player_config: dict, referer: str
+) -> dict:
+    """Headers the proxy must send upstream for a stream."""
+    proxy_headers = headers.copy()
+    if referer:
+        proxy_headers["Referer"] = referer
+
+    # Add specific headers from config
+    if player_config.get("alt-used") is True:
+        try:
+            proxy_headers["Alt-Used"] = url.split("/")[2].lower()
+        except IndexError:
+            pass
+
+    sec_headers = player_config.get("sec_headers")
+    if sec_headers:
+        # Parse sec_headers string if needed, or just add them
+        if isinstance(sec_headers, str):
+            for part in sec_headers.split(";"):
+                if ":" in part:
+                    k, v = part.split(":", 1)
+                    proxy_headers[k.strip()] = v.strip()
+
+    return proxy_headers
+
+
+def _make_local_stream_url(
+    stream_url: str,
+    proxy_headers: dict,
+    endpoint: str,
+    headers: dict,
+    fallback_streams: list = None,
+) -> str:
+    """
+    Build the proxy URL handed to the player. HLS streams with alternative
+    mirrors go through a failover virtual playlist instead of /stream, when
+    the proxy can hold one (see proxy.register_failover_group).
+    """
+    if endpoint == "stream" and fallback_streams:
+        sources = [(stream_url, proxy_headers)]
+        for alt_embed_url, alt_stream_url in fallback_streams:
+            alt_config = _get_player_config(alt_embed_url)
+            alt_referer = _get_referer(alt_embed_url, headers, alt_config, False)
+            sources.append(
+                (
+                    alt_stream_url,
+                    _build_proxy_headers(alt_embed_url, headers, alt_config, alt_referer),
+                )
+            )
+        failover_url = proxy.register_failover_group(sources)
+        if failover_url:
+            return failover_url
+
+    return f"{proxy.PROXY_URL}/{endpoint}?{proxy.proxy_query(stream_url, proxy_headers)}"
+
+
+def apply_url_replacements(url: str) -> str:
+    """Rewrite a player URL whose host moved (remote new_url config)."""
+    if hasattr(player, "new_url") and isinstance(player.new_url, dict):
+        for old, new in player.new_url.items():
+            url = url.replace(old, new)
+    return url
+
+
+def get_stream_headers(url: str, headers: dict, is_direct: bool = False) -> dict:
+    """Headers the CDN of the stream resolved from a player URL expects."""
+    player_config = _get_player_config(url)
+    referer = _get_referer(url, headers, player_config, is_direct)
+    return _build_proxy_headers(url, headers, player_config, referer)
+
+
+def resolve_stream(url: str, headers: dict, deadline: Deadline = None) -> tuple:
+    """
+    Resolve a player URL to its stream, reusing a still-valid stream from the
+    persistent cache (replays, resumes, retries after a player crash).
+
+    Args:
+        url: Player URL
+        headers: HTTP headers for the request
+        deadline: Optional budget of the resolution (see player.get_hls_link)
+
+    Returns:
+        (stream_url, subtitle_url), stream_url is None if resolution failed
+    """
+    probe_headers = get_stream_headers(url, headers)
+
+    cached = stream_cache.get(url, headers, probe_headers)
+    if cached:
+        return cached
+
+    subtitle_url = None
+    daemon_client = get_daemon_client()
+    if daemon_client is not None:
+        # Warm session and caches in the daemon
+        timeout = deadline.remaining() if deadline else player.RESOLUTION_TIMEOUT
+        try:
+            stream_res = daemon_client.resolve(url, headers, timeout, deadline)
+        except DeadlineExceeded:
+            raise
+        except (OSError, EOFError) as e:
+            print_warning(f"AutoFlix daemon not answering ({e}), resolving here.")
+            daemon_client = None
+    if daemon_client is None:
+        stream_res = player.get_hls_link(
+            url, headers, return_subs=True, deadline=deadline
+        )
+    if isinstance(stream_res, tuple):
+        stream_url, subtitle_url = stream_res
+    else:
+        stream_url = stream_res
+
+    if stream_url and stream_url.startswith("/"):
+        stream_url = (
+            "https://"
+            + url.removeprefix("https://").removeprefix("http://").split("/")[0]
+            + stream_url
+        )
+
+    if stream_url:
+        stream_cache.put(url, headers, stream_url, subtitle_url)
+    return stream_url, subtitle_url
+
+
 def play_video(
     url: str,
     headers: dict,
@@ -165,6 +316,9 @@ def play_video(
     subtitles: list = None,
     is_direct: bool = False,
     is_mp4: bool = False,
+    fallback_streams: list = None,
+    resolved_stream: tuple = None,
+    probe: bool = False,
 ) -> bool:
     """
     Attempt to play a video with the chosen player.
@@ -178,27 +332,34 @@ def play_video(
             so the user can pick the language inside the player
         is_direct: Whether the URL is a direct media file
         is_mp4: Whether the stream is an MP4
+        fallback_streams: Optional ranked list of (embed_url, stream_url) for
+            other mirrors of the same episode; the proxy switches to them
+            mid-playback if the main CDN starts failing
+        resolved_stream: Optional (stream_url, subtitle_url) already resolved
+            for this URL (speculative resolution), skips the extraction
+        probe: Check the stream delivers media before launching a player.
+            Only for a single stream nobody ranked: mirrors probed by a
+            MirrorResolver or rank_streams are not probed again
 
     Returns:
         True if playback succeeded, False otherwise
     """
 
-    if hasattr(player, "new_url") and isinstance(player.new_url, dict):
-        for old, new in player.new_url.items():
-            url = url.replace(old, new)
+    url = apply_url_replacements(url)
 
     print_info(f"Resolving stream for: [cyan]{url}[/cyan]")
 
     # Determine player configuration
-    player_config = {}
-    for player_name, config in player.players.items():
-        if player_name in url.lower():
-            player_config = config
-            break
+    player_config = _get_player_config(url)
 
     if is_direct:
         stream_url = url
+    elif resolved_stream:
+        stream_url, extracted_sub = resolved_stream
+        if extracted_sub and not subtitle_url:
+            subtitle_url = extracted_sub
     else:
+        deadline = Deadline(player.RESOLUTION_TIMEOUT)
         try:
             with Progress(
                 SpinnerColumn(),
@@ -206,22 +367,12 @@ def play_video(
                 console=console,
             ) as progress:
                 progress.add_task(description="Getting stream URL...", total=None)
-                stream_res = player.get_hls_link(url, headers, return_subs=True)
-                if isinstance(stream_res, tuple):
-                    stream_url, extracted_sub = stream_res
-                    if extracted_sub and not subtitle_url:
-                        subtitle_url = extracted_sub
-                else:
-                    stream_url = stream_res
-
-                if stream_url and stream_url.startswith("/"):
-                    stream_url = (
-                        "https://"
-                        + url.removeprefix("https://")
-                        .removeprefix("http://")
-                        .split("/")[0]
-                        + stream_url
-                    )
+                stream_url, extracted_sub = resolve_stream(url, headers, deadline)
+                if extracted_sub and not subtitle_url:
+                    subtitle_url = extracted_sub
+        except KeyboardInterrupt:
+            print_warning(f"Stream resolution cancelled ({deadline.report()}).")
+            return False
         except Exception as e:
             print_error(f"Error resolving stream URL: {e}")
             return False
@@ -232,6 +383,20 @@ def play_video(
 
     print_success(f"Stream URL: [cyan]{stream_url}[/cyan]")
 
+    if probe:
+        with console.status("Probing stream..."):
+            probe_result = probe_stream(
+                stream_url, get_stream_headers(url, headers, is_direct)
+            )
+        if probe_result.ok:
+            print_info(f"Stream health: {probe_result.summary()}")
+        else:
+            print_warning(f"Stream looks unusable: {probe_result.summary()}")
+            if not is_direct:
+                stream_cache.invalidate(url, headers)
+            if select_from_list(["Try to play anyway", "← Back"], "Action:") == 1:
+                return False
+
     local_subtitle_path = subtitle_url
     subtitle_paths = []
     subtitle_items = list(subtitles or [])
@@ -265,23 +430,11 @@ def play_video(
             player_executable = None
 
         # --- 1. Preparation of Headers & Referer for both players ---
-        # Calculate Referer
-        if not is_direct:
-            try:
-                domain = url.split("/")[2].lower()
-                referer = f"https://{domain}"
-                if player_config.get("referrer") == "full":
-                    referer = url
-                elif player_config.get("referrer") == "path":
-                    referer = f"https://{domain}/"
-                elif isinstance(player_config.get("referrer"), str):
-                    referer = player_config.get("referrer")
-
-                referer = f"{referer}/"
-            except IndexError:
-                referer = ""
-        else:
-            referer = headers.get("Referer", "")
+        referer = _get_referer(url, headers, player_config, is_direct)
+        try:
+            domain = url.split("/")[2].lower()
+        except IndexError:
+            domain = ""
 
         user_agent = headers.get("User-Agent", DEFAULT_USER_AGENT)
 
@@ -310,26 +463,10 @@ def play_video(
             print_info(f"Launching [bold cyan]Browser[/bold cyan] Player...")
 
             # Construct Proxy URL
-            proxy_headers = headers.copy()
-            if referer:
-                proxy_headers["Referer"] = referer
-
-            if player_config.get("alt-used") is True:
-                proxy_headers["Alt-Used"] = domain
-
-            sec_headers = player_config.get("sec_headers")
-            if sec_headers:
-                if isinstance(sec_headers, str):
-                    for part in sec_headers.split(";"):
-                        if ":" in part:
-                            k, v = part.split(":", 1)
-                            proxy_headers[k.strip()] = v.strip()
-
-            headers_json = json.dumps(proxy_headers)
-            encoded_url = urllib.parse.quote(stream_url)
-            encoded_headers = urllib.parse.quote(headers_json)
-
-            if not proxy.PROXY_URL:
+            proxy_headers = _build_proxy_headers(url, headers, player_config, referer)
+
+            # Local proxy: it receives the browser player's heartbeats
+            if not proxy.ensure_proxy_server(use_daemon=False):
                 print_error("Proxy server not initialized.")
                 return False
 
@@ -337,10 +474,12 @@ def play_video(
             if ("ext" in player_config and player_config["ext"] == "mp4") or is_mp4:
                 endpoint = "video"
 
-            local_stream_url = f"{proxy.PROXY_URL}/{endpoint}?url={encoded_url}&headers={encoded_headers}"
+            local_stream_url = _make_local_stream_url(
+                stream_url, proxy_headers, endpoint, headers, fallback_streams
+            )
 
             encoded_local_stream_url = urllib.parse.quote(local_stream_url)
-            browser_player_url = (
+            browser_player_url = proxy.with_token(
                 f"{proxy.PROXY_URL}/player?url={encoded_local_stream_url}"
             )
 
@@ -389,29 +528,9 @@ def play_video(
 
             # Construct Proxy URL
             # We need to pass the headers to the proxy
-            # Combine all necessary headers
-            proxy_headers = headers.copy()
-            if referer:
-                proxy_headers["Referer"] = referer
-
-            # Add specific headers from config
-            if player_config.get("alt-used") is True:
-                proxy_headers["Alt-Used"] = domain
-
-            sec_headers = player_config.get("sec_headers")
-            if sec_headers:
-                # Parse sec_headers string if needed, or just add them
-                if isinstance(sec_headers, str):
-                    for part in sec_headers.split(";"):
-                        if ":" in part:
-                            k, v = part.split(":", 1)
-                            proxy_headers[k.strip()] = v.strip()
-
-            headers_json = json.dumps(proxy_headers)
-            encoded_url = urllib.parse.quote(stream_url)
-            encoded_headers = urllib.parse.quote(headers_json)
-
-            if not proxy.PROXY_URL:
+            proxy_headers = _build_proxy_headers(url, headers, player_config, referer)
+
+            if not proxy.ensure_proxy_server():
                 print_error("Proxy server not initialized.")
                 return False
 
@@ -419,7 +538,9 @@ def play_video(
             if ("ext" in player_config and player_config["ext"] == "mp4") or is_mp4:
                 endpoint = "video"
 
-            local_stream_url = f"{proxy.PROXY_URL}/{endpoint}?url={encoded_url}&headers={encoded_headers}"
+            local_stream_url = _make_local_stream_url(
+                stream_url, proxy_headers, endpoint, headers, fallback_streams
+            )
 
             try:
                 cmd = [player_executable, local_stream_url]
@@ -442,6 +563,8 @@ def play_video(
             except subprocess.CalledProcessError as e:
                 hint = _player_exit_hint(e.returncode)
                 if hint:
+                    if not is_direct:
+                        stream_cache.invalidate(url, headers)
                     print_error(f"Error running player via proxy: {e} ({hint}).")
                     return False
                 print_error(f"Error running player via proxy: {e}")
@@ -512,6 +635,8 @@ def play_video(
             except subprocess.CalledProcessError as e:
                 hint = _player_exit_hint(e.returncode)
                 if hint:
+                    if not is_direct:
+                        stream_cache.invalidate(url, headers)
                     print_error(f"Error running player: {e} ({hint}).")
                     return False
                 print_error(f"Error running player: {e}")
@@ -565,6 +690,7 @@ def select_and_play_player(
             headers={"Referer": referer},
             title=title,
             subtitle_url=subtitle_url,
+            probe=True,
         )
 
         if success:
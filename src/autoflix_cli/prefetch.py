@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+
+class ResumePrefetcher:
+    """
+    Speculative preparation of the home menu's Resume entry.
+
+    While the menu is shown, the provider's prefetch hook (see
+    providers_registry) replays the first steps of its resume function in a
+    background thread, provider import and website origin included: pages
+    are loaded with load() and the mirrors of the episode that will most
+    likely be played are resolved with warm_players(). The resume function
+    then picks those results up with take() and play_episode_flow with
+    take_resolver(), instead of starting from scratch.
+
+    Each start() opens a generation and cancel() closes it: results of a
+    job from an older generation are dropped instead of being kept.
+    """
+
+    # Resolved stream URLs are usually signed and expire: past this age a
+    # warmed resolver is thrown away rather than used
+    MAX_RESOLVER_AGE = 300
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = None  # Key of the history entry being prefetched
+        self._generation = 0  # Bumped by start() and cancel()
+        self._local = threading.local()  # generation of the job of a thread
+        self._loads = {}  # key -> Future
+        self._resolvers = {}  # (player URLs, headers) -> (MirrorResolver, started)
+
+    @staticmethod
+    def _entry_key(data: dict) -> tuple:
+        return (data["provider"], data["series_title"], data["episode_title"])
+
+    @staticmethod
+    def _players_key(urls: list, headers: dict) -> tuple:
+        return tuple(urls), json.dumps(headers or {}, sort_keys=True)
+
+    def start(self, data: dict, hook: Callable[[dict], None]):
+        """Run hook(data) in the background, once per history entry."""
+        key = self._entry_key(data)
+        with self._lock:
+            if self._started == key:
+                return
+            self._started = key
+            self._generation += 1
+            generation = self._generation
+        threading.Thread(
+            target=self._run,
+            args=(hook, dict(data), generation),
+            name="autoflix-prefetch",
+            daemon=True,
+        ).start()
+
+    def _run(self, hook, data, generation):
+        self._local.generation = generation
+        try:
+            hook(data)
+        except Exception:
+            pass  # Speculative (or cancelled): the resume function will redo it
+
+    def _is_stale(self) -> bool:
+        """The calling job belongs to a cancelled or replaced generation."""
+        generation = getattr(self._local, "generation", None)
+        return generation is not None and generation != self._generation
+
+    def load(self, key, fn: Callable):
+        """
+        Compute fn() now (prefetch thread) and keep it for take(key).
+
+        Raises:
+            RuntimeError: If the generation of the job ended meanwhile (the
+                result is dropped and the job stops there)
+        """
+        future = Future()
+        with self._lock:
+            if self._is_stale():
+                raise RuntimeError("Prefetch cancelled")
+            self._loads[key] = future
+        try:
+            result = fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        with self._lock:
+            if self._is_stale():
+                if self._loads.get(key) is future:
+                    del self._loads[key]
+                raise RuntimeError("Prefetch cancelled")
+        return result
+
+    def take(self, key, fn: Callable):
+        """Result of a prefetched load (waiting for it if needed), else fn()."""
+        with self._lock:
+            future = self._loads.pop(key, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass  # Failed in the background: retry in the foreground
+        return fn()
+
+    def warm_players(self, players: list, headers: dict):
+        """Start resolving and probing the supported mirrors of an episode."""
+        from .handlers.playback import MirrorResolver
+        from .scraping import player
+
+        supported = [p for p in players if player.is_supported(p.url)]
+        if not supported:
+            return
+        key = self._players_key([p.url for p in supported], headers)
+        with self._lock:
+            if self._is_stale() or key in self._resolvers:
+                return
+        resolver = MirrorResolver(supported, headers or {})
+        with self._lock:
+            keep = not self._is_stale() and key not in self._resolvers
+            if keep:
+                self._resolvers[key] = (resolver, time.monotonic())
+        if not keep:
+            resolver.close()  # Cancelled while it was being created
+
+    def take_resolver(self, players: list, headers: dict):
+        """MirrorResolver already working on these mirrors, or None."""
+        key = self._players_key([p.url for p in players], headers)
+        with self._lock:
+            entry = self._resolvers.pop(key, None)
+        if entry is None:
+            return None
+        resolver, started = entry
+        if time.monotonic() - started > self.MAX_RESOLVER_AGE:
+            resolver.close()
+            return None
+        return resolver
+
+    def cancel(self):
+        """Drop the speculative work (the user chose something else)."""
+        with self._lock:
+            resolvers = [resolver for resolver, _ in self._resolvers.values()]
+            self._resolvers.clear()
+            self._loads.clear()
+            self._started = None
+            self._generation += 1
+        for resolver in resolvers:
+            resolver.close()
+
+
+# Global instance
+prefetcher = ResumePrefetcher()
@@ -1,4 +1,80 @@
-from typing import Callable, List, Optional
+import importlib
+from importlib.metadata import entry_points
+from typing import Callable, List, Optional, Union
+
+# Entry point group third-party providers are declared in. Each entry point
+# must load a provider manifest (a dict shaped like the BUILTIN_PROVIDERS
+# entries) from a module that is cheap to import, e.g. in pyproject.toml:
+#
+#     [project.entry-points."autoflix_cli.providers"]
+#     myprovider = "my_package.autoflix_manifest:PROVIDER"
+ENTRY_POINT_GROUP = "autoflix_cli.providers"
+
+# Providers shipped with AutoFlix. Handlers are "module:function" references,
+# imported only when the provider is chosen or resumed.
+BUILTIN_PROVIDERS = [
+    {
+        "key": "Anime-Sama",
+        "name": "🎌 Anime-Sama (Anime and animated movies)",
+        "handler": "autoflix_cli.handlers.anime_sama:handle_anime_sama",
+        "resume": "autoflix_cli.handlers.anime_sama:resume_anime_sama",
+        "prefetch": "autoflix_cli.handlers.anime_sama:prefetch_anime_sama",
+        "supported_languages": ["fr"],
+    },
+    {
+        "key": "ArkAnime",
+        "name": "⛩️ ArkAnime (Anime & Animations)",
+        "handler": "autoflix_cli.handlers.arkanime:handle_arkanime",
+        "resume": "autoflix_cli.handlers.arkanime:resume_arkanime",
+        "prefetch": "autoflix_cli.handlers.arkanime:prefetch_arkanime",
+        "supported_languages": ["fr", "en"], # Assuming multi or depending on ArkAnime source
+    },
+    {
+        "key": "GoldenAnime",
+        "name": "✨ GoldenAnime (VO and Subtitles)",
+        "handler": "autoflix_cli.handlers.goldenanime:handle_goldenanime",
+        "resume": "autoflix_cli.handlers.goldenanime:resume_goldenanime",
+        "supported_languages": None,
+    },
+    {
+        "key": "GoldenMS",
+        "name": "🌟 GoldenMS (Movies & Series)",
+        "handler": "autoflix_cli.handlers.goldenms:handle_goldenms",
+        "resume": "autoflix_cli.handlers.goldenms:resume_goldenms",
+        "supported_languages": None,
+    },
+    {
+        "key": "Coflix",
+        "name": "🎬 Coflix (Series and movies)",
+        "handler": "autoflix_cli.handlers.coflix:handle_coflix",
+        "resume": "autoflix_cli.handlers.coflix:resume_coflix",
+        "prefetch": "autoflix_cli.handlers.coflix:prefetch_coflix",
+        "supported_languages": ["fr"],
+    },
+    {
+        "key": "French-Stream",
+        "name": "🇫🇷 French-Stream (Series and movies)",
+        "handler": "autoflix_cli.handlers.french_stream:handle_french_stream",
+        "resume": "autoflix_cli.handlers.french_stream:resume_french_stream",
+        "supported_languages": ["fr"],
+    },
+]
+
+
+def lazy_handler(reference: str) -> Callable:
+    """
+    Handler that imports its provider module on first call.
+
+    :param reference: 'module:function' (e.g. 'autoflix_cli.handlers.coflix:handle_coflix').
+    """
+    module_name, function_name = reference.split(":")
+
+    def handler(*args, **kwargs):
+        module = importlib.import_module(module_name)
+        return getattr(module, function_name)(*args, **kwargs)
+
+    handler.__name__ = function_name
+    return handler
 
 
 class ProviderRegistry:
@@ -8,24 +84,99 @@ class ProviderRegistry:
     def register(
         self,
         name: str,
-        handler: Callable,
+        handler: Union[Callable, str],
         supported_languages: Optional[List[str]] = None,
+        key: Optional[str] = None,
+        resume: Union[Callable, str, None] = None,
+        prefetch: Union[Callable, str, None] = None,
     ):
         """
         Register a streaming provider.
 
         :param name: Display name of the provider (e.g. '🎌 Anime-Sama').
-        :param handler: The function to execute when this provider is chosen.
+        :param handler: The function to execute when this provider is chosen, or a 'module:function' reference imported on first use.
         :param supported_languages: List of languages ('fr', 'en', etc.). None means all languages are supported.
+        :param key: Provider name saved in the watch history (e.g. 'Anime-Sama').
+        :param resume: Function (or 'module:function' reference) resuming a history entry of this provider.
+        :param prefetch: Optional function (or 'module:function' reference) preparing a resume: run in a background thread while the home menu is shown, see prefetch.ResumePrefetcher.
         """
+        if isinstance(handler, str):
+            handler = lazy_handler(handler)
+        if isinstance(resume, str):
+            resume = lazy_handler(resume)
+        if isinstance(prefetch, str):
+            prefetch = lazy_handler(prefetch)
         self.providers.append(
             {
+                "key": key or name,
                 "name": name,
                 "handler": handler,
                 "supported_languages": supported_languages,
+                "resume": resume,
+                "prefetch": prefetch,
             }
         )
 
+    def register_manifest(self, manifest: dict):
+        """Register a provider described by a manifest dict (see BUILTIN_PROVIDERS)."""
+        if self.get(manifest["key"]):
+            print(f"Warning: Provider '{manifest['key']}' is already registered.")
+            return
+        self.register(
+            manifest["name"],
+            manifest["handler"],
+            supported_languages=manifest.get("supported_languages"),
+            key=manifest["key"],
+            resume=manifest.get("resume"),
+            prefetch=manifest.get("prefetch"),
+        )
+
+    def load_plugins(self):
+        """Register the built-in providers, then those declared as entry points."""
+        for manifest in BUILTIN_PROVIDERS:
+            self.register_manifest(manifest)
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                self.register_manifest(entry_point.load())
+            except Exception as e:
+                print(f"Warning: Could not load provider plugin '{entry_point.name}': {e}")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get a provider by its history key."""
+        for p in self.providers:
+            if p["key"] == key:
+                return p
+        return None
+
+    def resume(self, data: dict) -> bool:
+        """
+        Resume a watch history entry with the provider that recorded it.
+
+        :param data: History entry (its 'provider' field is the provider key).
+        :return: False if that provider cannot resume.
+        """
+        provider = self.get(data["provider"])
+        if provider is None or provider["resume"] is None:
+            return False
+        provider["resume"](data)
+        return True
+
+    def prefetch(self, data: dict) -> bool:
+        """
+        Start preparing the resume of a watch history entry in the background.
+
+        :param data: History entry (its 'provider' field is the provider key).
+        :return: False if that provider has no prefetch hook.
+        """
+        provider = self.get(data["provider"])
+        if provider is None or provider["prefetch"] is None:
+            return False
+        from .prefetch import prefetcher
+
+        prefetcher.start(data, provider["prefetch"])
+        return True
+
     def get_providers(self, target_language: Optional[str] = None) -> List[dict]:
         """
         Get all providers that support the target language.
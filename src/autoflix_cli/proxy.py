@@ -1,18 +1,39 @@
+import bisect
+import hmac
+import secrets
 import threading
 import socket
 import json
+import os
 import time
 import urllib.parse
 import re
-from flask import Flask, request, Response, stream_with_context
-from curl_cffi import requests, CurlOpt
+import uuid
+from collections import OrderedDict
+from flask import Flask, request, Response, stream_with_context, has_request_context
+from curl_cffi import requests
 import m3u8
+from . import mp4_index
+from .network import DNS_OPTIONS
+from .daemon import get_client as get_daemon_client
 
 # Global Configuration
 PROXY_PORT = 0
 PROXY_HOST = "127.0.0.1"
+PROXY_BIND_HOST = "127.0.0.1"  # Interface the server listens on
 PROXY_URL = None
+# Required (as ?token=) on every request when the proxy listens beyond
+# localhost, so it is not an open relay for the whole LAN
+SHARED_TOKEN = None
 _server_instance = None  # To store the server for shutdown
+_using_daemon = False  # PROXY_URL is the AutoFlix daemon's proxy
+_using_remote = False  # PROXY_URL is a shared proxy on another machine
+
+# Shared-cache mode (one box serving several viewers on the LAN)
+SHARED_CACHE = False
+SEGMENT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+PLAYLIST_CACHE_TTL = 4  # Live playlists change every target duration
+VOD_PLAYLIST_CACHE_TTL = 3600  # Playlists with #EXT-X-ENDLIST never change
 
 # Web Player State
 player_finished_event = threading.Event()
@@ -20,12 +41,37 @@ player_heartbeat_time = 0
 
 app = Flask(__name__)
 
-# Requested Cloudflare DNS Options
-DNS_OPTIONS = {
-    CurlOpt.DOH_URL: "https://cloudflare-dns.com/dns-query",
-    CurlOpt.DOH_SSL_VERIFYPEER: 0,
-    CurlOpt.DOH_SSL_VERIFYHOST: 0,
-}
+
+@app.before_request
+def check_shared_token():
+    if SHARED_TOKEN and not hmac.compare_digest(
+        request.args.get("token", "").encode(), SHARED_TOKEN.encode()
+    ):
+        return "Forbidden", 403
+
+
+def with_token(url: str) -> str:
+    """Add the shared token (if any) to a URL served by this proxy."""
+    if not SHARED_TOKEN:
+        return url
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}token={urllib.parse.quote(SHARED_TOKEN)}"
+
+
+def proxy_query(url, headers) -> str:
+    """Query string of a proxied resource, with the shared token if any."""
+    query = (
+        f"url={urllib.parse.quote(url)}"
+        f"&headers={urllib.parse.quote(json.dumps(headers))}"
+    )
+    if SHARED_TOKEN:
+        query += f"&token={urllib.parse.quote(SHARED_TOKEN)}"
+    return query
+
+
+def _cache_key(kind, url, headers) -> tuple:
+    # Upstream answers can depend on the forwarded headers (Referer, cookies)
+    return kind, url, json.dumps(headers, sort_keys=True)
 
 
 def find_free_port():
@@ -59,7 +105,134 @@ def get_or_create_session(url, headers_dict=None):
     return session
 
 
-def fetch_with_retry(url, headers, method="GET", stream=False, max_retries=3):
+class SharedCache:
+    """
+    Byte-bounded LRU cache shared by every client of the proxy.
+    Concurrent misses on the same key are coalesced: only the first request
+    goes upstream, the others wait for its result.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (content, content_type, expires_at)
+        self._inflight = {}  # key -> threading.Event
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] is not None and entry[2] < time.time():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, content, content_type, ttl=None):
+        if len(content) > self.max_bytes:
+            return
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (content, content_type, expires_at)
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, key):
+        content = self._entries.pop(key)[0]
+        self.size -= len(content)
+
+    def fetch(self, key, loader):
+        """
+        Return (entry, from_cache). The loader returns (content, content_type, ttl)
+        or None on failure; failures are never cached.
+        """
+        while True:
+            entry = self.get(key)
+            if entry is not None:
+                return entry, True
+
+            with self._lock:
+                event = self._inflight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._inflight[key] = event
+                    leader = True
+                else:
+                    leader = False
+
+            if not leader:
+                if not event.wait(30):
+                    return None, False
+                # If the leader failed, retry (and maybe become the leader)
+                continue
+
+            try:
+                loaded = loader()
+                if loaded is None:
+                    return None, False
+                content, content_type, ttl = loaded
+                self.put(key, content, content_type, ttl)
+                return (content, content_type, None), False
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                event.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+            }
+
+
+shared_cache = SharedCache(SEGMENT_CACHE_MAX_BYTES)
+
+# Per-client counters (keyed by remote address) for the shared-cache mode
+_client_stats = {}
+_client_stats_lock = threading.Lock()
+
+
+def _record_client(kind, from_cache, nbytes):
+    client = request.remote_addr or "unknown"
+    with _client_stats_lock:
+        stats = _client_stats.setdefault(
+            client,
+            {
+                "requests": 0,
+                "cache_hits": 0,
+                "bytes_served": 0,
+                "bytes_from_cache": 0,
+                "playlists": 0,
+                "segments": 0,
+                "last_seen": 0,
+            },
+        )
+        stats["requests"] += 1
+        stats["playlists" if kind == "playlist" else "segments"] += 1
+        stats["bytes_served"] += nbytes
+        if from_cache:
+            stats["cache_hits"] += 1
+            stats["bytes_from_cache"] += nbytes
+        stats["last_seen"] = time.time()
+
+
+def get_client_stats() -> dict:
+    """Snapshot of per-client counters plus global cache usage."""
+    with _client_stats_lock:
+        clients = {k: dict(v) for k, v in _client_stats.items()}
+    return {"cache": shared_cache.stats(), "clients": clients}
+
+
+def fetch_with_retry(
+    url, headers, method="GET", stream=False, max_retries=3, range_header=None
+):
     attempt = 0
     session = get_or_create_session(url, headers)
 
@@ -68,8 +241,10 @@ def fetch_with_retry(url, headers, method="GET", stream=False, max_retries=3):
             # Forward the Range header if present (for MP4 seeking)
             req_headers = headers.copy() if headers else {}
 
-            # Handle the Range header coming from the client (VLC)
-            if "Range" in request.headers:
+            # Explicit range (prefetch), else the one coming from the client (VLC)
+            if range_header:
+                req_headers["Range"] = range_header
+            elif has_request_context() and "Range" in request.headers:
                 req_headers["Range"] = request.headers["Range"]
 
             response = session.request(
@@ -114,12 +289,35 @@ def proxy_stream():
         headers = {}
 
     # 1. Fetch original M3U8 content
-    resp = fetch_with_retry(target_url, headers)
-    if not resp or resp.status_code not in [200, 206]:
-        return "Error fetching upstream m3u8", 502
+    if SHARED_CACHE:
+
+        def load_playlist():
+            resp = fetch_with_retry(target_url, headers)
+            if not resp or resp.status_code not in [200, 206]:
+                return None
+            ttl = (
+                VOD_PLAYLIST_CACHE_TTL
+                if "#EXT-X-ENDLIST" in resp.text
+                else PLAYLIST_CACHE_TTL
+            )
+            return resp.content, "application/vnd.apple.mpegurl", ttl
+
+        entry, from_cache = shared_cache.fetch(
+            _cache_key("playlist", target_url, headers), load_playlist
+        )
+        if entry is None:
+            return "Error fetching upstream m3u8", 502
+        content = entry[0].decode("utf-8", errors="replace")
+        _record_client("playlist", from_cache, len(entry[0]))
+    else:
+        resp = fetch_with_retry(target_url, headers)
+        if not resp or resp.status_code not in [200, 206]:
+            return "Error fetching upstream m3u8", 502
+        content = resp.text
 
-    content = resp.text
     base_uri = get_base_url(target_url)
+    # Clients on the LAN must be sent back to the address they reached us on
+    proxy_root = request.host_url.rstrip("/")
 
     # 2. Parsing with m3u8 library
     try:
@@ -132,10 +330,8 @@ def proxy_stream():
     def make_proxy_url(endpoint, original_uri):
         # Absolute URL resolution if relative
         absolute_url = urllib.parse.urljoin(base_uri, original_uri)
-        encoded_url = urllib.parse.quote(absolute_url)
-        encoded_headers = urllib.parse.quote(json.dumps(headers))
-        # Points to localhost:PORT
-        return f"http://{PROXY_HOST}:{PROXY_PORT}/{endpoint}?url={encoded_url}&headers={encoded_headers}"
+        # Points to the proxy (localhost:PORT, or the LAN address in shared mode)
+        return f"{proxy_root}/{endpoint}?{proxy_query(absolute_url, headers)}"
 
     # 3. Rewriting segments (.ts)
     # We directly modify the m3u8 object or perform string replace if the object is too complex.
@@ -195,6 +391,18 @@ def proxy_stream():
     )
 
 
+# ---------------------------------------------------------------------------
+# Route: /stats (Shared-cache usage per client)
+# ---------------------------------------------------------------------------
+@app.route("/stats")
+def proxy_stats():
+    return Response(
+        json.dumps(get_client_stats(), indent=2),
+        mimetype="application/json",
+        headers={"Access-Control-Allow-Origin": "*"},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Catch-all for debugging 404s
 # ---------------------------------------------------------------------------
@@ -221,6 +429,32 @@ def proxy_ts():
     except:
         headers = {}
 
+    # Shared mode: whole segments are cached so the next viewer of the same
+    # episode is served locally (range requests still go upstream)
+    if SHARED_CACHE and "Range" not in request.headers:
+
+        def load_segment():
+            resp = fetch_with_retry(target_url, headers)
+            if not resp or resp.status_code != 200:
+                return None
+            return resp.content, "video/mp2t", None
+
+        entry, from_cache = shared_cache.fetch(
+            _cache_key("ts", target_url, headers), load_segment
+        )
+        if entry is None:
+            return "Error fetching segment", 502
+        _record_client("segment", from_cache, len(entry[0]))
+        return Response(
+            entry[0],
+            status=200,
+            headers={
+                "Content-Type": entry[1],
+                "Access-Control-Allow-Origin": "*",
+                "X-Cache": "HIT" if from_cache else "MISS",
+            },
+        )
+
     # Fetch in stream mode
     resp = fetch_with_retry(target_url, headers, stream=True)
     if not resp:
@@ -247,6 +481,465 @@ def proxy_ts():
     )
 
 
+# ---------------------------------------------------------------------------
+# Mirror failover: one virtual playlist over several equivalent sources
+# ---------------------------------------------------------------------------
+FAILOVER_DURATION_TOLERANCE = 0.5  # Max per-segment duration drift (seconds)
+FAILOVER_RETRY_AFTER = 30  # Seconds before a source that failed to load is tried again
+MAX_FAILOVER_GROUPS = 32  # Least recently used groups are dropped beyond this
+
+
+class FailoverGroup:
+    """
+    A ranked list of (stream_url, headers) for the same episode.
+    The virtual playlist is built from one source; when one of its segments
+    fails, the segment with the same index is fetched from another source
+    whose duration layout matches, and that source becomes the active one.
+    """
+
+    def __init__(self, sources):
+        self.sources = sources
+        self.active = 0
+        self.served = None  # Index of the source the playlist was built from
+        self._layouts = {}  # index -> (layout or None, loaded_at)
+        self._lock = threading.Lock()
+
+    def layout(self, index):
+        """
+        Media playlist of a source (resolving master playlists), cached.
+        A source that failed to load is retried after FAILOVER_RETRY_AFTER.
+        """
+        with self._lock:
+            if index in self._layouts:
+                layout, loaded_at = self._layouts[index]
+                if layout or time.monotonic() - loaded_at < FAILOVER_RETRY_AFTER:
+                    return layout
+
+        url, headers = self.sources[index]
+        layout = None
+        try:
+            for _ in range(3):  # master -> media, at most a couple of hops
+                resp = fetch_with_retry(url, headers, max_retries=2)
+                if not resp or resp.status_code >= 400:
+                    break
+                playlist = m3u8.loads(resp.text, uri=url)
+                if playlist.playlists:
+                    best = max(
+                        playlist.playlists,
+                        key=lambda p: p.stream_info.bandwidth or 0,
+                    )
+                    url = urllib.parse.urljoin(get_base_url(url), best.uri)
+                    continue
+                if playlist.segments:
+                    layout = {
+                        "url": url,
+                        "headers": headers,
+                        "text": resp.text,  # Parsed again for each rewrite
+                        "segments": [
+                            urllib.parse.urljoin(get_base_url(url), seg.uri)
+                            for seg in playlist.segments
+                        ],
+                        "durations": [seg.duration or 0 for seg in playlist.segments],
+                        "keys": [
+                            (key.method, key.iv)
+                            for key in playlist.keys
+                            if key and key.uri
+                        ],
+                    }
+                break
+        except Exception as e:
+            print(f"[FAILOVER] Could not load source #{index}: {e}")
+
+        with self._lock:
+            self._layouts[index] = (layout, time.monotonic())
+        return layout
+
+    def candidates(self):
+        """Source indexes to try, active one first, then by rank."""
+        return [self.active] + [
+            i for i in range(len(self.sources)) if i != self.active
+        ]
+
+
+def _layouts_compatible(a, b) -> bool:
+    """
+    Same segment count, matching durations and the same encryption scheme.
+    Key URIs differ between mirrors, so keys are compared by method and IV:
+    the key bytes themselves are assumed identical (same upload).
+    """
+    if len(a["durations"]) != len(b["durations"]):
+        return False
+    if a["keys"] != b["keys"]:
+        return False
+    return all(
+        abs(x - y) <= FAILOVER_DURATION_TOLERANCE
+        for x, y in zip(a["durations"], b["durations"])
+    )
+
+
+_failover_groups = OrderedDict()  # group_id -> FailoverGroup, least recent first
+_failover_lock = threading.Lock()
+
+
+def _get_failover_group(group_id):
+    with _failover_lock:
+        group = _failover_groups.get(group_id)
+        if group:
+            _failover_groups.move_to_end(group_id)
+        return group
+
+
+def register_failover_group(sources) -> str | None:
+    """
+    Register alternative streams for the same episode, on the proxy behind
+    PROXY_URL (this process's, or the daemon's).
+
+    Args:
+        sources: Ranked list of (stream_url, headers) tuples, best first.
+
+    Returns:
+        Proxy URL of the virtual playlist to give to the player, or None if
+        the group cannot be registered there (shared proxy on another
+        machine, daemon gone): play the first source through /stream.
+    """
+    if _using_remote:
+        return None
+    if _using_daemon:
+        client = get_daemon_client()
+        try:
+            return client.register_failover_group(sources) if client else None
+        except Exception as e:
+            print(f"[FAILOVER] Daemon could not register the group: {e}")
+            return None
+
+    group_id = uuid.uuid4().hex[:12]
+    with _failover_lock:
+        _failover_groups[group_id] = FailoverGroup(list(sources))
+        while len(_failover_groups) > MAX_FAILOVER_GROUPS:
+            _failover_groups.popitem(last=False)
+    return with_token(f"{PROXY_URL}/failover/{group_id}.m3u8")
+
+
+@app.route("/failover/<group_id>.m3u8")
+def proxy_failover_playlist(group_id):
+    group = _get_failover_group(group_id)
+    if not group:
+        return "Unknown failover group", 404
+
+    for index in group.candidates():
+        layout = group.layout(index)
+        if layout:
+            break
+    else:
+        return "No working source", 502
+
+    group.active = group.served = index
+    # Fresh copy: the layout is shared by every request of the group
+    playlist = m3u8.loads(layout["text"], uri=layout["url"])
+    base_uri = get_base_url(layout["url"])
+    proxy_root = request.host_url.rstrip("/")
+
+    def make_ts_url(original_uri):
+        absolute_url = urllib.parse.urljoin(base_uri, original_uri)
+        return f"{proxy_root}/ts?{proxy_query(absolute_url, layout['headers'])}"
+
+    for key in playlist.keys:
+        if key and key.uri and not key.uri.startswith(proxy_root):
+            key.uri = make_ts_url(key.uri)
+    if hasattr(playlist, "segment_map"):
+        for seg_map in playlist.segment_map:
+            if seg_map and seg_map.uri and not seg_map.uri.startswith(proxy_root):
+                seg_map.uri = make_ts_url(seg_map.uri)
+    for i, segment in enumerate(playlist.segments):
+        segment.uri = with_token(f"{proxy_root}/failover/{group_id}/{i}.ts")
+
+    return Response(
+        playlist.dumps(),
+        mimetype="application/vnd.apple.mpegurl",
+        headers={"Access-Control-Allow-Origin": "*"},
+    )
+
+
+@app.route("/failover/<group_id>/<int:index>.ts")
+def proxy_failover_segment(group_id, index):
+    group = _get_failover_group(group_id)
+    if not group or group.served is None:
+        return "Unknown failover group", 404
+
+    reference = group.layout(group.served)
+    for source in group.candidates():
+        layout = group.layout(source)
+        if not layout or index >= len(layout["segments"]):
+            continue
+        if source != group.served and not _layouts_compatible(reference, layout):
+            continue
+
+        resp = fetch_with_retry(
+            layout["segments"][index], layout["headers"], stream=True, max_retries=2
+        )
+        if not resp or resp.status_code >= 400:
+            print(f"[FAILOVER] Segment {index} failed on source #{source}")
+            continue
+
+        if source != group.active:
+            print(f"[FAILOVER] Switching to source #{source} at segment {index}")
+            group.active = source
+
+        def generate():
+            for chunk in resp.iter_content(chunk_size=8192):
+                if chunk:
+                    yield chunk
+
+        return Response(
+            stream_with_context(generate()),
+            status=resp.status_code,
+            headers={"Content-Type": "video/mp2t", "Access-Control-Allow-Origin": "*"},
+        )
+
+    return "Error fetching segment from every source", 502
+
+
+# ---------------------------------------------------------------------------
+# MP4 moov prefetch and keyframe index (for /video)
+# ---------------------------------------------------------------------------
+MP4_HEAD_BYTES = 64 * 1024  # First probe, usually enough for ftyp + moov/mdat headers
+MP4_MOOV_MAX_BYTES = 32 * 1024 * 1024
+SEEK_PREFETCH_STEP = 10  # Seconds ahead of a seek we expect the next one
+SEEK_PREFETCH_BYTES = 1024 * 1024
+MP4_INFO_MAX_BYTES = 64 * 1024 * 1024  # Indexes kept, least recently used dropped
+MP4_RETRY_AFTER = 60  # Seconds before a file that could not be indexed is tried again
+
+mp4_cache = SharedCache(128 * 1024 * 1024)  # Prefetched byte ranges
+# url -> {"size", "moov_offset", "moov", "times", "offsets", "blocks"}, or
+# None while it is being loaded
+_mp4_info = OrderedDict()
+_mp4_info_bytes = 0
+_mp4_failed = {}  # url -> time.monotonic() after which indexing is retried
+_mp4_lock = threading.Lock()
+
+
+def _parse_range(range_header, total_size):
+    """Parse a single 'bytes=start-end' header -> (start, end) inclusive."""
+    match = re.match(r"bytes=(\d*)-(\d*)", range_header or "")
+    if not match or not total_size:
+        return None
+    start, end = match.groups()
+    if not start:  # Suffix range: last N bytes
+        length = int(end or 0)
+        return max(0, total_size - length), total_size - 1
+    end = int(end) if end else total_size - 1
+    return int(start), min(end, total_size - 1)
+
+
+def _fetch_range(url, headers, start, end):
+    resp = fetch_with_retry(
+        url, headers, max_retries=2, range_header=f"bytes={start}-{end}"
+    )
+    if not resp or resp.status_code != 206:
+        return None, None
+    total = None
+    content_range = resp.headers.get("Content-Range", "")
+    if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+        total = int(content_range.rsplit("/", 1)[1])
+    return resp.content, total
+
+
+def _load_mp4_info(url, headers):
+    """Fetch the moov box of a remote MP4 and index its keyframes."""
+    info = None
+    try:
+        head, total = _fetch_range(url, headers, 0, MP4_HEAD_BYTES - 1)
+        if head and total:
+            located = mp4_index.locate_moov(head, total)
+            moov = None
+            moov_offset = None
+            if located and located[0] == "found":
+                _, moov_offset, size = located
+                if moov_offset + size <= len(head):
+                    moov = head[moov_offset : moov_offset + size]
+                elif size <= MP4_MOOV_MAX_BYTES:
+                    moov, _ = _fetch_range(
+                        url, headers, moov_offset, moov_offset + size - 1
+                    )
+            elif located and total - located[1] <= MP4_MOOV_MAX_BYTES:
+                # moov at the end (after mdat): grab the tail in one request
+                tail, _ = _fetch_range(url, headers, located[1], total - 1)
+                if tail:
+                    found = mp4_index.locate_moov(tail, len(tail))
+                    if found and found[0] == "found":
+                        _, rel, size = found
+                        moov_offset = located[1] + rel
+                        moov = tail[rel : rel + size]
+
+            if moov:
+                index = mp4_index.build_keyframe_index(moov)
+                info = {
+                    "size": total,
+                    "moov_offset": moov_offset,
+                    "moov": moov,
+                    "times": [k[0] for k in index],
+                    "offsets": [k[1] for k in index],
+                    "blocks": [],
+                }
+                print(
+                    f"[MP4] moov cached ({len(moov)} bytes, {len(index)} keyframes)"
+                )
+    except Exception as e:
+        print(f"[MP4] Could not index {url}: {e}")
+
+    with _mp4_lock:
+        if info:
+            _store_mp4_info(url, info)
+        else:
+            _mp4_info.pop(url, None)
+            now = time.monotonic()
+            for failed_url in [u for u, t in _mp4_failed.items() if t <= now]:
+                del _mp4_failed[failed_url]
+            _mp4_failed[url] = now + MP4_RETRY_AFTER
+
+
+def _mp4_info_size(info):
+    """Approximate memory held by an index: moov box and keyframe tables."""
+    return len(info["moov"]) + 16 * len(info["times"])
+
+
+def _store_mp4_info(url, info):
+    """Keep an index (under _mp4_lock), dropping the least recently used."""
+    global _mp4_info_bytes
+    size = _mp4_info_size(info)
+    if size > MP4_INFO_MAX_BYTES:
+        _mp4_info.pop(url, None)
+        return
+    _mp4_info[url] = info
+    _mp4_info.move_to_end(url)
+    _mp4_info_bytes += size
+    while _mp4_info_bytes > MP4_INFO_MAX_BYTES:
+        victim = next(u for u, i in _mp4_info.items() if i is not None)
+        _mp4_info_bytes -= _mp4_info_size(_mp4_info.pop(victim))
+
+
+def _ensure_mp4_info(url, headers):
+    """Start indexing a file in the background on its first request."""
+    with _mp4_lock:
+        if url in _mp4_info:
+            _mp4_info.move_to_end(url)
+            return _mp4_info[url]
+        if _mp4_failed.get(url, 0) > time.monotonic():
+            return None
+        _mp4_failed.pop(url, None)
+        _mp4_info[url] = None  # In progress
+    threading.Thread(target=_load_mp4_info, args=(url, headers), daemon=True).start()
+    return None
+
+
+def _prefetch_after_seek(url, headers, info, start):
+    """Prefetch the keyframe range the player will most likely ask for next."""
+    if not info.get("offsets"):
+        return
+    pos = max(0, bisect.bisect_right(info["offsets"], start) - 1)
+    target = bisect.bisect_left(info["times"], info["times"][pos] + SEEK_PREFETCH_STEP)
+    if target >= len(info["offsets"]):
+        return
+    block_start = info["offsets"][target]
+    with _mp4_lock:
+        if block_start in info["blocks"]:
+            return
+    block_end = min(block_start + SEEK_PREFETCH_BYTES, info["size"]) - 1
+
+    def prefetch():
+        content, _ = _fetch_range(url, headers, block_start, block_end)
+        if content:
+            mp4_cache.put(("mp4", url, block_start), content, "video/mp4")
+            with _mp4_lock:
+                bisect.insort(info["blocks"], block_start)
+
+    threading.Thread(target=prefetch, daemon=True).start()
+
+
+def _serve_mp4_from_cache(url, headers, info):
+    """Answer a range request from the cached moov or a prefetched block."""
+    byte_range = _parse_range(request.headers.get("Range"), info.get("size"))
+    if not byte_range:
+        return None
+    start, end = byte_range
+    total = info["size"]
+
+    def partial(content_iter, length):
+        return Response(
+            stream_with_context(content_iter),
+            status=206,
+            headers={
+                "Content-Type": "video/mp4",
+                "Content-Range": f"bytes {start}-{end}/{total}",
+                "Content-Length": str(length),
+                "Accept-Ranges": "bytes",
+                "Access-Control-Allow-Origin": "*",
+            },
+        )
+
+    # 1. Range inside the moov box (players probing the end of the file)
+    moov_start = info["moov_offset"]
+    moov_end = moov_start + len(info["moov"]) - 1
+    if moov_start <= start and end <= moov_end:
+        data = info["moov"][start - moov_start : end - moov_start + 1]
+        return partial(iter([data]), len(data))
+
+    if start > 0:
+        _prefetch_after_seek(url, headers, info, start)
+
+    # 2. Range starting inside a prefetched block: cached head, then upstream
+    with _mp4_lock:
+        pos = bisect.bisect_right(info["blocks"], start) - 1
+        block_start = info["blocks"][pos] if pos >= 0 else None
+    if block_start is None:
+        return None
+    entry = mp4_cache.get(("mp4", url, block_start))
+    if not entry:
+        # Evicted from mp4_cache: forget it so a later seek prefetches it again
+        with _mp4_lock:
+            if block_start in info["blocks"]:
+                info["blocks"].remove(block_start)
+        return None
+    if start >= block_start + len(entry[0]):
+        return None
+
+    cached = entry[0][start - block_start : end - block_start + 1]
+    rest_start = start + len(cached)
+    if rest_start > end:
+        return partial(iter([cached]), len(cached))
+
+    # The rest must be exactly the requested bytes, or the player would get
+    # a short or shifted body under our Content-Range: let /video handle it
+    resp = fetch_with_retry(
+        url, headers, stream=True, range_header=f"bytes={rest_start}-{end}"
+    )
+    content_range = resp.headers.get("Content-Range", "") if resp else ""
+    if not resp or resp.status_code != 206 or not content_range.startswith(
+        f"bytes {rest_start}-{end}/"
+    ):
+        if resp:
+            resp.close()
+        return None
+
+    def generate():
+        yield cached
+        received = 0
+        try:
+            for chunk in resp.iter_content(chunk_size=16384):
+                if chunk:
+                    received += len(chunk)
+                    yield chunk
+        finally:
+            resp.close()
+        if received < end - rest_start + 1:
+            # Abort the connection rather than end a 206 body early
+            raise ConnectionError(
+                f"Upstream ended after {received} of {end - rest_start + 1} bytes"
+            )
+
+    return partial(generate(), end - start + 1)
+
+
 # ---------------------------------------------------------------------------
 # Route: /video (For single MP4 files with Seeking)
 # ---------------------------------------------------------------------------
@@ -263,6 +956,13 @@ def proxy_video():
     except:
         headers = {}
 
+    # Serve moov probes and seeks from cache when the file is indexed
+    info = _ensure_mp4_info(target_url, headers)
+    if info:
+        cached_response = _serve_mp4_from_cache(target_url, headers, info)
+        if cached_response is not None:
+            return cached_response
+
     # Fetch stream
     resp = fetch_with_retry(target_url, headers, stream=True)
     if not resp:
@@ -342,6 +1042,10 @@ def proxy_player_ui():
             const urlParams = new URLSearchParams(window.location.search);
             const source = urlParams.get('url');
             const subPath = urlParams.get('sub_path');
+            const token = urlParams.get('token');
+            const withToken = (path) => token
+                ? path + (path.indexOf('?') === -1 ? '?' : '&') + 'token=' + encodeURIComponent(token)
+                : path;
             
             const isMp4 = source && source.indexOf('/video') !== -1;
             const closeBtn = document.getElementById('closeBtn');
@@ -351,7 +1055,7 @@ def proxy_player_ui():
                 const track = document.createElement('track');
                 track.kind = 'captions';
                 track.label = 'Subtitles';
-                track.src = '/player/subtitle?path=' + encodeURIComponent(subPath);
+                track.src = withToken('/player/subtitle?path=' + encodeURIComponent(subPath));
                 track.default = true;
                 video.appendChild(track);
             }
@@ -445,12 +1149,12 @@ def proxy_player_ui():
 
             // Heartbeat logic
             let heartbeatInterval = setInterval(() => {
-                fetch('/player/heartbeat').catch(e => console.log('Heartbeat failed'));
+                fetch(withToken('/player/heartbeat')).catch(e => console.log('Heartbeat failed'));
             }, 2000);
 
             function endPlayback() {
                 clearInterval(heartbeatInterval);
-                fetch('/player/end').then(() => {
+                fetch(withToken('/player/end')).then(() => {
                     document.getElementById('finishedMsg').style.display = 'block';
                     document.getElementById('controls-overlay').style.display = 'none';
                     if(player) {
@@ -542,12 +1246,52 @@ def run_flask(port):
     log = logging.getLogger("werkzeug")
     log.setLevel(logging.ERROR)
 
-    _server_instance = make_server(PROXY_HOST, port, app, threaded=True)
+    _server_instance = make_server(PROXY_BIND_HOST, port, app, threaded=True)
     _server_instance.serve_forever()
 
 
-def start_proxy_server(port=0):
-    global PROXY_PORT, PROXY_URL
+def start_proxy_server(port=0, host=None, shared_cache=False, token=None):
+    """
+    Start the proxy in a daemon thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        host: Interface to bind (default: 127.0.0.1). Use "0.0.0.0" to serve
+            other machines on the LAN.
+        shared_cache: Cache playlists and segments across all clients.
+        token: Token clients must send when the proxy listens beyond
+            localhost (default: AUTOFLIX_SHARED_TOKEN, else a random one).
+
+    If the AUTOFLIX_SHARED_PROXY environment variable points to a proxy
+    started in shared mode on another machine, no local server is started
+    and streams are routed through that one instead, with the token from
+    AUTOFLIX_SHARED_TOKEN.
+    """
+    global PROXY_PORT, PROXY_URL, PROXY_HOST, PROXY_BIND_HOST, SHARED_CACHE
+    global SHARED_TOKEN, _using_remote
+
+    remote_proxy = os.environ.get("AUTOFLIX_SHARED_PROXY")
+    if remote_proxy and host is None:
+        PROXY_URL = remote_proxy.rstrip("/")
+        PROXY_PORT = urllib.parse.urlparse(PROXY_URL).port or 80
+        SHARED_TOKEN = os.environ.get("AUTOFLIX_SHARED_TOKEN")
+        _using_remote = True
+        if not SHARED_TOKEN:
+            print("Warning: AUTOFLIX_SHARED_TOKEN is not set, the proxy will refuse requests.")
+        print(f"[*] Using shared proxy at {PROXY_URL}")
+        return PROXY_PORT
+
+    if host:
+        PROXY_BIND_HOST = host
+        if host not in ("0.0.0.0", "::", ""):
+            PROXY_HOST = host
+    SHARED_CACHE = shared_cache
+    if PROXY_BIND_HOST not in ("127.0.0.1", "localhost", "::1"):
+        SHARED_TOKEN = (
+            token
+            or os.environ.get("AUTOFLIX_SHARED_TOKEN")
+            or secrets.token_urlsafe(16)
+        )
 
     if port == 0:
         port = find_free_port()
@@ -560,10 +1304,38 @@ def start_proxy_server(port=0):
     t.daemon = True
     t.start()
 
-    print(f"[*] M3U8 Proxy started on http://{PROXY_HOST}:{PROXY_PORT}")
+    print(f"[*] M3U8 Proxy started on http://{PROXY_BIND_HOST}:{PROXY_PORT}")
+    if SHARED_CACHE:
+        print("[*] Shared cache enabled (stats on /stats)")
     return port
 
 
+def ensure_proxy_server(use_daemon: bool = True) -> str:
+    """
+    Start the proxy on first use (nothing needs it before a video plays).
+    If an AutoFlix daemon runs, its proxy (already warm) is used instead.
+
+    Args:
+        use_daemon: False when the caller needs this process's own proxy
+            (the browser player reports playback state to it)
+
+    Returns:
+        PROXY_URL
+    """
+    global PROXY_URL, _using_daemon
+    if PROXY_URL and _using_daemon and (not use_daemon or get_daemon_client() is None):
+        PROXY_URL = None  # Own proxy needed, or the daemon stopped answering
+    if not PROXY_URL:
+        client = get_daemon_client() if use_daemon else None
+        if client is not None and client.proxy_url:
+            PROXY_URL = client.proxy_url
+            _using_daemon = True
+        else:
+            start_proxy_server()
+            _using_daemon = False
+    return PROXY_URL
+
+
 def stop_proxy_server():
     """Shuts down the proxy server gracefully."""
     global _server_instance
@@ -576,8 +1348,39 @@ def stop_proxy_server():
 # Usage Example (if run directly)
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="AutoFlix M3U8 proxy")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=0, help="Port (0 = random)")
+    parser.add_argument(
+        "--shared",
+        action="store_true",
+        help="Share one segment/playlist cache between all clients (LAN mode)",
+    )
+    parser.add_argument(
+        "--token",
+        help="Token viewers must send (default: AUTOFLIX_SHARED_TOKEN or random)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=SEGMENT_CACHE_MAX_BYTES // (1024 * 1024),
+        help="Shared cache size in MiB",
+    )
+    args = parser.parse_args()
+
+    shared_cache.max_bytes = args.cache_size * 1024 * 1024
+
     # Start the proxy
-    my_port = start_proxy_server(0)
+    my_port = start_proxy_server(
+        args.port, host=args.host, shared_cache=args.shared, token=args.token
+    )
+    if SHARED_TOKEN:
+        print(
+            f"[*] Viewers can set AUTOFLIX_SHARED_PROXY=http://<this-machine>:{my_port}"
+            f" and AUTOFLIX_SHARED_TOKEN={SHARED_TOKEN}"
+        )
 
     # This simulates your main application
     print("Main application running... Press Ctrl+C to quit.")
@@ -593,4 +1396,6 @@ if __name__ == "__main__":
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
+        if SHARED_CACHE:
+            print(json.dumps(get_client_stats(), indent=2))
         print("Stopping.")
@@ -1,27 +1,26 @@
-from curl_cffi import requests as cffi_requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .http_cache import CachedSession, OfflineError
 from bs4 import BeautifulSoup
 from .objects import SearchResult, SamaSeason, SamaSeries, SeasonAccess, Episode
 from .utils import parse_episodes_from_js
-from ..proxy import DNS_OPTIONS
-from random import randint
+from ..network import DNS_OPTIONS
 
 website_origin = ""
 
-scraper = cffi_requests.Session(impersonate="chrome", curl_options=DNS_OPTIONS)
+scraper = CachedSession(impersonate="chrome", curl_options=DNS_OPTIONS)
 
 # info_class = "mt-0.5 text-gray-300 font-medium text-xs truncate"
 info_class = "info-value"
 
 
-from .config import portals
+from . import config
+from .origins import origin_cache
 
 
-def get_website_url(portal=portals["anime-sama"]):
-    global website_origin
-
-    if website_origin:
-        return
-
+def _discover_origin(portal: str) -> str:
+    """Follow the portal to the current anime-sama domain."""
     if portal.startswith("http"):
         response = scraper.get(portal)
     else:
@@ -35,9 +34,36 @@ def get_website_url(portal=portals["anime-sama"]):
     response = scraper.head(recommanded_url)
     response.raise_for_status()
 
-    website_origin = response.url
+    return response.url
+
+
+def _set_origin(origin: str):
+    global website_origin
+    website_origin = origin
+
+
+def get_website_url(portal: str = None):
+    global website_origin
+
+    portal = portal or config.portals["anime-sama"]
+
+    if website_origin:
+        return
+
+    website_origin = origin_cache.resolve(
+        "anime-sama", portal, _discover_origin, _set_origin
+    )
+
+
+def rediscover_website_url():
+    """The cached origin stopped working: look it up again from the portal."""
+    global website_origin
+    origin_cache.invalidate("anime-sama")
+    website_origin = ""
+    get_website_url()
 
 
+@origin_cache.rediscover_on_failure("anime-sama", rediscover_website_url)
 def search(query: str) -> list[SearchResult]:
     page = website_origin + f"/catalogue/?search={query}"
 
@@ -75,23 +101,77 @@ def search(query: str) -> list[SearchResult]:
 
 lang_codes = ["vostfr", "vf", "vj", "vcn", "vqc", "vkr", "va", "vf1", "vf2"]
 
+# A language a season turned out not to have is not asked for again before
+# this many seconds
+MISSING_LANGUAGE_TTL = 6 * 3600
+
+_missing_languages = {}  # season URL -> {lang_code: expires_at}
+_missing_lock = threading.Lock()
+
+# episodes.js files of a season fetched at the same time
+MAX_PARALLEL_LANGUAGES = 4
+
+
+def _fetch_episodes_js(url: str) -> str | None:
+    """
+    Get an episodes.js file. http_cache keeps the copy fetched before and
+    revalidates it on every request (see TTL_RULES).
 
+    Returns:
+        The script, or None if the season has no such language (404)
+    """
+    # no-cache: caches on the way must check with the server, so an update
+    # shows up right away without busting the URL
+    response = scraper.get(url, headers={"Cache-Control": "no-cache"})
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.text
+
+
+@origin_cache.rediscover_on_failure(
+    "anime-sama", rediscover_website_url, lambda: website_origin
+)
 def get_season(url: str) -> SamaSeason:
+    now = time.monotonic()
+    with _missing_lock:
+        missing = _missing_languages.setdefault(url, {})
+        candidates = [
+            lang_code
+            for lang_code in lang_codes
+            if missing.get(lang_code, 0) <= now
+        ]
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_PARALLEL_LANGUAGES, len(candidates))),
+        thread_name_prefix="autoflix-episodes",
+    ) as executor:
+        futures = [
+            executor.submit(
+                _fetch_episodes_js,
+                url.replace("vostfr", lang_code).removesuffix("/") + "/episodes.js",
+            )
+            for lang_code in candidates
+        ]
+
     episodes: dict[str, list[Episode]] = {}
     valid_lang = []
-    for lang_code in lang_codes:
-        nurl = (
-            url.replace("vostfr", lang_code).removesuffix("/")
-            + f"/episodes.js?filever={randint(1, 100000)}"
-        )
-        response = scraper.get(nurl)
-
-        if response.status_code == 404:
+    offline_errors = []
+    for lang_code, future in zip(candidates, futures):
+        try:
+            script = future.result()
+        except OfflineError as e:
+            offline_errors.append(e)  # Never fetched online: not available
+            continue
+        if script is None:
+            with _missing_lock:
+                missing[lang_code] = now + MISSING_LANGUAGE_TTL
             continue
-        response.raise_for_status()
 
-        episodes[lang_code] = parse_episodes_from_js(response.text)
+        episodes[lang_code] = parse_episodes_from_js(script)
         valid_lang.append(lang_code)
+    if not valid_lang and offline_errors:
+        raise offline_errors[0]
 
     # Clean up the title based on the URL
     parts = url.removesuffix("/").split("/")
@@ -106,6 +186,9 @@ def get_season(url: str) -> SamaSeason:
 
 
 # season_container_class = "flex flex-wrap overflow-y-hidden justify-start bg-slate-900 bg-opacity-70 rounded mt-2 h-auto"
+@origin_cache.rediscover_on_failure(
+    "anime-sama", rediscover_website_url, lambda: website_origin
+)
 def get_series(url: str) -> SamaSeries:
     response = scraper.get(url)
     response.raise_for_status()
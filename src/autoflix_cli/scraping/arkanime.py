@@ -1,18 +1,22 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from autoflix_cli.scraping.objects import ArkSeries, Player, ArkSeason, ArkMovie
-from curl_cffi import requests as cffi_requests
+from .http_cache import CachedSession
 from .objects import SearchResult, SamaSeries, Episode
-from ..proxy import DNS_OPTIONS
+from ..network import DNS_OPTIONS
 
 website_origin = ""
 
-scraper = cffi_requests.Session(impersonate="chrome", curl_options=DNS_OPTIONS)
+scraper = CachedSession(impersonate="chrome", curl_options=DNS_OPTIONS)
 
-from .config import portals
+from . import config
 
 
-def get_website_url(portal=portals["arkanime"]):
+def get_website_url(portal: str = None):
     global website_origin
 
+    portal = portal or config.portals["arkanime"]
+
     website_origin = portal
 
 
@@ -34,6 +38,45 @@ def search(query: str) -> list[SearchResult]:
 
     return results
 
+
+# Arcs of a season fetched at the same time
+MAX_PARALLEL_ARCS = 4
+
+
+def _episode(episode: dict) -> Episode:
+    players = [Player("montmyoboky (default)", "montmyoboky:" + str(episode["id"]))]
+    return Episode(f"Episode {episode['number']} : " + episode["title"], players=players)
+
+
+def _fetch_arc(url: str, season_id, arc: dict) -> list[Episode]:
+    arc_url = website_origin + f"/api/anime/{url}/seasons/{season_id}/episodes?from={arc['episodeStart']}&to={arc['episodeEnd']}"
+    arc_response = scraper.get(arc_url)
+    arc_response.raise_for_status()
+
+    return [_episode(episode) for episode in arc_response.json()["episodes"]]
+
+
+def load_arcs(url: str, season_id, arcs: list[dict]) -> list[Episode]:
+    """
+    Fetch the episodes of a season's arcs concurrently.
+
+    Args:
+        url: Anime id
+        season_id: Season id
+        arcs: The season's arcs (episodeStart, episodeEnd)
+
+    Returns:
+        Every episode of the season, in arc order
+    """
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_PARALLEL_ARCS, len(arcs))),
+        thread_name_prefix="autoflix-arcs",
+    ) as executor:
+        futures = [executor.submit(_fetch_arc, url, season_id, arc) for arc in arcs]
+
+    return [episode for future in futures for episode in future.result()]
+
+
 def get_content(url: str):
     response = scraper.get(website_origin + "/api/anime/" + url)
     response.raise_for_status()
@@ -49,31 +92,16 @@ def get_content(url: str):
         for season in content["seasons"]:
             id = season["id"]
             season_title = season["title"]
-            
-            episodes: list[Episode] = []
-            if season["episodes"]:
-                for episode in season["episodes"]:
-                    players = [
-                        Player("montmyoboky (default)", "montmyoboky:" + str(episode["id"]))
-                    ]
-
-                    episodes.append(Episode(f"Episode {episode['number']} : " + episode["title"], players=players))
 
+            if season["episodes"]:
+                episodes = [_episode(episode) for episode in season["episodes"]]
+                seasons.append(ArkSeason(id, season_title, episodes))
             elif season["arcs"]:
-                for arc in season["arcs"]:
-                    arc_url = website_origin + f"/api/anime/{url}/seasons/{id}/episodes?from={arc['episodeStart']}&to={arc['episodeEnd']}"
-                    arc_response = scraper.get(arc_url)
-                    arc_response.raise_for_status()
-
-                    arc_json = arc_response.json()
-                    for episode in arc_json["episodes"]:
-                        players = [
-                            Player("montmyoboky (default)", "montmyoboky:" + str(episode["id"]))
-                        ]
-
-                        episodes.append(Episode(f"Episode {episode['number']} : " + episode["title"], players=players))
-
-            seasons.append(ArkSeason(id, season_title, episodes))
+                # Only fetched when the season is opened
+                loader = functools.partial(load_arcs, url, id, season["arcs"])
+                seasons.append(ArkSeason(id, season_title, loader=loader))
+            else:
+                seasons.append(ArkSeason(id, season_title, []))
 
         return ArkSeries(id=url, title=title, img=img, genres=genres, seasons=seasons)
     
@@ -1,4 +1,4 @@
-from curl_cffi import requests as cffi_requests
+from .http_cache import CachedSession
 from bs4 import BeautifulSoup
 from .objects import (
     SearchResult,
@@ -13,21 +13,18 @@ from .utils import parse_episodes_from_js
 import base64
 import json
 import re
-from ..proxy import DNS_OPTIONS
+from ..network import DNS_OPTIONS
 
 website_origin = ""
-scraper = cffi_requests.Session(impersonate="chrome", curl_options=DNS_OPTIONS)
+scraper = CachedSession(impersonate="chrome", curl_options=DNS_OPTIONS)
 
 
-from .config import portals
+from . import config
+from .origins import origin_cache
 
 
-def get_website_url(portal=portals["coflix"]):
-    global website_origin
-
-    if website_origin:
-        return
-
+def _discover_origin(portal: str) -> str:
+    """Read the current coflix domain from the portal's redirect page."""
     if portal.startswith("http"):
         response = scraper.get(portal)
     else:
@@ -36,9 +33,34 @@ def get_website_url(portal=portals["coflix"]):
 
     content = response.text
 
-    website_origin = content.split('redirect_url":"')[1].split('"')[0]
+    return content.split('redirect_url":"')[1].split('"')[0]
+
+
+def _set_origin(origin: str):
+    global website_origin
+    website_origin = origin
+
+
+def get_website_url(portal: str = None):
+    global website_origin
 
+    portal = portal or config.portals["coflix"]
 
+    if website_origin:
+        return
+
+    website_origin = origin_cache.resolve("coflix", portal, _discover_origin, _set_origin)
+
+
+def rediscover_website_url():
+    """The cached origin stopped working: look it up again from the portal."""
+    global website_origin
+    origin_cache.invalidate("coflix")
+    website_origin = ""
+    get_website_url()
+
+
+@origin_cache.rediscover_on_failure("coflix", rediscover_website_url)
 def search(query: str) -> list[SearchResult]:
     page = website_origin + f"/?s={query}"
 
@@ -132,6 +154,9 @@ def _parse_cfservers(content: str) -> list[Player]:
         return []
 
 
+@origin_cache.rediscover_on_failure(
+    "coflix", rediscover_website_url, lambda: website_origin
+)
 def get_episode(url: str) -> Episode:
     """
     Get episode details including players.
@@ -244,6 +269,9 @@ def get_series(url: str) -> CoflixSeries:
     return CoflixSeries(title, url, img, genres, seasons)
 
 
+@origin_cache.rediscover_on_failure(
+    "coflix", rediscover_website_url, lambda: website_origin
+)
 def get_content(url: str):
     """
     Auto-detect and get content (movie or series) based on URL.
@@ -9,9 +9,20 @@ LOCAL_CONFIG_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", "..", "data", "source_portal.jsonc"
 )
 
-# Load Portals (Remote with fallback to DEFAULT, then override with Local if exists)
-portals = load_remote_jsonc(REMOTE_CONFIG_URL, DEFAULT_SOURCE_PORTAL)
-local_portals = load_local_jsonc(LOCAL_CONFIG_PATH)
 
-if local_portals:
-    portals.update(local_portals)
+def _set_portals(config: dict):
+    """on_update callback: use the refreshed portals from now on."""
+    global portals
+    portals = config
+
+
+# Load Portals (cached Remote with fallback to DEFAULT, overridden by Local if
+# it exists); the remote copy is refreshed in the background, so read them
+# as config.portals rather than importing the name
+local_portals = load_local_jsonc(LOCAL_CONFIG_PATH)
+portals = load_remote_jsonc(
+    REMOTE_CONFIG_URL,
+    DEFAULT_SOURCE_PORTAL,
+    overrides=local_portals,
+    on_update=_set_portals,
+)
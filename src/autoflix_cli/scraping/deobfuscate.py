@@ -1,5 +1,66 @@
+import re
 import jsbeautifier
-from jsbeautifier.unpackers import packer
+from jsbeautifier.unpackers import packer, UnpackingError
+
+# Start of a Dean Edwards p.a.c.k.e.r block
+PACKED_START = re.compile(
+    r"eval\s*\(\s*function\s*\(\s*p\s*,\s*a\s*,\s*c\s*,\s*k\s*,\s*e\s*,\s*[dr]?\s*\)"
+)
+# Arguments of the packed function: ('payload', radix, count, 'sym|tab'.split('|')
+PACKED_ARGS = re.compile(
+    r"}\s*\(\s*'((?:[^'\\]|\\.)*)'\s*,\s*(\d+|\[\])\s*,\s*(\d+)\s*,"
+    r"\s*'((?:[^'\\]|\\.)*)'\.split\('\|'\)",
+    re.S,
+)
+WORD = re.compile(r"\b\w+\b", re.ASCII)
+
+
+def _unpack_args(payload: str, radix: str, count: str, symtab: str) -> str:
+    """Decode one packed block from its arguments (same rules as packer)."""
+    radix = 62 if radix == "[]" else int(radix)
+    symbols = symtab.split("|")
+    if int(count) != len(symbols):
+        raise UnpackingError("Malformed p.a.c.k.e.r. symtab.")
+    try:
+        unbase = packer.Unbaser(radix)
+    except TypeError:
+        raise UnpackingError("Unknown p.a.c.k.e.r. encoding.")
+
+    def lookup(match):
+        word = match.group(0)
+        try:
+            return symbols[unbase(word)] or word
+        except (IndexError, KeyError, ValueError):
+            return word
+
+    payload = payload.replace("\\\\", "\\").replace("\\'", "'")
+    return WORD.sub(lookup, payload)
+
+
+def deobfuscate_fast(code: str) -> str:
+    """
+    Cheap deobfuscation for link scanning: every p.a.c.k.e.r block is
+    replaced in place by its unpacked source, the rest of the page is left
+    untouched and nothing is beautified.
+    """
+    parts = []
+    pos = 0
+    while True:
+        start = PACKED_START.search(code, pos)
+        if not start:
+            break
+        args = PACKED_ARGS.search(code, start.end())
+        if not args:
+            break
+        try:
+            unpacked = _unpack_args(*args.groups())
+        except (UnpackingError, ValueError):
+            unpacked = code[start.start() : args.end()]
+        parts.append(code[pos : start.start()])
+        parts.append(unpacked)
+        pos = args.end()
+    parts.append(code[pos:])
+    return "".join(parts)
 
 
 def deobfuscate(code: str) -> str:
@@ -0,0 +1,184 @@
+"""
+Async engine running the sans-IO extractors (see extractors.Fetch).
+
+A single event loop lives in a background thread and owns one curl_cffi
+AsyncSession, so any number of resolutions (and their hops) run
+concurrently on it. Synchronous callers go through ExtractionEngine.run(),
+which blocks until the coroutine completes.
+
+Requests are bounded by the resolution's Deadline when there is one, and
+by DEFAULT_REQUEST_TIMEOUT otherwise, so a hung host cannot stall a caller.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from urllib.parse import urlsplit
+from .extractors import Deadline, DeadlineExceeded, Fetch
+
+# Timeout of a request that does not set one
+DEFAULT_REQUEST_TIMEOUT = 15
+
+
+class ExtractionEngine:
+    """Background event loop + AsyncSession executing extractor steps."""
+
+    def __init__(self, session_factory):
+        """
+        Args:
+            session_factory: Callable returning the AsyncSession to use. It is
+                called from the engine loop, on first use.
+        """
+        self.session_factory = session_factory
+        self.session = None
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="autoflix-extraction",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    async def fetch(self, request: Fetch, deadline: Deadline = None):
+        """
+        Perform one Fetch on the shared AsyncSession.
+
+        Raises:
+            DeadlineExceeded: If the deadline is spent before or during the
+                request
+        """
+        if self.session is None:
+            self.session = self.session_factory()
+        timeout = request.timeout or DEFAULT_REQUEST_TIMEOUT
+        if deadline is not None:
+            timeout = deadline.remaining(timeout)
+        kwargs = {
+            "headers": request.headers,
+            "impersonate": "chrome",
+            "timeout": timeout,
+        }
+        if request.data is not None:
+            kwargs["data"] = request.data
+
+        if deadline is None:
+            return await self.session.request(request.method, request.url, **kwargs)
+
+        parts = urlsplit(request.url)
+        hop = f"{request.method} {parts.netloc}{parts.path}"
+        start = time.monotonic()
+        try:
+            response = await self.session.request(
+                request.method, request.url, **kwargs
+            )
+        except BaseException:
+            deadline.record(hop, time.monotonic() - start)
+            deadline.remaining()  # Budget spent: report it, not the hop error
+            raise
+        deadline.record(hop, time.monotonic() - start)
+        return response
+
+    async def drive(self, steps, deadline: Deadline = None):
+        """
+        Run an extractor generator to completion, performing its requests.
+
+        Request errors are thrown back into the generator at the yield, so
+        extractors can handle them like a blocking call's exceptions. An
+        exhausted or cancelled deadline is not: it ends the resolution.
+
+        Raises:
+            DeadlineExceeded: If the deadline is spent or cancelled
+        """
+        if not inspect.isgenerator(steps):
+            return steps  # Extractor that needed no request
+
+        on_cancel = None
+        if deadline is not None:
+            # Deadline.cancel() may come from any thread: abort the request
+            # in flight by cancelling this task on the engine loop
+            task = asyncio.current_task()
+            loop = asyncio.get_running_loop()
+            on_cancel = lambda: loop.call_soon_threadsafe(task.cancel)
+            deadline.add_cancel_callback(on_cancel)
+
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    response = await self.fetch(request, deadline)
+                except DeadlineExceeded:
+                    self._close(steps)
+                    raise
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+        except asyncio.CancelledError:
+            self._close(steps)
+            if deadline is not None and deadline.cancelled:
+                raise DeadlineExceeded(
+                    f"Stream resolution cancelled ({deadline.report()})"
+                ) from None
+            raise
+        finally:
+            if on_cancel is not None:
+                deadline.remove_cancel_callback(on_cancel)
+
+    @staticmethod
+    def _close(steps):
+        """
+        Close an extractor generator that is being abandoned. One that
+        ignores GeneratorExit (e.g. a bare except around a yield) raises
+        RuntimeError here, which must not replace the reason it was closed.
+        """
+        try:
+            steps.close()
+        except RuntimeError:
+            pass
+
+    def run(self, coro):
+        """
+        Run a coroutine on the engine loop and wait for its result.
+
+        Must not be called from the engine loop itself.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("ExtractionEngine.run() called from its own loop")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result()
+        except KeyboardInterrupt:
+            future.cancel()
+            raise
+
+    def run_steps(self, steps, deadline: Deadline = None):
+        """
+        Synchronously run an extractor generator on the engine.
+
+        On Ctrl-C the deadline is marked cancelled, so the caller can still
+        report where the time went (deadline.report()).
+        """
+        try:
+            return self.run(self.drive(steps, deadline))
+        except KeyboardInterrupt:
+            if deadline is not None:
+                deadline.cancel()
+            raise
+
+    def reset(self):
+        """Drop the current session (e.g. after changing session_factory)."""
+        session, self.session = self.session, None
+        if session is not None and self._loop is not None:
+            asyncio.run_coroutine_threadsafe(session.close(), self._loop).result()
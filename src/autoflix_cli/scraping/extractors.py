@@ -0,0 +1,210 @@
+"""
+Extractor registry for player hosts.
+
+Each extractor is a class registered under a player ``type`` (the value of
+the ``type`` key of players_info). It receives everything it needs through
+an immutable ExtractionContext and performs no I/O itself (see Fetch), so
+the same code runs on the async engine and several URLs can be resolved
+concurrently.
+"""
+
+import dataclasses
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+class DeadlineExceeded(TimeoutError):
+    """A stream resolution ran out of time or was cancelled."""
+
+
+class Deadline:
+    """
+    Time budget of one stream resolution, shared by all of its hops.
+
+    Every request of the resolution is bounded by the time left, and the
+    duration of each hop is recorded so a timeout can tell where the budget
+    went, along with the trace of the player pages it went through.
+    cancel() aborts the requests in flight (see ExtractionEngine.drive).
+    """
+
+    def __init__(self, budget: float):
+        """
+        Args:
+            budget: Seconds allowed for the whole resolution
+        """
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+        self.hops = []  # (label, seconds), in order
+        self.pages = []  # (url, type, taken from HopMemo), in order
+        self.cancelled = False
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def remaining(self, default: float = None) -> float:
+        """
+        Seconds left, capped by default.
+
+        Raises:
+            DeadlineExceeded: If the budget is spent or the resolution was
+                cancelled
+        """
+        if self.cancelled:
+            raise DeadlineExceeded(f"Stream resolution cancelled ({self.report()})")
+        left = self.expires_at - time.monotonic()
+        if left <= 0:
+            raise DeadlineExceeded(
+                f"Stream resolution timed out after {self.budget:g}s ({self.report()})"
+            )
+        return left if default is None else min(left, default)
+
+    def record(self, label: str, seconds: float):
+        """Account a hop (one request) of the resolution."""
+        self.hops.append((label, seconds))
+
+    def visit(self, url: str, type_name: str, remembered: bool = False):
+        """Account a player page the resolution went through."""
+        self.pages.append((url, type_name, remembered))
+
+    def trace(self) -> str:
+        """
+        Pages the resolution went through, e.g.
+        'kakaflix.lol (kakaflix) -> vidmoly.to (vidmoly, memo)'.
+        """
+        return " -> ".join(
+            f"{urlsplit(url).netloc or url} ({type_name}{', memo' if remembered else ''})"
+            for url, type_name, remembered in self.pages
+        )
+
+    def report(self) -> str:
+        """Which hop consumed the most of the budget, and the pages visited."""
+        if not self.hops:
+            summary = "no request made"
+        else:
+            label, seconds = max(self.hops, key=lambda hop: hop[1])
+            summary = f"{len(self.hops)} hop(s), slowest: {label} took {seconds:.1f}s"
+        if self.pages:
+            summary += f"; trace: {self.trace()}"
+        return summary
+
+    def add_cancel_callback(self, callback):
+        """Call callback() on cancel(), right away if already cancelled."""
+        with self._lock:
+            if not self.cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_cancel_callback(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def cancel(self):
+        """Abort the resolution (thread-safe)."""
+        with self._lock:
+            self.cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+@dataclass(frozen=True)
+class ExtractionContext:
+    """Per-call state of a stream resolution."""
+
+    url: str
+    headers: dict = field(default_factory=dict)
+    config: dict = field(default_factory=dict)  # players_info entry matched
+    deadline: Optional[Deadline] = None  # None = no limit
+
+    def replace(self, **changes) -> "ExtractionContext":
+        """Copy of the context with some fields changed (e.g. next iframe)."""
+        return dataclasses.replace(self, **changes)
+
+    def remaining(self, default: float = None) -> Optional[float]:
+        """
+        Seconds left before the deadline, capped by default.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.deadline is None:
+            return default
+        return self.deadline.remaining(default)
+
+
+class Fetch:
+    """
+    HTTP request needed by an extractor.
+
+    Extractors are sans-IO generators: they yield Fetch objects and receive
+    the curl_cffi Response back (or the request's exception thrown at the
+    yield). The engine decides how requests are actually performed.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        data: dict = None,
+        timeout: float = None,
+    ):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.data = data
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"Fetch({self.method} {self.url})"
+
+
+class Extractor:
+    """
+    Base class of player extractors.
+
+    Subclasses implement steps() and are registered with
+    @register_extractor("type").
+    """
+
+    type_name = None
+
+    def steps(self, ctx: ExtractionContext):
+        """
+        Resolve the stream of ctx.url.
+
+        Generator yielding Fetch requests (a plain return value is accepted
+        for extractors that need no request).
+
+        Returns:
+            The stream URL, a (stream_url, subtitle_url) tuple, or None.
+        """
+        raise NotImplementedError
+
+
+_registry = {}
+
+
+def register_extractor(type_name: str):
+    """Class decorator registering an Extractor for a player type."""
+
+    def decorator(cls):
+        cls.type_name = type_name
+        _registry[type_name] = cls()
+        return cls
+
+    return decorator
+
+
+def get_extractor(type_name: str) -> Optional[Extractor]:
+    """Return the extractor registered for a player type, if any."""
+    return _registry.get(type_name)
+
+
+def registered_types() -> list[str]:
+    """Player types that have an extractor."""
+    return list(_registry)
@@ -7,8 +7,8 @@ from .objects import (
     Episode,
 )
 
-from curl_cffi import requests as cffi_requests
-from ..proxy import DNS_OPTIONS
+from .http_cache import CachedSession
+from ..network import DNS_OPTIONS
 
 from .config import portals
 
@@ -16,7 +16,7 @@ website_origin = portals["french-stream"]
 if not website_origin.startswith("http"):
     website_origin = "https://" + website_origin
 
-scraper = cffi_requests.Session(impersonate="chrome", curl_options=DNS_OPTIONS)
+scraper = CachedSession(impersonate="chrome", curl_options=DNS_OPTIONS)
 
 
 def search(query: str) -> list[SearchResult]:
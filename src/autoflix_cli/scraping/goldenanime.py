@@ -1,8 +1,8 @@
-from curl_cffi import requests as cffi_requests
+from .http_cache import CachedSession
 
 from .config import portals
 
-scraper = cffi_requests.Session(impersonate="chrome")
+scraper = CachedSession(impersonate="chrome")
 
 
 class AnimeExtractor:
@@ -1,10 +1,10 @@
 import re
 from urllib.parse import quote
-from curl_cffi import requests as cffi_requests
+from .http_cache import CachedSession
 from .config import portals
-from ..proxy import DNS_OPTIONS
+from ..network import DNS_OPTIONS
 
-scraper = cffi_requests.Session(impersonate="chrome", curl_options=DNS_OPTIONS)
+scraper = CachedSession(impersonate="chrome", curl_options=DNS_OPTIONS)
 
 # Public player key embedded in MoviesAPI's own web player JS (de-facto public).
 MOVIESAPI_KEY = (
@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Optional
+
+
+class HopMemo:
+    """
+    Short-lived memory of the intermediate hops of stream resolutions.
+
+    A hop says "the page url, handled as player type T, led to next_url
+    handled with next_config" (kakaflix page -> embedded player, filemoon
+    page -> packed-script fallback). Only hops whose resolution succeeded
+    are kept, so a retry or a replay goes straight to the final hop.
+    """
+
+    DEFAULT_TTL = 10 * 60
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.data = {}  # (url, type) -> (next_url, next_config, expires_at)
+
+    def get(self, url: str, type_name: str) -> Optional[tuple]:
+        """Return (next_url, next_config) if the hop is known and fresh."""
+        with self._lock:
+            entry = self.data.get((url, type_name))
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self.data[(url, type_name)]
+                return None
+            return entry[0], entry[1]
+
+    def put(self, url: str, type_name: str, next_url: str, next_config: dict):
+        """Remember a hop that led to a working stream."""
+        with self._lock:
+            self.data[(url, type_name)] = (
+                next_url,
+                next_config,
+                time.monotonic() + self.ttl,
+            )
+
+    def forget(self, url: str, type_name: str):
+        """Drop a hop whose shortcut stopped working."""
+        with self._lock:
+            self.data.pop((url, type_name), None)
+
+    def clear(self):
+        with self._lock:
+            self.data.clear()
+
+
+# Global instance
+hop_memo = HopMemo()
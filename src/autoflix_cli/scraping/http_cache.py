@@ -0,0 +1,288 @@
+"""
+On-disk cache of the scrapers' catalogue and metadata responses.
+
+Scraper sessions are CachedSession instances: a request matching one of
+TTL_RULES (searches, series and movie pages, episode lists, Cinemeta...)
+is answered from an SQLite database in the data directory while it is
+fresh, and revalidated with ETag / Last-Modified once it is not. Only
+answers of the type the endpoint serves are stored, so an error or
+challenge page is never replayed. Everything else (portals, player lists,
+player hosts) goes to the network untouched.
+
+With `autoflix --offline` cached entries are served whatever their age and
+any other request of a scraper session fails with OfflineError instead of
+reaching the network. Stream resolution (extraction engine) is not
+affected.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from curl_cffi import requests as cffi_requests
+from curl_cffi.requests import Headers, Response
+from platformdirs import user_data_dir
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# (method, URL pattern, seconds a response stays fresh, body the endpoint
+# serves: "html", "json" or "js"). The first matching rule applies; requests
+# matching none are not cached. A response that is never fresh (0) is
+# revalidated on every request, but still served offline. Patterns avoid
+# host names where providers move between domains.
+TTL_RULES = [
+    # Anime-Sama: search, series page, episode lists of a season
+    ("GET", r"/catalogue/\?search=", HOUR, "html"),
+    ("GET", r"/catalogue/[^/?]+/?$", 6 * HOUR, "html"),
+    ("GET", r"/catalogue/.+/episodes\.js$", 0, "js"),
+    # Coflix: search, series/movie/episode pages
+    ("GET", r"/\?s=", HOUR, "html"),
+    ("GET", r"/(serie|film|episode)/[^/?]+/?$", 6 * HOUR, "html"),
+    # French-Stream and Wiflix: searches, content pages, player APIs
+    ("POST", r"/engine/ajax/search\.php$", HOUR, "html"),
+    ("POST", r"/index\.php\?do=search$", HOUR, "html"),
+    ("GET", r"/\d+-[^/]+\.html$", 6 * HOUR, "html"),
+    ("GET", r"/engine/ajax/film_api\.php\?", HOUR, "json"),
+    ("GET", r"/ep-data\.php\?", HOUR, "json"),
+    # ArkAnime: search, series, episodes of an arc
+    ("GET", r"/api/anime\?q=", HOUR, "json"),
+    ("GET", r"/api/anime/[^/?]+$", 6 * HOUR, "json"),
+    ("GET", r"/api/anime/[^/?]+/seasons/[^/?]+/episodes\?", 6 * HOUR, "json"),
+    # Cinemeta (GoldenMS, GoldenAnime)
+    ("GET", r"//v3-cinemeta\.strem\.io/(catalog|meta)/", DAY, "json"),
+]
+
+# Cloudflare challenge pages are HTML served with a 200 now and then
+CHALLENGE_MARKERS = (b"challenge-platform", b"cf-browser-verification")
+
+
+class OfflineError(ConnectionError):
+    """A request could not be answered from the cache in offline mode."""
+
+
+class HttpCache:
+    """SQLite store of HTTP responses, evicting the least recently used."""
+
+    MAX_SIZE = 64 * 1024 * 1024  # Bytes of response bodies
+
+    def __init__(self):
+        self.app_name = "AutoFlixCLI"
+        self.app_author = "PaulExplorer"
+        self.data_dir = Path(user_data_dir(self.app_name, self.app_author))
+        self.db_file = self.data_dir / "http_cache.sqlite3"
+        self.rules = [
+            (method, re.compile(pattern), ttl, kind)
+            for method, pattern, ttl, kind in TTL_RULES
+        ]
+        self.offline = False
+        self._lock = threading.Lock()
+        self._db = None
+        self._disabled = False
+
+    def _connect(self):
+        """Open the database (once); None if it cannot be used."""
+        if self._db is None and not self._disabled:
+            try:
+                self.data_dir.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(
+                    self.db_file, timeout=5, check_same_thread=False
+                )
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY,"
+                    " url TEXT NOT NULL,"
+                    " content_type TEXT,"
+                    " body BLOB NOT NULL,"
+                    " etag TEXT,"
+                    " last_modified TEXT,"
+                    " stored_at REAL NOT NULL,"
+                    " last_used REAL NOT NULL,"
+                    " size INTEGER NOT NULL)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_last_used"
+                    " ON responses (last_used)"
+                )
+                db.commit()
+                self._db = db
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: HTTP cache disabled: {e}")
+                self._disabled = True
+        return self._db
+
+    def rule_for(self, method: str, url: str) -> tuple | None:
+        """(freshness lifetime, expected body) of a request, None if not cached."""
+        for rule_method, pattern, ttl, kind in self.rules:
+            if rule_method == method and pattern.search(url):
+                return ttl, kind
+        return None
+
+    @staticmethod
+    def _is_expected(kind: str, response) -> bool:
+        """Whether a 200 response carries the body its endpoint serves."""
+        content_type = (response.headers.get("Content-Type") or "").lower()
+        body = response.content
+        if kind == "json":
+            # PHP endpoints often send their JSON as text/html
+            return "json" in content_type or body.lstrip()[:1] in (b"{", b"[")
+        if kind == "js":
+            return "html" not in content_type  # Challenge pages are HTML
+        return "html" in content_type and not any(
+            marker in body for marker in CHALLENGE_MARKERS
+        )
+
+    @staticmethod
+    def _key(method: str, url: str, data) -> str:
+        key = f"{method} {url}"
+        if data:
+            key += " " + json.dumps(data, sort_keys=True, default=str)
+        return key
+
+    def _get(self, key: str):
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                return db.execute(
+                    "SELECT url, content_type, body, etag, last_modified, stored_at"
+                    " FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+
+    def _touch(self, key: str, revalidated: bool = False):
+        now = time.time()
+        with self._lock:
+            try:
+                if revalidated:
+                    self._db.execute(
+                        "UPDATE responses SET last_used = ?, stored_at = ? WHERE key = ?",
+                        (now, now, key),
+                    )
+                else:
+                    self._db.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+                    )
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _put(self, key: str, response):
+        body = response.content
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        str(response.url),
+                        response.headers.get("Content-Type"),
+                        body,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                        now,
+                        now,
+                        len(body),
+                    ),
+                )
+                self._evict(db)
+                db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Could not cache {response.url}: {e}")
+
+    def _evict(self, db):
+        """Drop the least recently used responses beyond MAX_SIZE."""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.MAX_SIZE:
+            return
+        excess = total - self.MAX_SIZE
+        victims = []
+        for key, size in db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    @staticmethod
+    def _to_response(row) -> Response:
+        url, content_type, body, _, _, _ = row
+        response = Response()
+        response.url = url
+        response.content = body
+        if content_type:
+            response.headers = Headers({"Content-Type": content_type})
+        return response
+
+    def request(self, send, method: str, url: str, **kwargs):
+        """
+        Answer a request from the cache, or with send(method, url, **kwargs).
+
+        Raises:
+            OfflineError: In offline mode, if the response is not cached (or
+                the request is not cacheable)
+        """
+        method = method.upper()
+        rule = self.rule_for(method, url)
+        if rule is None or kwargs.get("params") or kwargs.get("stream"):
+            if self.offline:
+                raise OfflineError(f"Not available offline: {method} {url}")
+            return send(method, url, **kwargs)
+        ttl, kind = rule
+
+        key = self._key(method, url, kwargs.get("data"))
+        row = self._get(key)
+        if row is not None and (self.offline or time.time() - row[5] < ttl):
+            self._touch(key)
+            return self._to_response(row)
+        if self.offline:
+            raise OfflineError(f"Not available offline: {method} {url}")
+
+        if row is not None:
+            headers = dict(kwargs.get("headers") or {})
+            if row[3]:
+                headers["If-None-Match"] = row[3]
+            if row[4]:
+                headers["If-Modified-Since"] = row[4]
+            kwargs["headers"] = headers
+
+        response = send(method, url, **kwargs)
+        if response.status_code == 304 and row is not None:
+            self._touch(key, revalidated=True)
+            return self._to_response(row)
+        if response.status_code == 200 and self._is_expected(kind, response):
+            self._put(key, response)
+        return response
+
+    def clear(self):
+        with self._lock:
+            db = self._connect()
+            if db is not None:
+                db.execute("DELETE FROM responses")
+                db.commit()
+
+
+# Global instance
+http_cache = HttpCache()
+
+
+class CachedSession(cffi_requests.Session):
+    """curl_cffi Session going through http_cache (see TTL_RULES)."""
+
+    def request(self, method, url, *args, **kwargs):
+        if args:
+            return super().request(method, url, *args, **kwargs)
+        return http_cache.request(super().request, method, url, **kwargs)
@@ -1,3 +1,7 @@
+import threading
+from typing import Callable
+
+
 class SearchResult:
     def __init__(self, title: str, url: str, img: str, genres: list[str]):
         self.title = title
@@ -160,15 +164,38 @@ class SamaSeries:
         return str(self)
 
 class ArkSeason:
+    """
+    ArkAnime season. Its episodes are either given, or fetched by loader on
+    first access of .episodes (which then raises whatever loader raises).
+    """
+
     def __init__(
-        self, id:str, title: str, episodes: list[Episode]
+        self,
+        id: str,
+        title: str,
+        episodes: list[Episode] = None,
+        loader: Callable[[], list[Episode]] = None,
     ):
         self.id = id
         self.title = title
-        self.episodes = episodes
+        self._episodes = episodes
+        self._loader = loader
+        self._lock = threading.Lock()
+
+    @property
+    def episodes(self) -> list[Episode]:
+        with self._lock:
+            if self._episodes is None:
+                self._episodes = self._loader() if self._loader else []
+            return self._episodes
+
+    @property
+    def loaded(self) -> bool:
+        return self._episodes is not None
 
     def __str__(self):
-        return f"ArkSeason(id='{self.id}', title='{self.title}', episodes={self.episodes})"
+        episodes = self._episodes if self.loaded else "<not loaded>"
+        return f"ArkSeason(id='{self.id}', title='{self.title}', episodes={episodes})"
 
     def __repr__(self):
         return str(self)
@@ -0,0 +1,166 @@
+import functools
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+from platformdirs import user_data_dir
+
+
+class OriginCache:
+    """
+    Website origins discovered from the portals (anime-sama, coflix...),
+    persisted so a new session can search right away.
+
+    An origin older than TTL is still used, and rediscovered in the
+    background. If a request against a cached origin fails, the scraper
+    rediscovers it on the spot (see rediscover_on_failure).
+    """
+
+    TTL = 12 * 3600
+
+    def __init__(self):
+        self.app_name = "AutoFlixCLI"
+        self.app_author = "PaulExplorer"
+        self.data_dir = Path(user_data_dir(self.app_name, self.app_author))
+        self.data_file = self.data_dir / "origins.json"
+        self._lock = threading.Lock()
+        self.data = None
+        self._verified = set()  # Providers whose origin is known good this session
+        self._discovering = {}  # provider -> Lock held while discovering its origin
+
+    def _load_data(self) -> dict:
+        """Load the origins from disk (once)."""
+        if self.data is None:
+            try:
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    self.data = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self.data = {}
+        return self.data
+
+    def _save_data(self):
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.data_file, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=4, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: Could not save website origins: {e}")
+
+    def put(self, provider: str, portal: str, origin: str):
+        with self._lock:
+            self._load_data()[provider] = {
+                "portal": portal,
+                "origin": origin,
+                "discovered_at": time.time(),
+            }
+            self._verified.add(provider)
+            self._save_data()
+
+    def resolve(
+        self,
+        provider: str,
+        portal: str,
+        discover: Callable[[str], str],
+        on_update: Callable[[str], None],
+    ) -> str:
+        """
+        Origin of a provider, discovered from its portal only when unknown.
+        Concurrent callers (resume prefetch and resume) share one discovery.
+
+        Args:
+            provider: Provider key (portals key)
+            portal: Portal URL the origin is discovered from
+            discover: discover(portal) -> origin, performs the requests
+            on_update: Called with the new origin when a background
+                revalidation finds that it moved
+
+        Returns:
+            The origin
+        """
+        with self._lock:
+            entry = self._load_data().get(provider)
+            discovering = self._discovering.setdefault(provider, threading.Lock())
+        if not entry or entry["portal"] != portal:
+            with discovering:
+                with self._lock:
+                    entry = self._load_data().get(provider)
+                if not entry or entry["portal"] != portal:
+                    origin = discover(portal)
+                    self.put(provider, portal, origin)
+                    return origin
+
+        if time.time() - entry["discovered_at"] > self.TTL:
+            threading.Thread(
+                target=self._revalidate,
+                args=(provider, portal, entry["origin"], discover, on_update),
+                name="autoflix-origin-refresh",
+                daemon=True,
+            ).start()
+        return entry["origin"]
+
+    def _revalidate(self, provider, portal, origin, discover, on_update):
+        try:
+            new_origin = discover(portal)
+        except Exception:
+            return  # Portal unreachable: keep the cached origin
+        self.put(provider, portal, new_origin)
+        if new_origin != origin:
+            on_update(new_origin)
+
+    def rediscover_on_failure(
+        self,
+        provider: str,
+        rediscover: Callable[[], None],
+        origin: Callable[[], str] = None,
+    ):
+        """
+        Decorator for the scraper functions requesting pages of its origin
+        (search, series and season pages...): if one fails while the origin
+        came from the cache and has not worked yet this session, rediscover
+        the origin and try once more.
+
+        Args:
+            provider: Provider key (portals key)
+            rediscover: Looks the origin up again from the portal
+            origin: Returns the scraper's current origin, for functions
+                taking page URLs: URLs on the origin that failed are moved
+                to the rediscovered one for the second try
+        """
+
+        def rebase(value, old, new):
+            if isinstance(value, str) and old and value.startswith(old):
+                return new + value[len(old) :]
+            return value
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                old = origin().rstrip("/") if origin else None
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    if provider in self._verified:
+                        raise
+                    rediscover()
+                    if old:
+                        new = origin().rstrip("/")
+                        args = [rebase(a, old, new) for a in args]
+                        kwargs = {k: rebase(v, old, new) for k, v in kwargs.items()}
+                    result = func(*args, **kwargs)
+                self._verified.add(provider)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, provider: str):
+        with self._lock:
+            if self._load_data().pop(provider, None) is not None:
+                self._save_data()
+            self._verified.discard(provider)
+
+
+# Global instance
+origin_cache = OriginCache()
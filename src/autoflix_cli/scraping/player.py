@@ -1,40 +1,117 @@
+import inspect
 from autoflix_cli.scraping import arkanime
-from curl_cffi import requests
-from .deobfuscate import deobfuscate
+from curl_cffi.requests import AsyncSession
+from .deobfuscate import deobfuscate, deobfuscate_fast
+from .player_index import PlayerIndex
+from .extractors import (
+    Deadline,
+    DeadlineExceeded,
+    ExtractionContext,
+    Extractor,
+    Fetch,
+    register_extractor,
+    get_extractor,
+)
+from .engine import ExtractionEngine
+from .hop_memo import hop_memo
 from bs4 import BeautifulSoup
-from ..proxy import DNS_OPTIONS
+from ..network import DNS_OPTIONS
 from ..config_loader import load_remote_jsonc
 from ..defaults import DEFAULT_PLAYERS, DEFAULT_NEW_URL, DEFAULT_KAKAFLIX_PLAYERS
+from ..strategy_cache import strategy_cache
 import re, base64
 
 import json
+import threading
 import binascii
+from urllib.parse import urlparse
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import unpad
 
-scraper = requests.Session(curl_options=DNS_OPTIONS)
+# Every extractor request runs on this engine: one AsyncSession on a
+# background event loop, shared by concurrent resolutions
+engine = ExtractionEngine(lambda: AsyncSession(curl_options=DNS_OPTIONS))
+
+# Seconds allowed for a whole resolution (every hop included) by default
+RESOLUTION_TIMEOUT = 30
+
+
+# Compiled lookups over the configs below: id(config) -> (config, PlayerIndex)
+_indexes = {}
+_config_lock = threading.Lock()
+
+
+def _swap_config(name: str, indexed: bool = True):
+    """
+    on_update callback of the remote config held in the module global name:
+    the new version and its index, built beforehand, replace the old ones
+    under _config_lock. The old dict is left untouched for lookups still
+    running on it.
+    """
+
+    def swap(config: dict):
+        index = PlayerIndex(config) if indexed else None
+        with _config_lock:
+            _indexes.pop(id(globals().get(name)), None)
+            if index is not None:
+                _indexes[id(config)] = (config, index)
+            globals()[name] = config
+
+    return swap
+
 
+# Remote configs are served from their last downloaded copy and refreshed
+# in the background (see load_remote_jsonc)
 
 # Player mapping: domain name -> parser type
 # Player mapping and configuration
 players = load_remote_jsonc(
     "https://raw.githubusercontent.com/PaulExplorer/AutoFlix-CLI/refs/heads/main/data/players_info.jsonc",
     DEFAULT_PLAYERS,
+    on_update=_swap_config("players"),
 )
 
 # URL replacements for compatibility
 new_url = load_remote_jsonc(
     "https://raw.githubusercontent.com/PaulExplorer/AutoFlix-CLI/refs/heads/main/data/new_url.jsonc",
     DEFAULT_NEW_URL,
+    on_update=_swap_config("new_url", indexed=False),
 )
 
 # kakaflix supported players
 kakaflix_players = load_remote_jsonc(
     "https://raw.githubusercontent.com/PaulExplorer/AutoFlix-CLI/refs/heads/main/data/kakaflix_players.jsonc",
     DEFAULT_KAKAFLIX_PLAYERS,
+    on_update=_swap_config("kakaflix_players"),
 )
 
-actual_player_config = None
+
+def _get_index(config: dict) -> PlayerIndex:
+    with _config_lock:
+        cached = _indexes.get(id(config))
+    if cached is None or len(cached[1].names) != len(config):
+        # Keep a reference to the config so its id() cannot be reused
+        cached = (config, PlayerIndex(config))
+        with _config_lock:
+            _indexes[id(config)] = cached
+    return cached[1]
+
+
+def find_player(url: str) -> tuple[str | None, dict | None]:
+    """
+    Find the players_info entry matching a player URL.
+
+    Args:
+        url: Player URL
+
+    Returns:
+        (player_name, config), or (None, None) if the host is unknown.
+    """
+    config = players  # Same version for the lookup and the entry
+    name = _get_index(config).find(url)
+    if name is None:
+        return None, None
+    return name, config[name]
 
 
 def extract_hls_url(unpacked_code):
@@ -56,19 +133,30 @@ def extract_hls_url(unpacked_code):
     return None
 
 
-def get_hls_link_default(url: str, headers: dict) -> str:
+# The get_hls_link_* extractors below perform no I/O themselves: they yield
+# Fetch requests and get the responses back from the engine.
+
+
+def get_hls_link_default(url: str, headers: dict, player_config: dict = None) -> str:
     """
     Extract HLS link from default player.
     """
-    global actual_player_config
+    player_config = player_config or {}
 
-    if actual_player_config.get("m3u8-extractor"):
-        if actual_player_config.get("m3u8-extractor").get("no-header"):
+    if player_config.get("m3u8-extractor"):
+        if player_config.get("m3u8-extractor").get("no-header"):
             headers = {}
 
-    response = scraper.get(url, headers=headers, impersonate="chrome")
+    response = yield Fetch("GET", url, headers=headers)
     response.raise_for_status()
 
+    # Unpacking the packer blocks is enough for the link regexes; a full
+    # beautify of the page is only needed for unusual packings.
+    code = deobfuscate_fast(response.text)
+    link = extract_hls_url(code)
+    if link:
+        return link
+
     code = deobfuscate(response.text)
 
     code.replace("cdn-tnmr", "tnmr") # this is for lulustream
@@ -112,7 +200,7 @@ def get_hls_link_embed4me(embed_url: str) -> str:
 
     headers = {"Referer": url_root}
 
-    r = scraper.get(api_url, headers=headers, impersonate="chrome", timeout=10)
+    r = yield Fetch("GET", api_url, headers=headers, timeout=10)
     r.raise_for_status()
 
     hex_data = r.text.strip()
@@ -137,10 +225,10 @@ def get_hls_link_uqload(url: str, headers: dict) -> str:
     Returns:
         HLS stream URL
     """
-    response = scraper.get(
+    response = yield Fetch(
+        "GET",
         url.replace("embed-", ""),
         headers={**headers, "Referer": "https://uqload.is/"},
-        impersonate="chrome",
     )
     response.raise_for_status()
 
@@ -159,7 +247,7 @@ def get_hls_link_sendvid(url: str) -> str:
     Returns:
         Video URL
     """
-    response = scraper.get(url, impersonate="chrome")
+    response = yield Fetch("GET", url)
     response.raise_for_status()
 
     soup = BeautifulSoup(response.text, "html.parser")
@@ -179,7 +267,7 @@ def get_hls_link_sibnet(url: str) -> str:
     Returns:
         Video URL
     """
-    response = scraper.get(url, impersonate="chrome")
+    response = yield Fetch("GET", url)
     response.raise_for_status()
 
     relative_path = response.text.split('player.src([{src: "')[1].split('"')[0]
@@ -197,7 +285,7 @@ def get_hls_link_filemoon(url: str, headers: dict) -> str:
         url: Player URL
 
     Returns:
-        HLS stream URL
+        HLS stream URL, or None if the playback payload could not be decrypted
     """
 
     def decode_base64(text):
@@ -207,70 +295,76 @@ def get_hls_link_filemoon(url: str, headers: dict) -> str:
         # Add padding if necessary and decode
         return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
 
-    def try_decrypt(key, iv, full_payload):
-        """Tries to decrypt the payload using two common GCM tag positions."""
-
-        # Combination 1: Authentication Tag at the end (Standard AES-GCM)
-        try:
-            ciphertext = full_payload[:-16]
-            tag = full_payload[-16:]
-            cipher = AES.new(key, AES.MODE_GCM, nonce=iv)
-            return cipher.decrypt_and_verify(ciphertext, tag).decode("utf-8")
-        except Exception:
-            pass
-
-        # Combination 2: Authentication Tag at the beginning
+    def try_decrypt(key, iv, full_payload, tag_at_end):
+        """Tries to decrypt the payload with the GCM tag at one position."""
+        if tag_at_end:
+            # Authentication Tag at the end (Standard AES-GCM)
+            ciphertext, tag = full_payload[:-16], full_payload[-16:]
+        else:
+            # Authentication Tag at the beginning
+            tag, ciphertext = full_payload[:16], full_payload[16:]
         try:
-            tag = full_payload[:16]
-            ciphertext = full_payload[16:]
             cipher = AES.new(key, AES.MODE_GCM, nonce=iv)
             return cipher.decrypt_and_verify(ciphertext, tag).decode("utf-8")
         except Exception:
-            pass
-
-        return None
+            return None
 
-    def solve_decryption(json_str):
-        """Parses the JSON and attempts multiple key combinations for decryption."""
+    def solve_decryption(json_str, host):
+        """
+        Parses the JSON and attempts multiple key combinations for decryption,
+        starting with the one that worked last time for this host.
+        """
         data = json.loads(json_str)
         playback = data.get("playback", {})
 
-        # 1. Prepare potential keys
         key_parts = playback.get("key_parts", [])
         decrypt_keys = playback.get("decrypt_keys", {})
 
-        potential_keys = []
+        # 1. Prepare potential keys: name -> encoded parts to concatenate
+        layouts = {}
+        encoded = {}
 
         # Hypothesis A: Concatenate key_parts[0] + key_parts[1]
         if len(key_parts) >= 2:
-            part0 = decode_base64(key_parts[0])
-            part1 = decode_base64(key_parts[1])
-            potential_keys.append(part0 + part1)
-            potential_keys.append(part1 + part0)
+            encoded["p0"], encoded["p1"] = key_parts[0], key_parts[1]
+            layouts["parts"] = ("p0", "p1")
+            layouts["parts_reversed"] = ("p1", "p0")
 
         # Hypothesis B: Concatenate edge_1 + edge_2 (16 + 16 = 32 bytes for AES-256)
         if "edge_1" in decrypt_keys and "edge_2" in decrypt_keys:
-            edge1 = decode_base64(decrypt_keys["edge_1"])
-            edge2 = decode_base64(decrypt_keys["edge_2"])
-            potential_keys.append(edge1 + edge2)
+            encoded["e1"], encoded["e2"] = decrypt_keys["edge_1"], decrypt_keys["edge_2"]
+            layouts["edges"] = ("e1", "e2")
+
+        decoded = {}
+
+        def build_key(name):
+            """Decode each part at most once, only when a key needs it."""
+            for part in layouts[name]:
+                if part not in decoded:
+                    decoded[part] = decode_base64(encoded[part])
+            return b"".join(decoded[part] for part in layouts[name])
 
         # 2. Prepare data
         iv = decode_base64(playback.get("iv"))
         payload = decode_base64(playback.get("payload"))
 
-        # 3. Test all key combinations
-        for i, key in enumerate(potential_keys):
-            result = try_decrypt(key, iv, payload)
+        # 3. Test all key combinations, remembered strategy first
+        strategies = [
+            [name, tag_at_end] for name in layouts for tag_at_end in (True, False)
+        ]
+        for name, tag_at_end in strategy_cache.order("filemoon", host, strategies):
+            result = try_decrypt(build_key(name), iv, payload, tag_at_end)
             if result:
+                strategy_cache.put("filemoon", host, [name, tag_at_end])
                 return result
 
         print("Error: No valid decryption found.")
         return None
 
     code = url.split("/")[-1]
-    response = scraper.get(
+    response = yield Fetch(
+        "GET",
         "https://9n8o.com/api/videos/" + code + "/embed/playback",
-        impersonate="chrome",
         headers={
             "Referer": "https://9n8o.com/g1x/" + code + "/",
             "X-Embed-Origin": headers["Referer"]
@@ -282,13 +376,12 @@ def get_hls_link_filemoon(url: str, headers: dict) -> str:
     )
     response.raise_for_status()
 
-    decrypted_json_str = solve_decryption(response.text)
+    decrypted_json_str = solve_decryption(response.text, urlparse(url).netloc)
     if decrypted_json_str:
         video_data = json.loads(decrypted_json_str)
         video_url = video_data["sources"][0]["url"]
         return video_url
-    else:
-        return get_hls_link(url, headers)
+    return None
 
 
 def get_hls_link_vidoza(url: str, headers: dict) -> str:
@@ -303,11 +396,7 @@ def get_hls_link_vidoza(url: str, headers: dict) -> str:
         HLS stream URL
     """
 
-    response = scraper.get(
-        url,
-        headers=headers,
-        impersonate="chrome",
-    )
+    response = yield Fetch("GET", url, headers=headers)
     response.raise_for_status()
 
     soup = BeautifulSoup(response.text, "html.parser")
@@ -317,32 +406,26 @@ def get_hls_link_vidoza(url: str, headers: dict) -> str:
     return link
 
 
-def get_hls_link_kakaflix(url: str, headers: dict) -> str:
+def get_kakaflix_embed(url: str, headers: dict) -> str:
     """
-    Extract HLS link from kakaflix players.
+    Find the player embedded by a kakaflix page.
 
     Args:
         url: Player URL
         headers: HTTP headers for the request
 
     Returns:
-        HLS stream URL
+        URL of the embedded player (iframe, or the page after redirects)
     """
-    response = scraper.get(
-        url,
-        headers=headers,
-        impersonate="chrome",
-    )
+    response = yield Fetch("GET", url, headers=headers)
     response.raise_for_status()
 
     soup = BeautifulSoup(response.text, "html.parser")
 
     try:
-        link: str = soup.find("iframe").attrs["src"]
-    except:
-        return get_hls_link(response.url, headers)
-    else:
-        return get_hls_link(link, headers)
+        return soup.find("iframe").attrs["src"]
+    except Exception:
+        return response.url
 
 
 def get_hls_link_myvidplay(url: str, headers: dict) -> str:
@@ -356,11 +439,7 @@ def get_hls_link_myvidplay(url: str, headers: dict) -> str:
     Returns:
         HLS stream URL
     """
-    response = scraper.get(
-        url,
-        headers=headers,
-        impersonate="chrome",
-    )
+    response = yield Fetch("GET", url, headers=headers)
     response.raise_for_status()
 
     link = response.text.split("vtt: '")[1].split("'")[0]
@@ -389,11 +468,7 @@ def get_hls_link_vidmoly(url: str, headers: dict) -> str:
     if "Referer" in final_headers and not final_headers["Referer"]:
         del final_headers["Referer"]
 
-    response = scraper.get(
-        url,
-        headers=final_headers,
-        impersonate="chrome",
-    )
+    response = yield Fetch("GET", url, headers=final_headers)
     response.raise_for_status()
 
     return extract_hls_url(response.text)
@@ -422,7 +497,7 @@ def get_hls_link_veev(url):
 
     # 2. Fetch HTML
     try:
-        html = scraper.get(f"https://veev.to/e/{media_id}", impersonate="chrome").text
+        html = (yield Fetch("GET", f"https://veev.to/e/{media_id}")).text
     except Exception as e:
         print(f"Connection error: {e}")
         return None
@@ -479,8 +554,12 @@ def get_hls_link_veev(url):
             text = text.replace("dXRmOA==", "")  # Remove salt
         return text
 
-    # 4. Main loop
-    for f in reversed(found_values):
+    # 4. Main loop: candidates from the last one, starting with the position
+    # that worked last time (each try costs an API round trip)
+    host = urlparse(url).netloc
+    positions = strategy_cache.order("veev", host, list(range(len(found_values))))
+    for position in positions:
+        f = found_values[-1 - position]
         ch = veev_decode(f)
         if ch == f:
             continue  # If decoding didn't change anything, skip
@@ -488,8 +567,8 @@ def get_hls_link_veev(url):
         # API call to get JSON
         dl_url = f"https://veev.to/dl?op=player_api&cmd=gi&file_code={media_id}&r=https://veev.to&ch={ch}&ie=1"
         try:
-            resp = scraper.get(dl_url, impersonate="chrome").json()
-        except:
+            resp = (yield Fetch("GET", dl_url)).json()
+        except Exception:
             continue
 
         file_obj = resp.get("file")
@@ -514,6 +593,7 @@ def get_hls_link_veev(url):
         rules = parse_rules(ch)  # Rules come from 'ch'
         final_link = decode_final(step1, rules)
 
+        strategy_cache.put("veev", host, position)
         return final_link
 
     return None
@@ -527,19 +607,19 @@ def get_hls_link_xtremestream(url, headers):
 
 def get_hls_link_montmyoboky(url, headers):
     if "movie" in url:
-        response = scraper.post(url=arkanime.website_origin + "/api/watch/movie-token", data={
+        response = yield Fetch("POST", arkanime.website_origin + "/api/watch/movie-token", data={
             "movieId": url.split(":")[1]
         }, headers=headers)
         response.raise_for_status()
     else:
-        response = scraper.post(url=arkanime.website_origin + "/api/watch/token", data={
+        response = yield Fetch("POST", arkanime.website_origin + "/api/watch/token", data={
             "episodeId": url.split(":")[1]
         }, headers=headers)
         response.raise_for_status()
 
     content_data = response.json()
 
-    response_player = scraper.get(f'{arkanime.website_origin}/api/source/resolve?token={content_data["token"]}', headers=headers)
+    response_player = yield Fetch("GET", f'{arkanime.website_origin}/api/source/resolve?token={content_data["token"]}', headers=headers)
     response_player.raise_for_status()
 
     player_data = response_player.json()
@@ -548,65 +628,211 @@ def get_hls_link_montmyoboky(url, headers):
 
     return player_data["videoUrl"], subtitle_url
 
-def get_hls_link(url: str, headers: dict = {}, return_subs: bool = False) -> str | tuple[str | None, str | None] | None:
+@register_extractor("default")
+class DefaultExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_default(ctx.url, ctx.headers, ctx.config))
+
+
+@register_extractor("sendvid")
+class SendvidExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_sendvid(ctx.url))
+
+
+@register_extractor("sibnet")
+class SibnetExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_sibnet(ctx.url))
+
+
+@register_extractor("uqload")
+class UqloadExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_uqload(ctx.url, ctx.headers))
+
+
+@register_extractor("vidoza")
+class VidozaExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_vidoza(ctx.url, ctx.headers))
+
+
+@register_extractor("filemoon")
+class FilemoonExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        stream_url = yield from get_hls_link_filemoon(ctx.url, ctx.headers)
+        if stream_url:
+            return stream_url
+        # Older filemoon embeds still ship a packed player script
+        return (yield from follow_hop(ctx, ctx.url, {**ctx.config, "type": "default"}))
+
+
+@register_extractor("kakaflix")
+class KakaflixExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        embed_url = yield from get_kakaflix_embed(ctx.url, ctx.headers)
+        _, config = find_player(embed_url)
+        if config is None:
+            return None
+        return (yield from follow_hop(ctx, embed_url, config))
+
+
+@register_extractor("myvidplay")
+class MyvidplayExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_myvidplay(ctx.url, ctx.headers))
+
+
+@register_extractor("vidmoly")
+class VidmolyExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_vidmoly(ctx.url, ctx.headers))
+
+
+@register_extractor("embed4me")
+class Embed4meExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_embed4me(ctx.url))
+
+
+@register_extractor("veev")
+class VeevExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_veev(ctx.url))
+
+
+@register_extractor("xtremestream")
+class XtremestreamExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return get_hls_link_xtremestream(ctx.url, ctx.headers)
+
+
+@register_extractor("montmyoboky")
+class MontmyobokyExtractor(Extractor):
+    def steps(self, ctx: ExtractionContext):
+        return (yield from get_hls_link_montmyoboky(ctx.url, ctx.headers))
+
+
+def _run_extractor(ctx: ExtractionContext):
+    extractor = get_extractor(ctx.config.get("type"))
+    if extractor is None:
+        return None, None
+
+    result = extractor.steps(ctx)
+    if inspect.isgenerator(result):
+        result = yield from result
+    if isinstance(result, tuple):
+        return result
+    return result, None
+
+
+def resolve_steps(ctx: ExtractionContext, remembered: bool = False):
+    """
+    Run the extractor registered for ctx.config["type"].
+
+    A hop this page led to recently (see follow_hop) is taken directly; if
+    it no longer works the page is resolved again from scratch. Every page
+    is added to the trace of the deadline (Deadline.visit).
+
+    Generator yielding Fetch requests, to be driven by the engine.
+
+    Args:
+        ctx: Extraction context of the player URL
+        remembered: The page was reached through a HopMemo shortcut
+
+    Returns:
+        (stream_url, subtitle_url), (None, None) if the type has no extractor.
+
+    Raises:
+        DeadlineExceeded: If the context deadline has passed
+    """
+    ctx.remaining()
+    type_name = ctx.config.get("type")
+    if ctx.deadline is not None:
+        ctx.deadline.visit(ctx.url, type_name, remembered)
+    known_hop = hop_memo.get(ctx.url, type_name)
+    if known_hop is not None:
+        next_url, next_config = known_hop
+        try:
+            result = yield from resolve_steps(
+                ctx.replace(url=next_url, config=next_config), remembered=True
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception:
+            result = None, None
+        if result[0]:
+            return result
+        hop_memo.forget(ctx.url, type_name)
+
+    return (yield from _run_extractor(ctx))
+
+
+def follow_hop(ctx: ExtractionContext, next_url: str, next_config: dict):
+    """
+    Continue a resolution on another page (or another extractor), and
+    remember the hop for a while if it leads to a stream.
+
+    Generator, to be used with ``yield from`` inside an extractor.
+
+    Returns:
+        (stream_url, subtitle_url)
+    """
+    result = yield from resolve_steps(ctx.replace(url=next_url, config=next_config))
+    if result[0]:
+        hop_memo.put(ctx.url, ctx.config.get("type"), next_url, next_config)
+    return result
+
+
+def _make_context(url: str, headers: dict, deadline: Deadline) -> ExtractionContext:
+    """Extraction context of a player URL, or None if the host is unknown."""
+    _, config = find_player(url)
+    if config is None:
+        return None
+    return ExtractionContext(
+        url=url,
+        headers=dict(headers or {}),
+        config=config,
+        deadline=deadline or Deadline(RESOLUTION_TIMEOUT),
+    )
+
+
+def get_hls_link(
+    url: str,
+    headers: dict = {},
+    return_subs: bool = False,
+    deadline: Deadline = None,
+) -> str | tuple[str | None, str | None] | None:
     """
     Extract HLS/video link from a player URL.
-    Automatically detects the player type and uses the appropriate parser.
+    Automatically detects the player type and uses the registered extractor.
 
     Args:
         url: Player URL
         headers: HTTP headers for the request (default: {})
         return_subs: Whether to also return the subtitle URL if available
+        deadline: Budget of the whole resolution, every hop included
+            (default: RESOLUTION_TIMEOUT seconds). Cancelling it aborts the
+            request in flight.
 
     Returns:
         HLS/video stream URL if successful, None otherwise. If return_subs is True, returns (stream_url, subtitle_url).
+
+    Raises:
+        DeadlineExceeded: If the budget is spent or the deadline cancelled;
+            the message names the slowest hop
     """
-    global actual_player_config
+    stream_url, subtitle_url = None, None
 
     # Find matching player and parse accordingly
-    for player_name, config in players.items():
-        if player_name in url.lower():
-            actual_player_config = config
-            parse_type = config["type"]
-
-            stream_url = None
-            subtitle_url = None
-
-            if parse_type == "default":
-                stream_url = get_hls_link_default(url, headers)
-            elif parse_type == "sendvid":
-                stream_url = get_hls_link_sendvid(url)
-            elif parse_type == "sibnet":
-                stream_url = get_hls_link_sibnet(url)
-            elif parse_type == "uqload":
-                stream_url = get_hls_link_uqload(url, headers)
-            elif parse_type == "vidoza":
-                stream_url = get_hls_link_vidoza(url, headers)
-            elif parse_type == "filemoon":
-                stream_url = get_hls_link_filemoon(url, headers)
-            elif parse_type == "kakaflix":
-                stream_url = get_hls_link_kakaflix(url, headers)
-            elif parse_type == "myvidplay":
-                stream_url = get_hls_link_myvidplay(url, headers)
-            elif parse_type == "vidmoly":
-                stream_url = get_hls_link_vidmoly(url, headers)
-            elif parse_type == "embed4me":
-                stream_url = get_hls_link_embed4me(url)
-            elif parse_type == "veev":
-                stream_url = get_hls_link_veev(url)
-            elif parse_type == "xtremestream":
-                stream_url = get_hls_link_xtremestream(url, headers)
-            elif parse_type == "montmyoboky":
-                stream_url, subtitle_url = get_hls_link_montmyoboky(url, headers)
-
-            if return_subs:
-                return stream_url, subtitle_url
-            return stream_url
+    ctx = _make_context(url, headers, deadline)
+    if ctx is not None:
+        stream_url, subtitle_url = engine.run_steps(resolve_steps(ctx), ctx.deadline)
 
-    actual_player_config = None
     if return_subs:
-        return None, None
-    return None
+        return stream_url, subtitle_url
+    return stream_url
 
 
 def is_supported(url: str) -> bool:
@@ -619,14 +845,10 @@ def is_supported(url: str) -> bool:
     Returns:
         True if the player is supported, False otherwise
     """
-    for player in players.keys():
-        if "kakaflix" in url.lower():
-            for player in kakaflix_players.keys():
-                if player in url.lower():
-                    return True
-            return False
+    if not players:
+        return False
 
-        elif player in url.lower():
-            return True
+    if "kakaflix" in url.lower():
+        return _get_index(kakaflix_players).find(url) is not None
 
-    return False
+    return _get_index(players).find(url) is not None
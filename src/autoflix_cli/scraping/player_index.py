@@ -0,0 +1,68 @@
+class PlayerIndex:
+    """
+    Aho-Corasick automaton over the player names of a players config.
+
+    Reproduces the historical ``player_name in url.lower()`` scan over the
+    config dict (first key in dict order wins) in a single O(len(url)) pass,
+    whatever the number of configured players.
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        # Per-node transitions, failure link and best (lowest) pattern priority
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [None]
+
+        for priority, name in enumerate(self.names):
+            node = 0
+            for char in name.lower():
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._best.append(None)
+                node = nxt
+            if self._best[node] is None or priority < self._best[node]:
+                self._best[node] = priority
+
+        # Breadth-first pass: failure links, and propagate the best match
+        # reachable through them so lookups never follow output chains.
+        queue = list(self._goto[0].values())
+        while queue:
+            node = queue.pop(0)
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (
+                    self._best[child] is None or inherited < self._best[child]
+                ):
+                    self._best[child] = inherited
+
+    def find(self, text: str):
+        """
+        Return the first player name (in config order) contained in text,
+        or None if no player matches.
+        """
+        goto = self._goto
+        fail = self._fail
+        best_of = self._best
+        best = None
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            priority = best_of[node]
+            if priority is not None and (best is None or priority < best):
+                best = priority
+                if best == 0:
+                    break
+        return None if best is None else self.names[best]
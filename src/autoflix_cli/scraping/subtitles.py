@@ -2,7 +2,7 @@ from curl_cffi import requests
 import random
 import re
 
-from .config import portals
+from . import config
 
 
 class SubtitleExtractor:
@@ -50,7 +50,7 @@ class SubtitleExtractor:
         language/options prefix in the URL (without it the route 404s), so the
         user's preferred language is baked in first (English always kept).
         """
-        base_url = portals.get(
+        base_url = config.portals.get(
             "opensubtitles-homes", "https://opensubtitles.stremio.homes"
         )
         lang = lang_filter if (lang_filter and len(lang_filter) == 2) else None
@@ -124,7 +124,7 @@ class SubtitleExtractor:
         AnimeTosho indexes releases by AniDB ID and exposes the embedded
         subtitles of each file as direct download links (``.xz`` compressed).
         """
-        base = portals.get("animetosho", "https://feed.animetosho.xyz")
+        base = config.portals.get("animetosho", "https://feed.animetosho.xyz")
         try:
             r = requests.get(
                 f"{base}/json?t=search&aid={anidb_id}&max=50",
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+from rich.table import Table
+from .cli_utils import console, print_info, print_error
+
+
+def measure_imports(module: str = "autoflix_cli.main") -> list[tuple[str, int, int]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        [(module_name, self_us, cumulative_us)] in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def print_startup_profile(limit: int = 20):
+    """Print what importing the CLI costs, grouped by top-level package."""
+    try:
+        entries = measure_imports()
+    except (OSError, RuntimeError) as e:
+        print_error(f"Could not profile startup: {e}")
+        return
+
+    packages = {}
+    for name, self_us, _ in entries:
+        package = name.split(".")[0]
+        count, total = packages.get(package, (0, 0))
+        packages[package] = (count + 1, total + self_us)
+    total_us = sum(total for _, total in packages.values())
+
+    table = Table(title="Startup import cost (reaching the home menu)")
+    table.add_column("Package", style="cyan")
+    table.add_column("Modules", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Share", justify="right")
+    ranked = sorted(packages.items(), key=lambda item: item[1][1], reverse=True)
+    for package, (count, package_us) in ranked[:limit]:
+        table.add_row(
+            package,
+            str(count),
+            f"{package_us / 1000:.1f} ms",
+            f"{package_us / total_us:.0%}",
+        )
+    console.print(table)
+
+    slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)[:limit]
+    table = Table(title="Slowest modules (own time, children excluded)")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self", justify="right")
+    table.add_column("Cumulative", justify="right")
+    for name, self_us, cumulative_us in slowest:
+        table.add_row(name, f"{self_us / 1000:.1f} ms", f"{cumulative_us / 1000:.1f} ms")
+    console.print(table)
+
+    print_info(
+        f"{len(entries)} modules imported in {total_us / 1000:.0f} ms "
+        "(fresh interpreter, python -X importtime)"
+    )
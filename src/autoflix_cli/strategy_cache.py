@@ -0,0 +1,72 @@
+import json
+import threading
+from pathlib import Path
+from platformdirs import user_data_dir
+
+
+class StrategyCache:
+    """
+    Remember, per extractor and host, which decryption strategy or candidate
+    worked last time, so brute-forcing extractors (filemoon keys, veev
+    tokens) try it first on the next run.
+    """
+
+    def __init__(self):
+        self.app_name = "AutoFlixCLI"
+        self.app_author = "PaulExplorer"
+        self.data_dir = Path(user_data_dir(self.app_name, self.app_author))
+        self.data_file = self.data_dir / "strategies.json"
+        self._lock = threading.Lock()
+        self.data = None
+
+    def _load_data(self) -> dict:
+        """Load the strategies from disk (once)."""
+        if self.data is None:
+            try:
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    self.data = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self.data = {}
+        return self.data
+
+    def _save_data(self):
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.data_file, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=4, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: Could not save extraction strategies: {e}")
+
+    def get(self, extractor: str, host: str):
+        """Return the strategy that last worked for this extractor/host."""
+        with self._lock:
+            return self._load_data().get(extractor, {}).get(host)
+
+    def put(self, extractor: str, host: str, strategy):
+        """Record the strategy that just worked (saved only if it changed)."""
+        with self._lock:
+            hosts = self._load_data().setdefault(extractor, {})
+            if hosts.get(host) != strategy:
+                hosts[host] = strategy
+                self._save_data()
+
+    def order(self, extractor: str, host: str, candidates: list) -> list:
+        """
+        Reorder candidates so that the remembered one comes first.
+
+        Args:
+            extractor: Extractor name
+            host: Host the strategy applies to
+            candidates: Strategies in their default trial order (JSON values)
+
+        Returns:
+            A new list, same elements.
+        """
+        known = self.get(extractor, host)
+        if known in candidates:
+            return [known] + [c for c in candidates if c != known]
+        return list(candidates)
+
+
+# Global instance
+strategy_cache = StrategyCache()
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+from platformdirs import user_data_dir
+
+
+class StreamCache:
+    """
+    Disk-backed cache of resolved streams: (embed URL, headers) -> (stream URL,
+    subtitle URL). Signed CDN links carry their own expiry (expires=, e=,
+    exp=), which bounds how long an entry is reused; every hit is validated
+    with a cheap HEAD request before being handed to a player.
+    """
+
+    DEFAULT_TTL = 30 * 60  # Links without an expiry parameter
+    MAX_TTL = 12 * 3600
+    EXPIRY_MARGIN = 120  # Leave room to actually watch the episode
+    EXPIRY_PARAMS = ("expires", "expire", "exp", "e")
+
+    def __init__(self):
+        self.app_name = "AutoFlixCLI"
+        self.app_author = "PaulExplorer"
+        self.data_dir = Path(user_data_dir(self.app_name, self.app_author))
+        self.data_file = self.data_dir / "stream_cache.json"
+        self._lock = threading.Lock()
+        self.data = None
+
+    def _load_data(self) -> dict:
+        """Load the cache from disk (once)."""
+        if self.data is None:
+            try:
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    self.data = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self.data = {}
+        return self.data
+
+    def _save_data(self):
+        """Save the cache, dropping expired entries."""
+        now = time.time()
+        self.data = {k: v for k, v in self.data.items() if v["expires_at"] > now}
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.data_file, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=4, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: Could not save stream cache: {e}")
+
+    @staticmethod
+    def _key(url: str, headers: Optional[dict]) -> str:
+        raw = url + "|" + json.dumps(headers or {}, sort_keys=True)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def expiry_from_url(cls, stream_url: str) -> Optional[float]:
+        """
+        Read the expiry timestamp of a signed URL, if it has one.
+        Accepts Unix timestamps in seconds or milliseconds.
+        """
+        try:
+            query = parse_qs(urlparse(stream_url).query)
+        except ValueError:
+            return None
+        for param in cls.EXPIRY_PARAMS:
+            for value in query.get(param, []):
+                if not value.isdigit():
+                    continue
+                ts = int(value)
+                if ts > 1e12:  # milliseconds
+                    ts /= 1000
+                if ts > 1e9:  # plausible Unix timestamp
+                    return float(ts)
+        return None
+
+    def get(
+        self, url: str, headers: Optional[dict], probe_headers: Optional[dict] = None
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Return a cached (stream_url, subtitle_url) that is still valid.
+
+        Args:
+            url: Embed/player URL that was resolved
+            headers: Headers used for the resolution
+            probe_headers: Headers the CDN expects (Referer...) for validation
+        """
+        key = self._key(url, headers)
+        with self._lock:
+            entry = self._load_data().get(key)
+        if not entry or entry["expires_at"] <= time.time():
+            return None
+
+        if not self.is_alive(entry["stream_url"], probe_headers):
+            self.invalidate(url, headers)
+            return None
+        return entry["stream_url"], entry.get("subtitle_url")
+
+    def put(
+        self,
+        url: str,
+        headers: Optional[dict],
+        stream_url: str,
+        subtitle_url: Optional[str] = None,
+    ):
+        """Store a freshly resolved stream."""
+        now = time.time()
+        expires_at = self.expiry_from_url(stream_url)
+        if expires_at is None:
+            expires_at = now + self.DEFAULT_TTL
+        expires_at = min(expires_at - self.EXPIRY_MARGIN, now + self.MAX_TTL)
+        if expires_at <= now:
+            return
+
+        with self._lock:
+            self._load_data()[self._key(url, headers)] = {
+                "url": url,
+                "stream_url": stream_url,
+                "subtitle_url": subtitle_url,
+                "resolved_at": now,
+                "expires_at": expires_at,
+            }
+            self._save_data()
+
+    def invalidate(self, url: str, headers: Optional[dict]):
+        """Forget a stream (e.g. the player reported it dead)."""
+        with self._lock:
+            if self._load_data().pop(self._key(url, headers), None):
+                self._save_data()
+
+    @staticmethod
+    def is_alive(stream_url: str, headers: Optional[dict] = None) -> bool:
+        """Cheap validation: HEAD (or a 1-byte GET when HEAD is refused)."""
+        from curl_cffi import requests
+
+        try:
+            r = requests.head(
+                stream_url,
+                headers=headers,
+                impersonate="chrome",
+                timeout=4,
+                allow_redirects=True,
+            )
+            if r.status_code in (405, 501):
+                r = requests.get(
+                    stream_url,
+                    headers={**(headers or {}), "Range": "bytes=0-0"},
+                    impersonate="chrome",
+                    timeout=4,
+                )
+            return r.status_code < 400
+        except Exception:
+            return False
+
+
+# Global instance
+stream_cache = StreamCache()
@@ -0,0 +1,197 @@
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import m3u8
+from curl_cffi import requests
+
+PROBE_TIMEOUT = 8
+PROBE_BYTES = 1024 * 1024  # First MiB of the media is enough to rate the CDN
+MAX_PARALLEL_PROBES = 6
+
+
+class ProbeResult:
+    """Health of a stream as seen by a short download."""
+
+    def __init__(
+        self,
+        url: str,
+        ok: bool,
+        ttfb: float = None,
+        throughput: float = None,
+        kind: str = None,
+        error: str = None,
+    ):
+        self.url = url
+        self.ok = ok
+        self.ttfb = ttfb  # Seconds until the first media byte
+        self.throughput = throughput  # Bytes per second on the probed media
+        self.kind = kind  # "hls" or "file"
+        self.error = error
+
+    @property
+    def startup_time(self) -> float:
+        """Estimated seconds to get the first MiB of media (lower is better)."""
+        if not self.ok:
+            return float("inf")
+        return self.ttfb + PROBE_BYTES / max(self.throughput, 1)
+
+    def summary(self) -> str:
+        if not self.ok:
+            return f"dead ({self.error})" if self.error else "dead"
+        return f"{self.ttfb:.1f}s · {self.throughput / 1e6:.1f} MB/s"
+
+    def __str__(self):
+        return f"ProbeResult({self.url}, {self.summary()})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def _download(url: str, headers: Optional[dict], limit: int):
+    """
+    GET the first bytes of a URL.
+
+    Returns:
+        (status_code, first_bytes, ttfb, throughput)
+    """
+    start = time.perf_counter()
+    r = requests.get(
+        url,
+        headers=headers,
+        impersonate="chrome",
+        timeout=PROBE_TIMEOUT,
+        stream=True,
+        allow_redirects=True,
+    )
+    try:
+        if r.status_code >= 400:
+            return r.status_code, b"", None, None
+        data = bytearray()
+        ttfb = None
+        for chunk in r.iter_content():
+            if ttfb is None:
+                ttfb = time.perf_counter() - start
+                first_byte_at = time.perf_counter()
+            data += chunk
+            if len(data) >= limit:
+                break
+        if ttfb is None:
+            return r.status_code, b"", None, None
+        elapsed = max(time.perf_counter() - first_byte_at, 1e-3)
+        return r.status_code, bytes(data[:limit]), ttfb, len(data) / elapsed
+    finally:
+        r.close()
+
+
+def probe_stream(stream_url: str, headers: dict = None) -> ProbeResult:
+    """
+    Check that a stream actually delivers media and measure how fast.
+
+    HLS streams are probed through their playlist (best variant for a master
+    playlist) down to the first segment; anything else (MP4...) through its
+    first MiB.
+
+    Args:
+        stream_url: Resolved stream URL
+        headers: Headers the CDN expects (Referer...)
+
+    Returns:
+        A ProbeResult, never raises.
+    """
+    try:
+        status, data, ttfb, throughput = _download(stream_url, headers, PROBE_BYTES)
+        if not data:
+            return ProbeResult(stream_url, False, error=f"HTTP {status}")
+
+        if not data.lstrip().startswith(b"#EXTM3U"):
+            return ProbeResult(stream_url, True, ttfb, throughput, kind="file")
+
+        started = time.perf_counter() - ttfb
+        playlist_url = stream_url
+        playlist = m3u8.loads(data.decode("utf-8", "ignore"), uri=playlist_url)
+        if playlist.is_variant:
+            variant = max(
+                playlist.playlists,
+                key=lambda p: p.stream_info.bandwidth or 0,
+                default=None,
+            )
+            if variant is None:
+                return ProbeResult(stream_url, False, kind="hls", error="empty playlist")
+            playlist_url = urllib.parse.urljoin(playlist_url, variant.uri)
+            status, data, _, _ = _download(playlist_url, headers, PROBE_BYTES)
+            if not data:
+                return ProbeResult(
+                    stream_url, False, kind="hls", error=f"variant HTTP {status}"
+                )
+            playlist = m3u8.loads(data.decode("utf-8", "ignore"), uri=playlist_url)
+
+        if not playlist.segments:
+            return ProbeResult(stream_url, False, kind="hls", error="no segments")
+
+        segment_url = urllib.parse.urljoin(playlist_url, playlist.segments[0].uri)
+        status, data, _, throughput = _download(segment_url, headers, PROBE_BYTES)
+        if not data:
+            return ProbeResult(
+                stream_url, False, kind="hls", error=f"segment HTTP {status}"
+            )
+
+        # TTFB of an HLS stream: time until the first segment starts flowing
+        ttfb = time.perf_counter() - started - len(data) / throughput
+        return ProbeResult(stream_url, True, max(ttfb, 0), throughput, kind="hls")
+    except Exception as e:
+        return ProbeResult(stream_url, False, error=type(e).__name__)
+
+
+def probe_streams(candidates: list) -> list:
+    """
+    Probe several streams concurrently.
+
+    Args:
+        candidates: List of (stream_url, headers) tuples; None entries are
+            skipped (streams that cannot be probed, e.g. unresolved embeds)
+
+    Returns:
+        List of ProbeResult (or None), in the order of candidates.
+    """
+    jobs = [i for i, c in enumerate(candidates) if c]
+    results = [None] * len(candidates)
+    if not jobs:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PROBES, len(jobs))) as pool:
+        futures = {i: pool.submit(probe_stream, *candidates[i]) for i in jobs}
+        for i, future in futures.items():
+            results[i] = future.result()
+    return results
+
+
+def rank_key(result: Optional[ProbeResult]):
+    """Sort key: healthy streams by startup time, then unprobed, then dead."""
+    if result is None:
+        return (1, 0)
+    if not result.ok:
+        return (2, 0)
+    return (0, result.startup_time)
+
+
+def rank_streams(candidates: list) -> list:
+    """
+    Probe candidates and rank them best first.
+
+    Args:
+        candidates: List of (stream_url, headers) tuples (None = not probed)
+
+    Returns:
+        List of (candidate_index, ProbeResult or None), best first.
+    """
+    results = probe_streams(candidates)
+    order = sorted(range(len(candidates)), key=lambda i: rank_key(results[i]))
+    return [(i, results[i]) for i in order]
+
+
+if __name__ == "__main__":
+    import sys
+
+    for url in sys.argv[1:]:
+        print(probe_stream(url))
@@ -1,12 +1,24 @@
 import urllib.request
 import json
 import importlib.metadata
+import re
+import threading
+import time
+from pathlib import Path
+from platformdirs import user_data_dir
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
 console = Console()
 
+CHECK_INTERVAL = 24 * 3600  # PyPI is asked at most once a day
+CACHE_FILE = Path(user_data_dir("AutoFlixCLI", "PaulExplorer")) / "update_check.json"
+
+# Latest version known (from the cache or the background check)
+_latest_version = None
+_notice_shown = False
+
 
 def get_latest_version(package_name: str) -> str:
     """
@@ -21,22 +33,106 @@ def get_latest_version(package_name: str) -> str:
         return None
 
 
+# Pre-release tags, in release order (PEP 440 spellings)
+PRE_RELEASE_TAGS = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2}
+
+
+def parse_version(version: str) -> tuple:
+    """
+    Comparable form of a version string: "0.10.1" -> ((0, 10, 1), 2, 0, 0).
+
+    Trailing zero release numbers are ignored ("0.9" == "0.9.0"). Dev and
+    pre-releases ("1.0.0.dev1", "1.0.0rc1") sort before the release, post
+    releases ("1.0.0.post1") after it.
+    """
+    release = re.match(r"v?(\d+(?:\.\d+)*)", version or "")
+    if not release:
+        return ()
+    numbers = [int(part) for part in release.group(1).split(".")]
+    while len(numbers) > 1 and numbers[-1] == 0:
+        numbers.pop()
+
+    suffix = version[release.end() :].lower()
+    tag = re.match(r"[._-]?([a-z]*)[._-]?(\d*)", suffix)
+    name, number = tag.group(1), int(tag.group(2) or 0)
+    if not suffix:
+        phase, rank = 2, 0
+    elif name in ("post", "rev", "r"):
+        phase, rank = 3, 0
+    elif name == "dev":
+        phase, rank = 0, 0
+    else:
+        phase, rank = 1, PRE_RELEASE_TAGS.get(name, 0)
+    return tuple(numbers), phase, rank, number
+
+
+def _read_cache() -> dict:
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _refresh_latest_version(package_name: str):
+    """Ask PyPI for the latest version and cache the answer (background thread)."""
+    global _latest_version
+    latest_version = get_latest_version(package_name)
+    if latest_version:
+        _latest_version = latest_version
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            # A failed check is cached too: offline users are not retried
+            # on every launch
+            json.dump(
+                {"checked_at": time.time(), "latest_version": _latest_version}, f
+            )
+    except OSError:
+        pass
+
+
+def start_update_check(package_name: str = "autoflix-cli"):
+    """
+    Load the last known latest version, and refresh it in a background
+    thread if it was checked more than CHECK_INTERVAL ago. Never blocks.
+    """
+    global _latest_version
+    cache = _read_cache()
+    _latest_version = cache.get("latest_version")
+    if time.time() - cache.get("checked_at", 0) < CHECK_INTERVAL:
+        return
+    threading.Thread(
+        target=_refresh_latest_version,
+        args=(package_name,),
+        name="autoflix-update-check",
+        daemon=True,
+    ).start()
+
+
 def check_update(package_name: str = "autoflix-cli"):
     """
-    Check if a new version of the package is available and notify the user.
+    Notify the user if a newer version of the package is known.
+    Uses the result of start_update_check(): no network access here, and
+    the notice is shown once per session.
     """
+    global _notice_shown
+    if _notice_shown or not _latest_version:
+        return False
+
     try:
         current_version = importlib.metadata.version(package_name)
     except importlib.metadata.PackageNotFoundError:
         # Package not installed (e.g., dev mode), skip check
-        return
+        return False
 
     if not current_version:
-        return
+        return False
 
-    latest_version = get_latest_version(package_name)
+    latest_version = _latest_version
 
-    if latest_version and latest_version > current_version:
+    if parse_version(latest_version) > parse_version(current_version):
+        _notice_shown = True
         panel_content = Text()
         panel_content.append(
             f"\nExample: A new version of {package_name} is available!\n",